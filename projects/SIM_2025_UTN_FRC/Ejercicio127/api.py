@@ -0,0 +1,173 @@
+import json
+import random
+from dataclasses import dataclass, asdict, field
+from typing import Callable, Dict, Optional
+
+from simulador import SimuladorVectorial
+from distribuciones import AleatoriosGlobales, AleatoriosIndependientes, AleatoriosPorLotes
+from estado import EstadoSimulacion
+from filas import formatear_filas
+from modelo import ModeloConfig
+from politicas import POLITICAS, crear_politica
+
+# ============================
+# Configuración de una corrida
+# ============================
+
+@dataclass
+class ConfiguracionEjecucion:
+    """Parámetros de una corrida del simulador (equivalen a las opciones del menú)"""
+    modo_parada: str = 'iteraciones'     # 'tiempo' o 'iteraciones'
+    limite_horas: Optional[float] = None  # obligatorio en modo 'tiempo'
+    limite_iteraciones: Optional[int] = None  # obligatorio en modo 'iteraciones'
+    semilla: Optional[int] = None
+    generador: str = 'independiente'     # 'independiente', 'global' o 'lotes' (NumPy, opcional)
+    mostrar_primeras: int = 10           # filas iniciales que se retienen
+    exportar_csv: bool = False
+    exportar_columnar: bool = False      # tablas de eventos y equipos en .npz (requiere numpy)
+    modo_estado: str = 'en_sitio'        # 'en_sitio' o 'copia'
+    modelo: ModeloConfig = field(default_factory=ModeloConfig)   # parámetros del polideportivo
+    politica: str = 'referencia'         # política de asignación de canchas (ver politicas.POLITICAS)
+    punto_control: Optional[str] = None  # archivo donde guardar puntos de control (None: no se guardan)
+    punto_control_cada: int = 0          # iteraciones entre puntos de control (0: solo al terminar)
+    instrumentar: bool = False           # medir tiempos por etapa y por tipo de evento
+    avance_rapido: bool = False          # sin filas intermedias: solo las primeras y las 2 últimas
+    trazabilidad_completa: bool = False  # vista por equipo en todas las filas (no solo en las primeras 1000)
+
+    def __post_init__(self):
+        # Desde JSON el modelo llega como diccionario
+        if isinstance(self.modelo, dict):
+            self.modelo = ModeloConfig(**self.modelo)
+
+    def validar(self):
+        if self.modo_parada == 'tiempo':
+            if self.limite_horas is None or self.limite_horas <= 0:
+                raise ValueError("El modo 'tiempo' requiere limite_horas mayor que 0")
+        elif self.modo_parada == 'iteraciones':
+            if self.limite_iteraciones is None or self.limite_iteraciones <= 0:
+                raise ValueError("El modo 'iteraciones' requiere limite_iteraciones mayor que 0")
+        else:
+            raise ValueError(f"Modo de parada desconocido: {self.modo_parada!r}")
+
+        if self.generador not in ('independiente', 'global', 'lotes'):
+            raise ValueError(f"Generador desconocido: {self.generador!r}")
+        if self.modo_estado not in ('en_sitio', 'copia'):
+            raise ValueError(f"Modo de estado desconocido: {self.modo_estado!r}")
+        if self.mostrar_primeras < 0:
+            raise ValueError("mostrar_primeras debe ser 0 o positivo")
+        if self.politica not in POLITICAS:
+            raise ValueError(f"Política desconocida: {self.politica!r}")
+        if self.punto_control_cada < 0:
+            raise ValueError("punto_control_cada debe ser 0 o positivo")
+        if self.avance_rapido and self.exportar_columnar:
+            raise ValueError("El avance rápido no admite la exportación columnar (requiere todas las filas)")
+        self.modelo.validar()
+
+    def a_dict(self) -> Dict:
+        return asdict(self)
+
+
+def cargar_configuracion(ruta: str) -> ConfiguracionEjecucion:
+    """Lee una configuración desde un archivo JSON"""
+    with open(ruta, encoding="utf-8") as archivo:
+        return ConfiguracionEjecucion(**json.load(archivo))
+
+# ============================
+# API programática
+# ============================
+
+def crear_simulador(config: ConfiguracionEjecucion) -> SimuladorVectorial:
+    """Arma un SimuladorVectorial listo para correr según la configuración"""
+    config.validar()
+
+    simulador = SimuladorVectorial()
+    simulador.modo_parada = config.modo_parada
+    if config.modo_parada == 'tiempo':
+        simulador.limite_tiempo = config.limite_horas * 60
+        simulador.limite_iteraciones = 1000000  # Muy alto para que no sea limitante
+    else:
+        simulador.limite_iteraciones = config.limite_iteraciones
+        simulador.limite_tiempo = 1000000 * 60  # Muy alto para que no sea limitante
+    simulador.exportar_csv = config.exportar_csv
+    simulador.exportar_columnar = config.exportar_columnar
+    simulador.modo_estado = config.modo_estado
+    simulador.modelo = config.modelo
+    simulador.politica = crear_politica(config.politica)
+    simulador.ruta_punto_control = config.punto_control
+    simulador.punto_control_cada = config.punto_control_cada
+    simulador.instrumentar = config.instrumentar
+    simulador.avance_rapido = config.avance_rapido
+    simulador.trazabilidad_completa = config.trazabilidad_completa
+    simulador.aleatorios = crear_aleatorios(config.generador, config.semilla)
+
+    return simulador
+
+def crear_aleatorios(generador: str, semilla: Optional[int] = None):
+    """Fuente de números aleatorios: 'independiente', 'lotes' o 'global'.
+
+    'independiente' es el valor por defecto porque no requiere numpy y
+    reproduce las trayectorias de referencia. 'lotes' (AleatoriosPorLotes)
+    es opcional: se pide con generador='lotes' (también en el JSON de --config
+    de barrido y comparar_politicas) o con --generador lotes en cli.py y
+    replicaciones.py.
+    """
+    if generador == 'independiente':
+        return AleatoriosIndependientes(semilla)
+    if generador == 'lotes':
+        return AleatoriosPorLotes(semilla)
+    # Generador global del módulo random (secuencia de referencia)
+    if semilla is not None:
+        random.seed(semilla)
+    return AleatoriosGlobales()
+
+def ejecutar_simulacion(config: ConfiguracionEjecucion,
+                        progreso: Optional[Callable[[int, EstadoSimulacion], None]] = None) -> Dict:
+    """Corre una simulación completa sin entrada ni salida por consola.
+
+    progreso, si se indica, se llama como progreso(iteracion, estado) en cada
+    paso. Devuelve los indicadores finales junto con las filas retenidas y las
+    rutas de los archivos exportados (si se pidieron).
+    """
+    simulador = crear_simulador(config)
+    motivo_fin = simulador.simular(config.mostrar_primeras, progreso=progreso)
+    return resultados_corrida(simulador, motivo_fin, config.exportar_csv)
+
+def reanudar_simulacion(ruta: str, limite_horas: Optional[float] = None,
+                        limite_iteraciones: Optional[int] = None,
+                        aleatorios=None, exportar_csv: bool = False,
+                        punto_control: Optional[str] = None, punto_control_cada: int = 0,
+                        instrumentar: bool = False, avance_rapido: bool = False,
+                        progreso: Optional[Callable[[int, EstadoSimulacion], None]] = None) -> Dict:
+    """Continúa una corrida desde su punto de control, sin salida por consola.
+
+    limite_horas o limite_iteraciones extienden la corrida original (el
+    criterio de parada pasa a ser ese). aleatorios, si se indica, reemplaza
+    a la fuente guardada para ramificar la corrida. Los nuevos puntos de
+    control van a `punto_control` (None: no se guardan), así el punto de
+    partida no se pisa y puede reusarse para otras ramas.
+    """
+    simulador = SimuladorVectorial.desde_punto_control(ruta, aleatorios)
+    if limite_horas is not None:
+        simulador.modo_parada, simulador.limite_tiempo = 'tiempo', limite_horas * 60
+    if limite_iteraciones is not None:
+        simulador.modo_parada, simulador.limite_iteraciones = 'iteraciones', limite_iteraciones
+    simulador.exportar_csv = exportar_csv
+    simulador.ruta_punto_control = punto_control
+    simulador.punto_control_cada = punto_control_cada
+    simulador.instrumentar = instrumentar
+    simulador.avance_rapido = avance_rapido
+    motivo_fin = simulador.reanudar(progreso=progreso)
+    return resultados_corrida(simulador, motivo_fin, exportar_csv)
+
+def resultados_corrida(simulador: SimuladorVectorial, motivo_fin: str, exportar_csv: bool) -> Dict:
+    """Indicadores finales, filas retenidas y archivos exportados de una corrida"""
+    resultados = simulador.resultados()
+    resultados["motivo_fin"] = motivo_fin
+    resultados["total_filas"] = simulador.total_filas
+    resultados["primeras_filas"] = formatear_filas(simulador.vector_resultados)
+    resultados["ultimas_filas"] = formatear_filas(simulador.ultimas_filas)
+    resultados["archivo_csv"] = simulador.guardar_csv() if exportar_csv else None
+    resultados["archivo_columnar"] = simulador.guardar_columnar()
+    if simulador.instrumentacion is not None:
+        resultados["rendimiento"] = simulador.instrumentacion.resumen()
+    return resultados
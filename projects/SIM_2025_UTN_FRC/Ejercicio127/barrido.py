@@ -0,0 +1,140 @@
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+from dataclasses import fields, replace
+from typing import Dict, List, Optional, Sequence
+
+from api import ConfiguracionEjecucion, cargar_configuracion
+from exportadores import ruta_con_timestamp
+from modelo import ModeloConfig
+from replicaciones import INDICADORES, configuracion_replica, ejecutar_replica, resumir_replicas
+
+# ============================
+# Barrido de parámetros del modelo
+# ============================
+
+def generar_escenarios(grilla: Dict[str, Sequence[float]]) -> List[Dict[str, float]]:
+    """Producto cartesiano de los valores de cada parámetro del modelo"""
+    nombres = list(grilla)
+    return [dict(zip(nombres, valores)) for valores in itertools.product(*(grilla[n] for n in nombres))]
+
+def barrer(grilla: Dict[str, Sequence[float]], config: ConfiguracionEjecucion, replicas: int = 10,
+           semilla_base: int = 1, procesos: Optional[int] = None, confianza: float = 0.95) -> List[Dict]:
+    """Corre `replicas` réplicas de cada escenario de la grilla y resume cada uno.
+
+    Todos los escenarios usan las mismas semillas (números aleatorios
+    comunes), así las diferencias entre escenarios no se deben al azar de
+    cada uno. Las réplicas de todos los escenarios se reparten en un único
+    pool de procesos; procesos=1 corre en el proceso actual.
+    """
+    escenarios = generar_escenarios(grilla)
+    configuraciones = []
+    for escenario in escenarios:
+        modelo = replace(config.modelo, **escenario)
+        for r in range(replicas):
+            configuraciones.append(configuracion_replica(config, semilla_base + r, modelo=modelo,
+                                                         exportar_columnar=False))
+    # Validar antes de repartir para no descubrir un error dentro del pool
+    for c in configuraciones:
+        c.validar()
+
+    if procesos == 1:
+        resultados = [ejecutar_replica(c) for c in configuraciones]
+    else:
+        with multiprocessing.Pool(procesos) as pool:
+            resultados = pool.map(ejecutar_replica, configuraciones)
+
+    tabla = []
+    for i, escenario in enumerate(escenarios):
+        resumen = resumir_replicas(resultados[i * replicas:(i + 1) * replicas], confianza)
+        fila = dict(escenario)
+        for clave, _ in INDICADORES:
+            fila[clave], fila[f"{clave}_ic"] = resumen[clave]
+        tabla.append(fila)
+    return tabla
+
+def guardar_tabla(tabla: List[Dict], carpeta: str = "simulaciones") -> Optional[str]:
+    """Escribe la tabla resumen del barrido en CSV y devuelve su ruta"""
+    if not tabla:
+        return None
+    ruta_archivo = ruta_con_timestamp(carpeta, "csv", prefijo="Barrido")
+    with open(ruta_archivo, "w", newline="", encoding="utf-8") as archivo:
+        escritor = csv.DictWriter(archivo, fieldnames=list(tabla[0]))
+        escritor.writeheader()
+        escritor.writerows(tabla)
+    return ruta_archivo
+
+def mostrar_tabla(tabla: List[Dict], parametros: Sequence[str]):
+    """Imprime la espera promedio (± semiamplitud) de cada escenario"""
+    print("\n" + "="*80)
+    print("BARRIDO DE PARÁMETROS: ESPERA PROMEDIO (min)")
+    print("="*80)
+
+    columnas = list(parametros) + ["HANDBALL", "FOOTBALL", "BASKETBALL"]
+    anchos = [max(len(c), 12) for c in parametros] + [18, 18, 18]
+    print(" | ".join(c.ljust(a) for c, a in zip(columnas, anchos)))
+    print("-" * (sum(anchos) + 3 * (len(anchos) - 1)))
+    for fila in tabla:
+        valores = [f"{fila[p]:g}" for p in parametros] + [
+            f"{fila[f'espera_promedio_{t}']:.2f} ± {fila[f'espera_promedio_{t}_ic']:.2f}" for t in "HFB"
+        ]
+        print(" | ".join(v.ljust(a) for v, a in zip(valores, anchos)))
+
+
+def leer_parametro(texto: str):
+    """Convierte 'nombre=v1,v2,...' en (nombre, [v1, v2, ...])"""
+    nombre, _, valores = texto.partition("=")
+    if not valores:
+        raise argparse.ArgumentTypeError(f"se esperaba nombre=v1,v2,... y llegó {texto!r}")
+    try:
+        return nombre.strip(), [float(v) for v in valores.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"valores no numéricos en {texto!r}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Barrido de parámetros del modelo del polideportivo con réplicas en paralelo"
+    )
+    parser.add_argument("-p", "--parametro", type=leer_parametro, action="append", default=[],
+                        metavar="NOMBRE=V1,V2,...", help="valores de un parámetro de ModeloConfig (repetible)")
+    parser.add_argument("--grilla", help="archivo JSON {parametro: [valores]} (se combina con --parametro)")
+    parser.add_argument("--config", help="archivo JSON con la ConfiguracionEjecucion base")
+    parada = parser.add_mutually_exclusive_group()
+    parada.add_argument("--horas", type=float, help="tiempo máximo simulado por réplica (horas)")
+    parada.add_argument("--iteraciones", type=int, help="iteraciones por réplica")
+    parser.add_argument("-r", "--replicas", type=int, default=10, help="réplicas por escenario")
+    parser.add_argument("--semilla", type=int, default=1, help="semilla de la primera réplica")
+    parser.add_argument("--procesos", type=int, default=None, help="procesos del pool (por defecto, todos los núcleos)")
+    parser.add_argument("--confianza", type=float, default=0.95, help="nivel de confianza")
+    args = parser.parse_args()
+
+    grilla = {}
+    if args.grilla:
+        with open(args.grilla, encoding="utf-8") as archivo:
+            grilla.update(json.load(archivo))
+    grilla.update(dict(args.parametro))
+    if not grilla:
+        parser.error("indicar al menos un parámetro con --parametro o --grilla")
+    desconocidos = set(grilla) - {campo.name for campo in fields(ModeloConfig)}
+    if desconocidos:
+        parser.error(f"parámetros desconocidos: {', '.join(sorted(desconocidos))}")
+
+    config = cargar_configuracion(args.config) if args.config else ConfiguracionEjecucion()
+    if args.horas is not None:
+        config.modo_parada, config.limite_horas = 'tiempo', args.horas
+    elif args.iteraciones is not None:
+        config.modo_parada, config.limite_iteraciones = 'iteraciones', args.iteraciones
+    try:
+        config.validar()
+    except ValueError as error:
+        parser.error(str(error))
+
+    try:
+        tabla = barrer(grilla, config, args.replicas, args.semilla, args.procesos, args.confianza)
+    except ValueError as error:
+        parser.error(str(error))
+    mostrar_tabla(tabla, list(grilla))
+    print(f"\nTabla resumen guardada en {guardar_tabla(tabla)}")
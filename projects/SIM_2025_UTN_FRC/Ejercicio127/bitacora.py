@@ -0,0 +1,81 @@
+from array import array
+from typing import List, Tuple
+
+# ============================
+# Bitácora del ciclo de vida de los equipos
+# ============================
+
+ESTADOS_EQUIPO = ("Esperando", "Jugando", "Finalizado")
+CODIGOS_ESTADO_EQUIPO = {estado: codigo for codigo, estado in enumerate(ESTADOS_EQUIPO)}
+
+
+class BitacoraEquipos:
+    """Registro de cada transición de un equipo (llegada, inicio y fin de juego).
+
+    En lugar de guardar en cada fila el estado de todos los equipos, cada
+    fila guarda solo cuántas transiciones había hasta ese momento; la vista
+    por equipo de cualquier fila se reconstruye reproduciendo la bitácora.
+    """
+    def __init__(self):
+        self.ids: List[str] = []         # id de cada equipo en orden de llegada
+        self.llegadas = array('d')       # tiempo de llegada de cada equipo
+        self.posiciones = {}             # id -> posición en ids
+        self.equipo = array('I')         # posición del equipo de cada transición
+        self.estado = array('b')         # código del estado al que pasó
+        self.tiempo = array('d')         # reloj de la transición
+
+    def __len__(self):
+        return len(self.estado)
+
+    def registrar(self, equipo):
+        """Anota el estado actual del equipo (la primera vez lo da de alta)"""
+        posicion = self.posiciones.get(equipo.id)
+        if posicion is None:
+            posicion = self.posiciones[equipo.id] = len(self.ids)
+            self.ids.append(equipo.id)
+            self.llegadas.append(equipo.tiempo_llegada)
+
+        if equipo.estado == "Finalizado":
+            tiempo = equipo.tiempo_fin_juego
+        elif equipo.estado == "Jugando":
+            tiempo = equipo.tiempo_inicio_juego
+        else:
+            tiempo = equipo.tiempo_llegada
+
+        self.equipo.append(posicion)
+        self.estado.append(CODIGOS_ESTADO_EQUIPO[equipo.estado])
+        self.tiempo.append(tiempo)
+
+    def equipos_en(self, transiciones: int) -> List[Tuple[str, str, float]]:
+        """Estado de todos los equipos luego de las primeras `transiciones`"""
+        return VistaEquipos(self).avanzar(transiciones)
+
+
+class VistaEquipos:
+    """Reproduce la bitácora hacia adelante para armar la vista por equipo de
+    filas consecutivas sin volver a empezar desde cero en cada una.
+    """
+    def __init__(self, bitacora: BitacoraEquipos):
+        self.bitacora = bitacora
+        self.posicion = 0
+        self.estados = []                # código de estado de cada equipo visto
+
+    def avanzar(self, transiciones: int) -> List[Tuple[str, str, float]]:
+        """Vista (id, estado, tiempo_llegada) luego de las primeras `transiciones`"""
+        if transiciones < self.posicion:
+            # Fila anterior a la última reproducida: empezar de nuevo
+            self.posicion = 0
+            self.estados = []
+
+        bitacora = self.bitacora
+        estados = self.estados
+        for k in range(self.posicion, transiciones):
+            posicion = bitacora.equipo[k]
+            if posicion == len(estados):
+                estados.append(bitacora.estado[k])
+            else:
+                estados[posicion] = bitacora.estado[k]
+        self.posicion = transiciones
+
+        ids, llegadas = bitacora.ids, bitacora.llegadas
+        return [(ids[i], ESTADOS_EQUIPO[codigo], llegadas[i]) for i, codigo in enumerate(estados)]
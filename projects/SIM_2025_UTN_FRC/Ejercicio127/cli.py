@@ -0,0 +1,166 @@
+import argparse
+import json
+import math
+import sys
+
+from api import (ConfiguracionEjecucion, cargar_configuracion, crear_aleatorios, crear_simulador,
+                 ejecutar_simulacion, reanudar_simulacion)
+from instrumentacion import perfilar
+from simulador import SimuladorVectorial
+from politicas import POLITICAS
+
+# ============================
+# Punto de entrada no interactivo
+# ============================
+
+def crear_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Simulador del polideportivo sin menú interactivo. "
+                    "Las opciones indicadas reemplazan a las del archivo --config."
+    )
+    parser.add_argument("--config", help="archivo JSON con una ConfiguracionEjecucion")
+    parada = parser.add_mutually_exclusive_group()
+    parada.add_argument("--horas", type=float, help="parar por tiempo máximo simulado (horas)")
+    parada.add_argument("--iteraciones", type=int, help="parar por cantidad de iteraciones/filas")
+    parser.add_argument("--semilla", type=int, help="semilla de los generadores")
+    parser.add_argument("--generador", choices=["independiente", "global", "lotes"],
+                        help="fuente de números aleatorios (por defecto 'independiente'; 'lotes' requiere numpy)")
+    parser.add_argument("--politica", choices=sorted(POLITICAS), help="política de asignación de canchas")
+    parser.add_argument("--mostrar", type=int, dest="mostrar_primeras", help="filas a mostrar al inicio")
+    parser.add_argument("--csv", action="store_true", default=None, dest="exportar_csv",
+                        help="exportar el vector de estado a CSV")
+    parser.add_argument("--npz", action="store_true", default=None, dest="exportar_columnar",
+                        help="exportar tablas columnares de eventos y equipos (.npz)")
+    parser.add_argument("--punto-control", dest="punto_control", metavar="RUTA",
+                        help="guardar puntos de control de la corrida en RUTA")
+    parser.add_argument("--punto-control-cada", type=int, dest="punto_control_cada", metavar="N",
+                        help="iteraciones entre puntos de control (por defecto solo al terminar)")
+    parser.add_argument("--reanudar", metavar="RUTA",
+                        help="continuar la corrida guardada en RUTA; --horas/--iteraciones la "
+                             "extienden y --semilla/--generador la ramifican con otra fuente")
+    parser.add_argument("--instrumentar", action="store_true", default=None,
+                        help="medir tiempos por etapa y por tipo de evento e informarlos al final")
+    parser.add_argument("--rapido", action="store_true", default=None, dest="avance_rapido",
+                        help="avance rápido: no arma las filas intermedias (el CSV queda con las "
+                             "primeras y las 2 últimas)")
+    parser.add_argument("--trazabilidad-completa", action="store_true", default=None,
+                        dest="trazabilidad_completa",
+                        help="columnas por equipo en todas las filas del CSV (por defecto solo en "
+                             "las primeras 1000; el archivo crece con filas × equipos)")
+    parser.add_argument("--perfil", type=int, default=0, metavar="N",
+                        help="correr bajo cProfile e imprimir por stderr las N funciones más costosas")
+    parser.add_argument("--progreso", type=int, default=0, metavar="N",
+                        help="informar el progreso por stderr cada N iteraciones")
+    parser.add_argument("--json", action="store_true",
+                        help="imprimir solo los indicadores finales en JSON")
+    return parser
+
+def configuracion_desde_argumentos(args) -> ConfiguracionEjecucion:
+    """Combina el archivo de configuración (si hay) con las opciones de línea de comandos"""
+    config = cargar_configuracion(args.config) if args.config else ConfiguracionEjecucion()
+
+    if args.horas is not None:
+        config.modo_parada, config.limite_horas = 'tiempo', args.horas
+    if args.iteraciones is not None:
+        config.modo_parada, config.limite_iteraciones = 'iteraciones', args.iteraciones
+    for campo in ("semilla", "generador", "politica", "mostrar_primeras", "exportar_csv", "exportar_columnar",
+                  "punto_control", "punto_control_cada", "instrumentar", "avance_rapido",
+                  "trazabilidad_completa"):
+        valor = getattr(args, campo)
+        if valor is not None:
+            setattr(config, campo, valor)
+    return config
+
+def crear_progreso(cada: int):
+    """Callback de progreso que escribe por stderr cada `cada` iteraciones"""
+    if cada <= 0:
+        return None
+
+    def progreso(iteracion, estado):
+        if iteracion % cada == 0:
+            print(f"Progreso: Iteración {iteracion}, Reloj: {estado.reloj/60:.2f}h", file=sys.stderr)
+    return progreso
+
+def reanudar(args, progreso):
+    """Continúa la corrida guardada en args.reanudar"""
+    aleatorios = None
+    if args.semilla is not None or args.generador is not None:
+        aleatorios = crear_aleatorios(args.generador or 'independiente', args.semilla)
+    limite_horas, limite_iteraciones = args.horas, args.iteraciones
+
+    if args.json:
+        resultados = reanudar_simulacion(args.reanudar, limite_horas, limite_iteraciones, aleatorios,
+                                         bool(args.exportar_csv), args.punto_control,
+                                         args.punto_control_cada or 0, bool(args.instrumentar),
+                                         bool(args.avance_rapido),
+                                         progreso=progreso)
+        imprimir_json(resultados)
+        return
+
+    simulador = SimuladorVectorial.desde_punto_control(args.reanudar, aleatorios)
+    if limite_horas is not None:
+        simulador.modo_parada, simulador.limite_tiempo = 'tiempo', limite_horas * 60
+    if limite_iteraciones is not None:
+        simulador.modo_parada, simulador.limite_iteraciones = 'iteraciones', limite_iteraciones
+    simulador.exportar_csv = bool(args.exportar_csv)
+    simulador.ruta_punto_control = args.punto_control
+    simulador.punto_control_cada = args.punto_control_cada or 0
+    simulador.instrumentar = bool(args.instrumentar)
+    simulador.avance_rapido = bool(args.avance_rapido)
+    print(f"Reanudando desde la iteración {simulador.iteraciones} "
+          f"(reloj {simulador.estados[-1].reloj/60:.2f}h)")
+    print(simulador.reanudar(progreso=progreso))
+    mostrar_corrida(simulador, simulador.mostrar_primeras, simulador.exportar_csv, False)
+
+def imprimir_json(resultados):
+    indicadores = {
+        clave: (None if isinstance(valor, float) and math.isnan(valor) else valor)
+        for clave, valor in resultados.items()
+        if clave not in ("primeras_filas", "ultimas_filas")
+    }
+    print(json.dumps(indicadores, ensure_ascii=False, indent=2))
+
+def mostrar_corrida(simulador, mostrar_primeras: int, exportar_csv: bool, exportar_columnar: bool):
+    print(f"\nSimulación completada en {simulador.iteraciones} iteraciones")
+    simulador.mostrar_resultados(mostrar_primeras)
+    simulador.generar_reporte()
+    if exportar_csv:
+        simulador.exportar_a_csv()
+    if exportar_columnar:
+        print(f"Tablas columnares exportadas a {simulador.guardar_columnar()}")
+    simulador.generar_reporte_rendimiento()
+
+def main(argv=None):
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+    if args.perfil > 0:
+        _, perfil = perfilar(correr, parser, args, lineas=args.perfil)
+        print(perfil, file=sys.stderr)
+    else:
+        correr(parser, args)
+
+def correr(parser, args):
+    """Ejecuta (o reanuda) la corrida pedida en los argumentos"""
+    if args.reanudar:
+        if args.config:
+            parser.error("--reanudar toma la configuración del punto de control; no se combina con --config")
+        reanudar(args, crear_progreso(args.progreso))
+        return
+    config = configuracion_desde_argumentos(args)
+    try:
+        config.validar()
+    except ValueError as error:
+        parser.error(str(error))
+    progreso = crear_progreso(args.progreso)
+
+    if args.json:
+        imprimir_json(ejecutar_simulacion(config, progreso=progreso))
+        return
+
+    simulador = crear_simulador(config)
+    print(simulador.simular(config.mostrar_primeras, progreso=progreso))
+    mostrar_corrida(simulador, config.mostrar_primeras, config.exportar_csv, config.exportar_columnar)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+import argparse
+import multiprocessing
+from dataclasses import replace
+from typing import Dict, Optional, Sequence
+
+from api import ConfiguracionEjecucion, cargar_configuracion
+from estadisticas import intervalo_confianza
+from politicas import POLITICAS
+from replicaciones import configuracion_replica, ejecutar_replica, resumir_replicas
+
+# ============================
+# Comparación de políticas de asignación
+# ============================
+
+# Indicadores que se comparan: (clave en resultados(), descripción)
+INDICADORES_POLITICAS = [
+    ("espera_promedio", "Espera promedio global (min)"),
+    ("espera_promedio_H", "Espera promedio HANDBALL (min)"),
+    ("espera_promedio_F", "Espera promedio FOOTBALL (min)"),
+    ("espera_promedio_B", "Espera promedio BASKETBALL (min)"),
+    ("espera_p95_B", "Espera p95 BASKETBALL (min)"),
+    ("cancha_ocupada", "Fracción de tiempo en juego"),
+    ("cancha_acondicionamiento", "Fracción de tiempo acondicionando"),
+    ("cancha_libre", "Fracción de tiempo libre"),
+]
+
+
+def comparar_politicas(politicas: Sequence[str], config: ConfiguracionEjecucion, replicas: int = 10,
+                       semilla_base: int = 1, procesos: Optional[int] = None,
+                       confianza: float = 0.95) -> Dict[str, Dict]:
+    """Corre cada política con las mismas semillas y resume sus indicadores.
+
+    Como las réplicas son pareadas (misma semilla, mismas llegadas), la
+    diferencia de espera global contra la primera política se estima réplica
+    a réplica, con un intervalo mucho más angosto que comparar las medias.
+    procesos=1 corre en el proceso actual.
+    """
+    configuraciones = [
+        configuracion_replica(config, semilla_base + r, politica=politica, exportar_columnar=False)
+        for politica in politicas
+        for r in range(replicas)
+    ]
+    for c in configuraciones:
+        c.validar()
+
+    if procesos == 1:
+        resultados = [ejecutar_replica(c) for c in configuraciones]
+    else:
+        with multiprocessing.Pool(procesos) as pool:
+            resultados = pool.map(ejecutar_replica, configuraciones)
+
+    por_politica = {
+        politica: resultados[i * replicas:(i + 1) * replicas] for i, politica in enumerate(politicas)
+    }
+    base = por_politica[politicas[0]]
+    comparacion = {}
+    for politica, corridas in por_politica.items():
+        comparacion[politica] = {
+            "resumen": resumir_replicas(corridas, confianza, INDICADORES_POLITICAS),
+            "diferencia_espera": intervalo_confianza(
+                [float(a["espera_promedio"]) - float(b["espera_promedio"]) for a, b in zip(corridas, base)],
+                confianza,
+            ),
+        }
+    return comparacion
+
+def mostrar_comparacion(comparacion: Dict[str, Dict], replicas: int, confianza: float):
+    """Imprime una tabla de indicadores por política"""
+    politicas = list(comparacion)
+    print("\n" + "="*80)
+    print(f"COMPARACIÓN DE POLÍTICAS ({replicas} réplicas pareadas, IC {confianza:.0%})")
+    print("="*80)
+
+    ancho = max(18, max(len(p) for p in politicas) + 2)
+    print(f"{'Indicador':<36}" + "".join(p.rjust(ancho) for p in politicas))
+    print("-" * (36 + ancho * len(politicas)))
+    for clave, descripcion in INDICADORES_POLITICAS:
+        celdas = []
+        for politica in politicas:
+            media, semiamplitud = comparacion[politica]["resumen"][clave]
+            celdas.append(f"{media:.3f} ± {semiamplitud:.3f}" if clave.startswith("cancha")
+                          else f"{media:.2f} ± {semiamplitud:.2f}")
+        print(f"{descripcion:<36}" + "".join(c.rjust(ancho) for c in celdas))
+
+    print(f"\nDiferencia de espera global contra '{politicas[0]}' (pareada, min):")
+    for politica in politicas[1:]:
+        media, semiamplitud = comparacion[politica]["diferencia_espera"]
+        print(f"  {politica:<28} {media:>+8.2f} ± {semiamplitud:.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compara políticas de asignación de canchas con las mismas semillas")
+    parser.add_argument("--politicas", nargs="+", choices=sorted(POLITICAS), default=list(POLITICAS),
+                        help="políticas a comparar (la primera es la base de la diferencia)")
+    parser.add_argument("--config", help="archivo JSON con la ConfiguracionEjecucion base (incluido el modelo)")
+    parada = parser.add_mutually_exclusive_group()
+    parada.add_argument("--horas", type=float, help="tiempo máximo simulado por réplica (horas)")
+    parada.add_argument("--iteraciones", type=int, help="iteraciones por réplica")
+    parser.add_argument("--canchas", type=int, help="cantidad de canchas")
+    parser.add_argument("-r", "--replicas", type=int, default=10, help="réplicas por política")
+    parser.add_argument("--semilla", type=int, default=1, help="semilla de la primera réplica")
+    parser.add_argument("--procesos", type=int, default=None, help="procesos del pool (por defecto, todos los núcleos)")
+    parser.add_argument("--confianza", type=float, default=0.95, help="nivel de confianza")
+    args = parser.parse_args()
+
+    config = cargar_configuracion(args.config) if args.config else ConfiguracionEjecucion()
+    if args.horas is not None:
+        config.modo_parada, config.limite_horas = 'tiempo', args.horas
+    elif args.iteraciones is not None:
+        config.modo_parada, config.limite_iteraciones = 'iteraciones', args.iteraciones
+    if args.canchas is not None:
+        config.modelo = replace(config.modelo, cantidad_canchas=args.canchas)
+    try:
+        config.validar()
+    except ValueError as error:
+        parser.error(str(error))
+
+    comparacion = comparar_politicas(args.politicas, config, args.replicas, args.semilla,
+                                     args.procesos, args.confianza)
+    mostrar_comparacion(comparacion, args.replicas, args.confianza)
@@ -28,4 +28,176 @@ def tiempo_normal_box_muller(z: float, media_horas: float, desviacion_horas: flo
 def ocupacion_normal_box_muller(z: float, media_min: float, desviacion_min: float) -> float:
     """Distribución normal para ocupación usando resultado de Box-Muller (en minutos)"""
     tiempo = media_min + desviacion_min * z
-    return max(0, tiempo)  # Evitar valores negativos
\ No newline at end of file
+    return max(0, tiempo)  # Evitar valores negativos
+
+def box_muller_vectorial(rnd1, rnd2):
+    """Método de Box-Muller aplicado a arreglos completos de NumPy"""
+    import numpy as np
+
+    radio = np.sqrt(-2 * np.log(rnd1))
+    angulo = 2 * np.pi * rnd2
+    return radio * np.cos(angulo), radio * np.sin(angulo)
+
+# ============================
+# Fuentes de números aleatorios
+# ============================
+
+# Fuentes estocásticas del modelo
+FUENTES = (
+    "llegada_H", "llegada_F", "llegada_B",
+    "ocupacion_H", "ocupacion_F", "ocupacion_B",
+)
+
+# Fuentes que consumen pares (rnd1, rnd2) transformados con Box-Muller
+FUENTES_NORMALES = ("llegada_H", "llegada_B", "ocupacion_H", "ocupacion_F", "ocupacion_B")
+
+
+class AleatoriosGlobales:
+    """Fuente de referencia: todos los números salen del módulo random global"""
+    def rnd(self, fuente: str) -> float:
+        return generar_rnd()
+
+    def par_box_muller(self, fuente: str) -> Tuple[float, float, float, float]:
+        """Devuelve (rnd1, rnd2, z0, z1)"""
+        rnd1 = generar_rnd()
+        rnd2 = generar_rnd()
+        z0, z1 = box_muller(rnd1, rnd2)
+        return rnd1, rnd2, z0, z1
+
+
+class AleatoriosIndependientes:
+    """Un generador random.Random por fuente, cada uno con su propia semilla
+    derivada de la semilla base. Lo que consuma una fuente no altera la
+    secuencia de las demás (números aleatorios comunes entre escenarios).
+    """
+    def __init__(self, semilla=None):
+        self.generadores = {
+            fuente: random.Random(None if semilla is None else f"{semilla}:{fuente}")
+            for fuente in FUENTES
+        }
+
+    def rnd(self, fuente: str) -> float:
+        return self.generadores[fuente].random()
+
+    def par_box_muller(self, fuente: str) -> Tuple[float, float, float, float]:
+        """Devuelve (rnd1, rnd2, z0, z1)"""
+        generador = self.generadores[fuente]
+        rnd1 = generador.random()
+        rnd2 = generador.random()
+        z0, z1 = box_muller(rnd1, rnd2)
+        return rnd1, rnd2, z0, z1
+
+
+class FlujoVariables:
+    """Flujo pre-generado de una fuente, rellenado por bloques de NumPy
+    cuando se agota. Las fuentes normales guardan tuplas (rnd1, rnd2, z0, z1)
+    para que el simulador siga usando z0 y reservando z1 como antes.
+    """
+    def __init__(self, generador, normal: bool, tamano_lote: int):
+        self.generador = generador
+        self.normal = normal
+        self.tamano_lote = tamano_lote
+        self.valores = []
+        self.pos = 0
+        self.estado_lote = None   # estado del generador antes del lote actual
+
+    def rellenar(self):
+        self.estado_lote = self.generador.bit_generator.state
+        if self.normal:
+            # Pares intercalados: la secuencia no depende del tamaño del lote
+            rnds = self.generador.random(2 * self.tamano_lote)
+            rnd1, rnd2 = rnds[0::2], rnds[1::2]
+            z0, z1 = box_muller_vectorial(rnd1, rnd2)
+            # tolist() convierte a float de Python: indexar luego es más barato
+            self.valores = list(zip(rnd1.tolist(), rnd2.tolist(), z0.tolist(), z1.tolist()))
+        else:
+            self.valores = self.generador.random(self.tamano_lote).tolist()
+        self.pos = 0
+
+    def siguiente(self):
+        if self.pos >= len(self.valores):
+            self.rellenar()
+        valor = self.valores[self.pos]
+        self.pos += 1
+        return valor
+
+    def tomar(self, cantidad: int) -> list:
+        """Los próximos `cantidad` valores (los mismos que daría siguiente())"""
+        valores = []
+        while len(valores) < cantidad:
+            if self.pos >= len(self.valores):
+                self.rellenar()
+            fin = min(len(self.valores), self.pos + cantidad - len(valores))
+            valores.extend(self.valores[self.pos:fin])
+            self.pos = fin
+        return valores
+
+    def tomar_arreglo(self, cantidad: int):
+        """Como tomar(), pero en un arreglo de NumPy: (cantidad, 4) en las
+        fuentes normales y (cantidad,) en las demás. Lo que falta después del
+        lote actual se genera directo, sin pasar por listas de Python.
+        """
+        import numpy as np
+
+        previos = self.valores[self.pos:self.pos + cantidad]
+        self.pos += len(previos)
+        faltan = cantidad - len(previos)
+        forma = (-1, 4) if self.normal else (-1,)
+        previos = np.array(previos, dtype=np.float64).reshape(forma)
+        if faltan == 0:
+            return previos
+
+        # Mismos valores que darían los lotes siguientes (la secuencia no
+        # depende del tamaño del lote); el próximo siguiente() sigue desde acá
+        if self.normal:
+            rnds = self.generador.random(2 * faltan)
+            rnd1, rnd2 = rnds[0::2], rnds[1::2]
+            nuevos = np.column_stack((rnd1, rnd2) + box_muller_vectorial(rnd1, rnd2))
+        else:
+            nuevos = self.generador.random(faltan)
+        self.valores, self.pos, self.estado_lote = [], 0, None
+        return np.concatenate((previos, nuevos))
+
+    # El lote no se guarda al serializar (puntos de control): se regenera a
+    # partir del estado del generador previo al lote
+    def __getstate__(self):
+        estado = self.__dict__.copy()
+        del estado["valores"]
+        return estado
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self.valores = []
+        if self.estado_lote is not None:
+            pos = self.pos
+            self.generador.bit_generator.state = self.estado_lote
+            self.rellenar()
+            self.pos = pos
+
+
+class AleatoriosPorLotes:
+    """Fuente con un flujo independiente por fuente estocástica, generado
+    por lotes con NumPy (requiere numpy instalado).
+
+    Es opcional: main.py y ConfiguracionEjecucion usan AleatoriosIndependientes
+    por defecto. La usan cli.py y replicaciones.py con --generador lotes (el
+    motor 'simultaneas' la exige), barrido y comparar_politicas con
+    "generador": "lotes" en el JSON de --config, y cualquier llamada a la API
+    con ConfiguracionEjecucion(generador='lotes').
+    """
+    def __init__(self, semilla=None, tamano_lote: int = 4096):
+        import numpy as np
+
+        # Un generador hijo por fuente, derivados de la misma semilla
+        hijos = np.random.SeedSequence(semilla).spawn(len(FUENTES))
+        self.flujos = {
+            fuente: FlujoVariables(np.random.default_rng(hijo), fuente in FUENTES_NORMALES, tamano_lote)
+            for fuente, hijo in zip(FUENTES, hijos)
+        }
+
+    def rnd(self, fuente: str) -> float:
+        return self.flujos[fuente].siguiente()
+
+    def par_box_muller(self, fuente: str) -> Tuple[float, float, float, float]:
+        """Devuelve (rnd1, rnd2, z0, z1)"""
+        return self.flujos[fuente].siguiente()
@@ -1,7 +1,14 @@
+import heapq
+
 # ============================
 # Clases para la simulación
 # ============================
 class Equipo:
+    __slots__ = (
+        "tipo", "id_num", "id", "tiempo_llegada", "estado",
+        "tiempo_inicio_juego", "tiempo_fin_juego", "tiempo_espera",
+    )
+
     def __init__(self, tipo: str, id_num: int, tiempo_llegada: float):
         self.tipo = tipo                  # 'H', 'F', 'B'
         self.id_num = id_num
@@ -24,4 +31,80 @@ class Equipo:
         self.estado = "Finalizado"
 
     def __repr__(self):
-        return self.id
\ No newline at end of file
+        return self.id
+
+
+class Cancha:
+    """Una cancha del polideportivo (servidor)"""
+    __slots__ = (
+        "numero", "estado", "equipos", "prox_fin_juego",
+        "prox_fin_acondicionamiento", "ultima_disciplina",
+    )
+
+    def __init__(self, numero: int):
+        self.numero = numero              # posición en la lista de canchas (desde 0)
+        self.estado = "Libre"             # "Libre", "Ocupado_H", "Ocupado_F", "Ocupado_B", "Acondicionamiento"
+        self.equipos = []
+        self.prox_fin_juego = float("inf")
+        self.prox_fin_acondicionamiento = float("inf")
+        self.ultima_disciplina = None     # 'H', 'F', 'B'
+
+    def copy(self) -> "Cancha":
+        cancha = Cancha.__new__(Cancha)
+        cancha.numero = self.numero
+        cancha.estado = self.estado
+        cancha.equipos = self.equipos.copy()
+        cancha.prox_fin_juego = self.prox_fin_juego
+        cancha.prox_fin_acondicionamiento = self.prox_fin_acondicionamiento
+        cancha.ultima_disciplina = self.ultima_disciplina
+        return cancha
+
+    def foto(self) -> tuple:
+        """Vista inmutable para las filas del vector: (estado, ids, prox_fin_juego)"""
+        return (self.estado, tuple(e.id for e in self.equipos), self.prox_fin_juego)
+
+    def __repr__(self):
+        return f"Cancha{self.numero + 1}"
+
+
+class CanchasLibres:
+    """Canchas libres agrupadas por la última disciplina jugada.
+
+    Cada grupo es un heap de números de cancha, así tomar o liberar una
+    cancha cuesta O(log N) sin recorrer todas las canchas.
+    """
+    __slots__ = ("por_disciplina", "cantidad")
+
+    def __init__(self, cantidad_canchas: int = 0):
+        # None: canchas que todavía no se usaron (no requieren acondicionamiento)
+        self.por_disciplina = {None: list(range(cantidad_canchas)), "H": [], "F": [], "B": []}
+        self.cantidad = cantidad_canchas
+
+    def copy(self) -> "CanchasLibres":
+        libres = CanchasLibres()
+        libres.por_disciplina = {d: heap.copy() for d, heap in self.por_disciplina.items()}
+        libres.cantidad = self.cantidad
+        return libres
+
+    def __len__(self):
+        return self.cantidad
+
+    def liberar(self, cancha: Cancha):
+        heapq.heappush(self.por_disciplina[cancha.ultima_disciplina], cancha.numero)
+        self.cantidad += 1
+
+    def sin_acondicionamiento(self, disciplina: str) -> bool:
+        """True si hay una cancha libre donde `disciplina` no requiere acondicionamiento"""
+        return bool(self.por_disciplina[disciplina] or self.por_disciplina[None])
+
+    def tomar(self, disciplina: str) -> int:
+        """Número de la cancha libre para `disciplina`: la de menor número entre
+        las que no requieren acondicionamiento y, si no hay, entre todas.
+        """
+        grupos = self.por_disciplina
+        candidatos = [grupos[d] for d in (disciplina, None) if grupos[d]]
+        if not candidatos:
+            candidatos = [heap for heap in grupos.values() if heap]
+        heap = min(candidatos, key=lambda h: h[0])
+        self.cantidad -= 1
+        return heapq.heappop(heap)
@@ -0,0 +1,140 @@
+import argparse
+from array import array
+from dataclasses import replace
+from typing import Dict, List, Sequence
+
+from api import ConfiguracionEjecucion, crear_simulador
+from bitacora import BitacoraEquipos, CODIGOS_ESTADO_EQUIPO
+from estadisticas import intervalo_confianza
+
+# ============================
+# Análisis de estado estacionario en una única corrida larga
+# ============================
+
+def mser(serie: Sequence[float], tamano_lote: int = 5) -> int:
+    """Punto de truncamiento del período de calentamiento (regla MSER-5).
+
+    Agrupa la serie en medias de `tamano_lote` observaciones y elige el
+    descarte d (en lotes, hasta la mitad) que minimiza el error estándar
+    de la media de los lotes restantes. Devuelve la cantidad de
+    observaciones a descartar.
+    """
+    m = len(serie) // tamano_lote
+    if m < 2:
+        return 0
+    lotes = [sum(serie[j * tamano_lote:(j + 1) * tamano_lote]) / tamano_lote for j in range(m)]
+
+    # Sumas acumuladas desde el final: cada candidato se evalúa en O(1)
+    suma = suma_cuadrados = 0.0
+    mejor_d, mejor_valor = 0, float("inf")
+    estadisticos = [0.0] * m
+    for j in range(m - 1, -1, -1):
+        suma += lotes[j]
+        suma_cuadrados += lotes[j] * lotes[j]
+        k = m - j
+        estadisticos[j] = (suma_cuadrados - suma * suma / k) / (k * k)
+    for d in range(m // 2 + 1):
+        if estadisticos[d] < mejor_valor:
+            mejor_d, mejor_valor = d, estadisticos[d]
+    return mejor_d * tamano_lote
+
+def medias_por_lotes(serie: Sequence[float], cantidad_lotes: int = 20) -> List[float]:
+    """Medias de `cantidad_lotes` lotes consecutivos de igual tamaño (el sobrante inicial se descarta)"""
+    tamano = len(serie) // cantidad_lotes
+    if tamano == 0:
+        return []
+    inicio = len(serie) - tamano * cantidad_lotes
+    return [
+        sum(serie[inicio + j * tamano:inicio + (j + 1) * tamano]) / tamano
+        for j in range(cantidad_lotes)
+    ]
+
+def autocorrelacion_lag1(valores: Sequence[float]) -> float:
+    """Autocorrelación de orden 1 (para verificar que los lotes sean casi independientes)"""
+    n = len(valores)
+    if n < 3:
+        return float("nan")
+    media = sum(valores) / n
+    varianza = sum((v - media) ** 2 for v in valores)
+    if varianza == 0:
+        return float("nan")
+    return sum((valores[i] - media) * (valores[i + 1] - media) for i in range(n - 1)) / varianza
+
+def analizar_serie(serie: Sequence[float], cantidad_lotes: int = 20, confianza: float = 0.95) -> Dict:
+    """Trunca el calentamiento con MSER-5 y estima la media por lotes"""
+    truncamiento = mser(serie)
+    estacionaria = serie[truncamiento:]
+    medias = medias_por_lotes(estacionaria, cantidad_lotes)
+    media, semiamplitud = intervalo_confianza(medias, confianza) if medias else (float("nan"), float("nan"))
+    return {
+        "observaciones": len(serie),
+        "truncamiento": truncamiento,
+        "media_sin_truncar": sum(serie) / len(serie) if len(serie) else float("nan"),
+        "media": media,
+        "semiamplitud": semiamplitud,
+        "tamano_lote": len(estacionaria) // cantidad_lotes,
+        "autocorrelacion": autocorrelacion_lag1(medias),
+    }
+
+# ============================
+# Series de la simulación
+# ============================
+
+def esperas_por_disciplina(bitacora: BitacoraEquipos) -> Dict[str, array]:
+    """Espera de cada equipo en el orden en que empezó a jugar, por disciplina"""
+    esperas = {tipo: array('d') for tipo in ("H", "F", "B")}
+    jugando = CODIGOS_ESTADO_EQUIPO["Jugando"]
+    for k in range(len(bitacora)):
+        if bitacora.estado[k] == jugando:
+            posicion = bitacora.equipo[k]
+            esperas[bitacora.ids[posicion][0]].append(bitacora.tiempo[k] - bitacora.llegadas[posicion])
+    return esperas
+
+def analizar_corrida(config: ConfiguracionEjecucion, cantidad_lotes: int = 20,
+                     confianza: float = 0.95) -> Dict[str, Dict]:
+    """Corre una simulación larga y analiza la espera de cada disciplina"""
+    simulador = crear_simulador(
+        replace(config, mostrar_primeras=0, exportar_csv=False, exportar_columnar=False,
+                avance_rapido=True)
+    )
+    simulador.trazabilidad_completa = True   # la serie de esperas sale de la bitácora
+    simulador.simular()
+
+    return {
+        tipo: analizar_serie(serie, cantidad_lotes, confianza)
+        for tipo, serie in esperas_por_disciplina(simulador.bitacora).items()
+    }
+
+def mostrar_analisis(analisis: Dict[str, Dict], confianza: float):
+    """Imprime el truncamiento y el intervalo por medias de lotes de cada disciplina"""
+    print("\n" + "="*80)
+    print(f"ESTADO ESTACIONARIO: ESPERA POR DISCIPLINA (MSER-5 + MEDIAS POR LOTES, IC {confianza:.0%})")
+    print("="*80)
+
+    for tipo, nombre in [("H", "HANDBALL"), ("F", "FOOTBALL"), ("B", "BASKETBALL")]:
+        resultado = analisis[tipo]
+        print(f"\n{nombre}:")
+        print(f"  Equipos atendidos: {resultado['observaciones']}")
+        print(f"  Calentamiento descartado: {resultado['truncamiento']} equipos")
+        print(f"  Espera media sin truncar: {resultado['media_sin_truncar']:.2f} min")
+        print(f"  Espera media estacionaria: {resultado['media']:.2f} ± {resultado['semiamplitud']:.2f} min")
+        print(f"  Lotes de {resultado['tamano_lote']} equipos, autocorrelación lag 1: {resultado['autocorrelacion']:.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Análisis de estado estacionario del polideportivo en una corrida larga")
+    parada = parser.add_mutually_exclusive_group(required=True)
+    parada.add_argument("--horas", type=float, help="tiempo máximo simulado (horas)")
+    parada.add_argument("--iteraciones", type=int, help="cantidad de iteraciones")
+    parser.add_argument("--semilla", type=int, default=1, help="semilla de los generadores")
+    parser.add_argument("--lotes", type=int, default=20, help="cantidad de lotes")
+    parser.add_argument("--confianza", type=float, default=0.95, help="nivel de confianza")
+    args = parser.parse_args()
+
+    if args.horas is not None:
+        config = ConfiguracionEjecucion(modo_parada='tiempo', limite_horas=args.horas, semilla=args.semilla)
+    else:
+        config = ConfiguracionEjecucion(modo_parada='iteraciones', limite_iteraciones=args.iteraciones,
+                                        semilla=args.semilla)
+
+    mostrar_analisis(analizar_corrida(config, args.lotes, args.confianza), args.confianza)
@@ -0,0 +1,271 @@
+import math
+from typing import Dict, Sequence, Tuple
+
+# ============================
+# Distribución t de Student (sin dependencias externas)
+# ============================
+
+def _fraccion_continua_beta(a: float, b: float, x: float) -> float:
+    """Fracción continua de la beta incompleta (método de Lentz)"""
+    minimo = 1e-300
+    qab, qap, qam = a + b, a + 1, a - 1
+    c = 1.0
+    d = 1 - qab * x / qap
+    d = 1 / (d if abs(d) > minimo else minimo)
+    h = d
+    for m in range(1, 300):
+        m2 = 2 * m
+        # Paso par
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1 + aa * d
+        d = 1 / (d if abs(d) > minimo else minimo)
+        c = 1 + aa / c
+        c = c if abs(c) > minimo else minimo
+        h *= d * c
+        # Paso impar
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1 + aa * d
+        d = 1 / (d if abs(d) > minimo else minimo)
+        c = 1 + aa / c
+        c = c if abs(c) > minimo else minimo
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return h
+
+def beta_incompleta_regularizada(a: float, b: float, x: float) -> float:
+    """I_x(a, b)"""
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    ln_frente = (math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                 + a * math.log(x) + b * math.log(1 - x))
+    frente = math.exp(ln_frente)
+    if x < (a + 1) / (a + b + 2):
+        return frente * _fraccion_continua_beta(a, b, x) / a
+    return 1 - frente * _fraccion_continua_beta(b, a, 1 - x) / b
+
+def cdf_t_student(t: float, grados_libertad: float) -> float:
+    """Función de distribución acumulada de la t de Student"""
+    x = grados_libertad / (grados_libertad + t * t)
+    cola = 0.5 * beta_incompleta_regularizada(grados_libertad / 2, 0.5, x)
+    return 1 - cola if t > 0 else cola
+
+def cuantil_t_student(p: float, grados_libertad: float) -> float:
+    """Inversa de la acumulada de la t de Student (por bisección)"""
+    if p == 0.5:
+        return 0.0
+    if p < 0.5:
+        return -cuantil_t_student(1 - p, grados_libertad)
+
+    bajo, alto = 0.0, 1.0
+    while cdf_t_student(alto, grados_libertad) < p:
+        bajo, alto = alto, alto * 2
+    for _ in range(200):
+        medio = (bajo + alto) / 2
+        if cdf_t_student(medio, grados_libertad) < p:
+            bajo = medio
+        else:
+            alto = medio
+        if alto - bajo < 1e-12:
+            break
+    return (bajo + alto) / 2
+
+# ============================
+# Intervalos de confianza
+# ============================
+
+def intervalo_confianza(valores: Sequence[float], confianza: float = 0.95) -> Tuple[float, float]:
+    """Media y semiamplitud del intervalo t de Student.
+
+    Los valores NaN (por ejemplo, promedios sin equipos atendidos) se
+    descartan. Con menos de dos valores la semiamplitud es NaN.
+    """
+    datos = [v for v in valores if not math.isnan(v)]
+    n = len(datos)
+    if n == 0:
+        return float("nan"), float("nan")
+    media = sum(datos) / n
+    if n < 2:
+        return media, float("nan")
+
+    varianza = sum((v - media) ** 2 for v in datos) / (n - 1)
+    t = cuantil_t_student(1 - (1 - confianza) / 2, n - 1)
+    return media, t * math.sqrt(varianza / n)
+
+# ============================
+# Estadísticas en línea (memoria O(1))
+# ============================
+
+class Welford:
+    """Media y varianza muestral acumuladas de a una observación (algoritmo de Welford)"""
+    __slots__ = ("n", "media", "m2", "minimo", "maximo")
+
+    def __init__(self):
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+
+    def agregar(self, valor: float):
+        self.n += 1
+        delta = valor - self.media
+        self.media += delta / self.n
+        self.m2 += delta * (valor - self.media)
+        self.minimo = min(self.minimo, valor)
+        self.maximo = max(self.maximo, valor)
+
+    def varianza(self) -> float:
+        return self.m2 / (self.n - 1) if self.n > 1 else float("nan")
+
+    def desvio(self) -> float:
+        return math.sqrt(self.varianza())
+
+
+class PercentilP2:
+    """Estimación de un percentil sin guardar las observaciones (algoritmo P² de Jain y Chlamtac)"""
+    __slots__ = ("p", "alturas", "posiciones", "deseadas", "incrementos")
+
+    def __init__(self, p: float):
+        self.p = p
+        self.alturas = []                  # las primeras 5 observaciones, luego los 5 marcadores
+        self.posiciones = [0, 1, 2, 3, 4]
+        self.deseadas = [0, 2 * p, 4 * p, 2 + 2 * p, 4]
+        self.incrementos = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def agregar(self, valor: float):
+        q = self.alturas
+        if len(q) < 5:
+            q.append(valor)
+            q.sort()
+            return
+
+        # Celda k en la que cae la observación (ajustando los extremos)
+        if valor < q[0]:
+            q[0] = valor
+            k = 0
+        elif valor >= q[4]:
+            q[4] = valor
+            k = 3
+        else:
+            k = 0
+            while valor >= q[k + 1]:
+                k += 1
+
+        n = self.posiciones
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.deseadas[i] += self.incrementos[i]
+
+        # Ajustar los marcadores intermedios hacia su posición deseada
+        for i in range(1, 4):
+            d = self.deseadas[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                s = 1 if d > 0 else -1
+                altura = self._parabolica(i, s)
+                if not q[i - 1] < altura < q[i + 1]:
+                    altura = q[i] + s * (q[i + s] - q[i]) / (n[i + s] - n[i])
+                q[i] = altura
+                n[i] += s
+
+    def _parabolica(self, i: int, s: int) -> float:
+        q, n = self.alturas, self.posiciones
+        return q[i] + s / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + s) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - s) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def valor(self) -> float:
+        """Percentil estimado (exacto mientras haya 5 observaciones o menos)"""
+        q = self.alturas
+        if not q:
+            return float("nan")
+        if len(q) < 5 or self.posiciones[4] < 5:
+            return q[min(len(q) - 1, int(round(self.p * (len(q) - 1))))]
+        return q[2]
+
+
+class PromedioPonderado:
+    """Promedio en el tiempo de una variable que cambia solo en los eventos"""
+    __slots__ = ("area", "valor", "desde", "inicio")
+
+    def __init__(self, inicio: float = 0.0, valor: float = 0.0):
+        self.area = 0.0
+        self.valor = valor
+        self.desde = inicio
+        self.inicio = inicio
+
+    def actualizar(self, reloj: float, valor: float):
+        """El valor anterior rigió hasta `reloj`; desde ahí rige `valor`"""
+        self.area += self.valor * (reloj - self.desde)
+        self.valor = valor
+        self.desde = reloj
+
+    def promedio(self, reloj: float) -> float:
+        duracion = reloj - self.inicio
+        if duracion <= 0:
+            return float("nan")
+        return (self.area + self.valor * (reloj - self.desde)) / duracion
+
+
+# Percentiles de espera que se estiman por disciplina
+PERCENTILES_ESPERA = (0.5, 0.9, 0.95)
+
+# Situaciones de la cancha para la utilización
+SITUACIONES_CANCHA = ("ocupada", "acondicionamiento", "libre")
+
+
+class EstadisticasEnLinea:
+    """Indicadores que se actualizan en cada evento sin guardar el historial:
+    largo promedio de cada cola y utilización de la cancha (ponderados en el
+    tiempo), y media, varianza y percentiles de la espera por disciplina.
+    Con varias canchas la utilización es la fracción promedio de canchas en
+    cada situación.
+    """
+    def __init__(self, reloj_inicial: float = 0.0):
+        self.reloj = reloj_inicial
+        self.cola_FH = PromedioPonderado(reloj_inicial)
+        self.cola_B = PromedioPonderado(reloj_inicial)
+        self.cancha = {s: PromedioPonderado(reloj_inicial) for s in SITUACIONES_CANCHA}
+        self.espera = {tipo: Welford() for tipo in ("H", "F", "B")}
+        self.percentiles = {
+            tipo: [PercentilP2(p) for p in PERCENTILES_ESPERA] for tipo in ("H", "F", "B")
+        }
+
+    def observar(self, estado):
+        """Registra el estado luego de un evento (rige hasta el próximo)"""
+        reloj = estado.reloj
+        self.reloj = reloj
+        self.cola_FH.actualizar(reloj, len(estado.cola_handball_football))
+        self.cola_B.actualizar(reloj, len(estado.cola_basketball))
+        cantidad = len(estado.canchas)
+        ocupadas = estado.canchas_ocupadas / cantidad
+        acondicionamiento = estado.canchas_en_acondicionamiento / cantidad
+        self.cancha["ocupada"].actualizar(reloj, ocupadas)
+        self.cancha["acondicionamiento"].actualizar(reloj, acondicionamiento)
+        self.cancha["libre"].actualizar(reloj, (cantidad - estado.canchas_ocupadas - estado.canchas_en_acondicionamiento) / cantidad)
+
+    def registrar_espera(self, tipo: str, espera: float):
+        """Espera de un equipo al iniciar su juego"""
+        self.espera[tipo].agregar(espera)
+        for percentil in self.percentiles[tipo]:
+            percentil.agregar(espera)
+
+    def resumen(self) -> Dict[str, float]:
+        """Indicadores al último evento observado, con claves planas"""
+        resumen = {
+            "cola_promedio_FH": self.cola_FH.promedio(self.reloj),
+            "cola_promedio_B": self.cola_B.promedio(self.reloj),
+        }
+        for situacion, promedio in self.cancha.items():
+            resumen[f"cancha_{situacion}"] = promedio.promedio(self.reloj)
+        for tipo, acumulado in self.espera.items():
+            resumen[f"espera_desvio_{tipo}"] = acumulado.desvio()
+            resumen[f"espera_maxima_{tipo}"] = acumulado.maximo if acumulado.n else float("nan")
+            for percentil in self.percentiles[tipo]:
+                resumen[f"espera_p{round(percentil.p * 100)}_{tipo}"] = percentil.valor()
+        return resumen
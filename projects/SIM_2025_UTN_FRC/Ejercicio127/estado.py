@@ -1,22 +1,68 @@
+from collections import deque
 from typing import List
 from distribuciones import (
-    generar_rnd,
-    box_muller,
+    AleatoriosGlobales,
     tiempo_exponencial,
     tiempo_normal_box_muller
 )
-from entidades import Equipo
+from entidades import Cancha, CanchasLibres, Equipo
+from eventos import ListaEventosFuturos
+from modelo import ModeloConfig
+
+# Códigos enteros del estado del servidor
+CODIGOS_SERVIDOR = {
+    "Libre": 0,
+    "Ocupado_H": 1,
+    "Ocupado_F": 2,
+    "Ocupado_B": 3,
+    "Acondicionamiento": 4,
+}
 
 
 class EstadoSimulacion:
     """Representa el estado completo de la simulación en un momento dado"""
-    def __init__(self, estado_anterior=None):
+    # Registro de layout fijo: sin __dict__ por instancia
+    __slots__ = (
+        "reloj", "evento_actual",
+
+        # Llegadas
+        "rnd_handball_1", "rnd_handball_2", "rnd_football",
+        "rnd_basketball_1", "rnd_basketball_2",
+        "z_handball_0", "z_handball_1", "hay_z_disponible_handball",
+        "z_basketball_0", "z_basketball_1", "hay_z_disponible_basketball",
+        "tiempo_prox_handball", "tiempo_prox_football", "tiempo_prox_basketball",
+        "prox_llegada_handball", "prox_llegada_football", "prox_llegada_basketball",
+
+        # Ocupación
+        "rnd_ocupacion_handball_1", "rnd_ocupacion_handball_2",
+        "rnd_ocupacion_football_1", "rnd_ocupacion_football_2",
+        "rnd_ocupacion_basketball_1", "rnd_ocupacion_basketball_2",
+        "tmp_handball_1_disponible", "tmp_handball_2_disponible",
+        "tmp_football_1_disponible", "tmp_football_2_disponible",
+        "tmp_basketball_1_disponible", "tmp_basketball_2_disponible",
+        "tmp_handball_2_usado", "tmp_football_2_usado", "tmp_basketball_2_usado",
+        "eventos_futuros",
+
+        # Colas y canchas (servidores)
+        "cola_handball_football", "cola_basketball",
+        "canchas", "canchas_libres", "canchas_ocupadas", "canchas_en_acondicionamiento",
+        "fotos_canchas",
+        "tiempo_inicio_servicio", "tiempo_acondicionamiento",
+
+        # Estadísticas
+        "equipos_handball_atendidos", "tiempo_espera_handball",
+        "equipos_football_atendidos", "tiempo_espera_football",
+        "equipos_basketball_atendidos", "tiempo_espera_basketball",
+
+        # Equipos y contadores
+        "id_counter_handball", "id_counter_football", "id_counter_basketball",
+    )
+
+    def __init__(self, estado_anterior=None, aleatorios=None, modelo=None):
         # Copiar estado anterior si existe
         if estado_anterior:
             self.reloj = estado_anterior.reloj
             self.evento_actual = estado_anterior.evento_actual
-            self.ultima_disciplina = estado_anterior.ultima_disciplina
-            self.prox_fin_acondicionamiento = estado_anterior.prox_fin_acondicionamiento
 
             # RNDs para llegadas
             self.rnd_handball_1 = estado_anterior.rnd_handball_1
@@ -66,17 +112,20 @@ class EstadoSimulacion:
             self.tmp_basketball_1_disponible = estado_anterior.tmp_basketball_1_disponible
             self.tmp_basketball_2_disponible = estado_anterior.tmp_basketball_2_disponible
 
-            # Próximo fin de juego
-            self.prox_fin_juego = estado_anterior.prox_fin_juego
+            # Lista de eventos futuros
+            self.eventos_futuros = estado_anterior.eventos_futuros.copy()
             
             # Colas
             self.cola_handball_football = estado_anterior.cola_handball_football.copy()
             self.cola_basketball = estado_anterior.cola_basketball.copy()
             
-            # Servidor
-            self.estado_servidor = estado_anterior.estado_servidor
+            # Canchas
+            self.canchas = [cancha.copy() for cancha in estado_anterior.canchas]
+            self.canchas_libres = estado_anterior.canchas_libres.copy()
+            self.canchas_ocupadas = estado_anterior.canchas_ocupadas
+            self.canchas_en_acondicionamiento = estado_anterior.canchas_en_acondicionamiento
+            self.fotos_canchas = estado_anterior.fotos_canchas.copy()
             self.tiempo_inicio_servicio = estado_anterior.tiempo_inicio_servicio
-            self.equipos_actuales = estado_anterior.equipos_actuales.copy() if estado_anterior.equipos_actuales else []
             self.tiempo_acondicionamiento = estado_anterior.tiempo_acondicionamiento
             
             # Estadísticas
@@ -87,9 +136,6 @@ class EstadoSimulacion:
             self.equipos_basketball_atendidos = estado_anterior.equipos_basketball_atendidos
             self.tiempo_espera_basketball = estado_anterior.tiempo_espera_basketball
             
-            # Lista de equipos
-            self.equipos = estado_anterior.equipos.copy()
-            
             # Contadores
             self.id_counter_handball = estado_anterior.id_counter_handball
             self.id_counter_football = estado_anterior.id_counter_football
@@ -99,28 +145,32 @@ class EstadoSimulacion:
             # Estado inicial
             self.reloj = 0
             self.evento_actual = "Inicio"
-            self.ultima_disciplina = None  # 'H', 'F', 'B'
-            self.prox_fin_acondicionamiento = float("inf")
-
-            # Inicializar RNDs para llegadas
-            self.rnd_handball_1 = generar_rnd()
-            self.rnd_handball_2 = generar_rnd()
-            self.rnd_football = generar_rnd()
-            self.rnd_basketball_1 = generar_rnd()
-            self.rnd_basketball_2 = generar_rnd()
-            
-            # Generar números Box-Muller para handball
-            self.z_handball_0, self.z_handball_1 = box_muller(self.rnd_handball_1, self.rnd_handball_2)
+
+            # Fuente de números aleatorios (por defecto, el módulo random global)
+            if aleatorios is None:
+                aleatorios = AleatoriosGlobales()
+
+            # Inicializar RNDs y números Box-Muller para handball
+            (self.rnd_handball_1, self.rnd_handball_2,
+             self.z_handball_0, self.z_handball_1) = aleatorios.par_box_muller("llegada_H")
             self.hay_z_disponible_handball = True  # Tenemos z1 disponible para próxima llegada
-            
-            # Generar números Box-Muller para basketball
-            self.z_basketball_0, self.z_basketball_1 = box_muller(self.rnd_basketball_1, self.rnd_basketball_2)
+
+            # RND para football
+            self.rnd_football = aleatorios.rnd("llegada_F")
+
+            # Inicializar RNDs y números Box-Muller para basketball
+            (self.rnd_basketball_1, self.rnd_basketball_2,
+             self.z_basketball_0, self.z_basketball_1) = aleatorios.par_box_muller("llegada_B")
             self.hay_z_disponible_basketball = True  # Tenemos z1 disponible para próxima llegada
             
-            # Calcular tiempos de primera llegada usando z0
-            self.tiempo_prox_handball = tiempo_normal_box_muller(self.z_handball_0, 12, 2)  # 12±2 horas
-            self.tiempo_prox_football = tiempo_exponencial(self.rnd_football, 10)  # 10 horas
-            self.tiempo_prox_basketball = tiempo_normal_box_muller(self.z_basketball_0, 8, 2)  # 8±2 horas
+            # Calcular tiempos de primera llegada usando z0 (por defecto 12±2, 10 y 8±2 horas)
+            if modelo is None:
+                modelo = ModeloConfig()
+            self.tiempo_prox_handball = tiempo_normal_box_muller(
+                self.z_handball_0, modelo.llegada_handball_primera_media, modelo.llegada_handball_primera_desvio)
+            self.tiempo_prox_football = tiempo_exponencial(self.rnd_football, modelo.llegada_football_media)
+            self.tiempo_prox_basketball = tiempo_normal_box_muller(
+                self.z_basketball_0, modelo.llegada_basketball_media, modelo.llegada_basketball_desvio)
             
             # Próximas llegadas
             self.prox_llegada_handball = self.tiempo_prox_handball
@@ -147,17 +197,24 @@ class EstadoSimulacion:
             self.tmp_football_2_usado = False
             self.tmp_basketball_2_usado = False
 
-            # Próximo fin de juego (inicialmente infinito)
-            self.prox_fin_juego = float('inf')
+            # Lista de eventos futuros con las primeras llegadas
+            self.eventos_futuros = ListaEventosFuturos()
+            self.eventos_futuros.programar("Llegada_H", self.prox_llegada_handball)
+            self.eventos_futuros.programar("Llegada_F", self.prox_llegada_football)
+            self.eventos_futuros.programar("Llegada_B", self.prox_llegada_basketball)
             
-            # Colas vacías
-            self.cola_handball_football = []
-            self.cola_basketball = []
+            # Colas vacías (deque: extracción O(1) por el frente)
+            self.cola_handball_football = deque()
+            self.cola_basketball = deque()
             
-            # Servidor libre
-            self.estado_servidor = "Libre"  # "Libre", "Ocupado_H", "Ocupado_F", "Ocupado_B", "Acondicionamiento"
+            # Canchas libres (por defecto una sola)
+            cantidad_canchas = int(modelo.cantidad_canchas)
+            self.canchas = [Cancha(numero) for numero in range(cantidad_canchas)]
+            self.canchas_libres = CanchasLibres(cantidad_canchas)
+            self.canchas_ocupadas = 0
+            self.canchas_en_acondicionamiento = 0
+            self.fotos_canchas = [cancha.foto() for cancha in self.canchas]
             self.tiempo_inicio_servicio = 0
-            self.equipos_actuales = []
             self.tiempo_acondicionamiento = 0
             
             # Estadísticas iniciales
@@ -168,10 +225,42 @@ class EstadoSimulacion:
             self.equipos_basketball_atendidos = 0
             self.tiempo_espera_basketball = 0
             
-            # Lista de equipos vacía
-            self.equipos = []
-            
             # Contadores de IDs
             self.id_counter_handball = 1
             self.id_counter_football = 1
-            self.id_counter_basketball = 1
\ No newline at end of file
+            self.id_counter_basketball = 1
+    # =============================
+    # Vistas del conjunto de canchas (filas, exportación y reporte)
+    # =============================
+
+    @property
+    def estado_servidor(self) -> str:
+        """Estado de la cancha, o de cada cancha separado por ' | '"""
+        if len(self.canchas) == 1:
+            return self.canchas[0].estado
+        return " | ".join(cancha.estado for cancha in self.canchas)
+
+    @property
+    def equipos_actuales(self) -> List[Equipo]:
+        """Equipos en todas las canchas (jugando o esperando el acondicionamiento)"""
+        if len(self.canchas) == 1:
+            return self.canchas[0].equipos
+        return [equipo for cancha in self.canchas for equipo in cancha.equipos]
+
+    @property
+    def prox_fin_juego(self) -> float:
+        return min(cancha.prox_fin_juego for cancha in self.canchas)
+
+    @property
+    def prox_fin_acondicionamiento(self) -> float:
+        return min(cancha.prox_fin_acondicionamiento for cancha in self.canchas)
+
+    @property
+    def equipos_creados(self) -> int:
+        """Equipos llegados desde el inicio (los finalizados no se guardan)"""
+        return self.id_counter_handball + self.id_counter_football + self.id_counter_basketball - 3
+
+    def equipos_vivos(self) -> List[Equipo]:
+        """Equipos en cola o en una cancha, en orden de llegada"""
+        vivos = list(self.cola_handball_football) + list(self.cola_basketball) + list(self.equipos_actuales)
+        return sorted(vivos, key=lambda equipo: equipo.tiempo_llegada)
@@ -0,0 +1,84 @@
+import heapq
+from typing import Tuple
+
+# ============================
+# Lista de eventos futuros (heap binario)
+# ============================
+
+# Orden de desempate ante tiempos iguales: el mismo en que antes se armaba
+# la lista de candidatos (min() devolvía el primero)
+PRIORIDAD_EVENTOS = {
+    "Llegada_H": 0,
+    "Llegada_F": 1,
+    "Llegada_B": 2,
+    "Fin_Juego": 3,
+    "Fin_Acondicionamiento": 4,
+}
+
+# Códigos enteros de evento (exportación columnar y motores alternativos)
+CODIGOS_EVENTO = {
+    "Inicio": 0,
+    "Llegada_H": 1,
+    "Llegada_F": 2,
+    "Llegada_B": 3,
+    "Fin_Juego": 4,
+    "Fin_Acondicionamiento": 5,
+    "Fin": 6,
+}
+
+# Atributo que guarda el tiempo vigente de cada evento (en el estado, o en
+# la cancha para los eventos de EVENTOS_CANCHA)
+ATRIBUTO_EVENTO = {
+    "Llegada_H": "prox_llegada_handball",
+    "Llegada_F": "prox_llegada_football",
+    "Llegada_B": "prox_llegada_basketball",
+    "Fin_Juego": "prox_fin_juego",
+    "Fin_Acondicionamiento": "prox_fin_acondicionamiento",
+}
+
+# Eventos que ocurren en una cancha en particular
+EVENTOS_CANCHA = frozenset(("Fin_Juego", "Fin_Acondicionamiento"))
+
+
+class ListaEventosFuturos:
+    """Heap de eventos programados con cancelación perezosa.
+
+    Un evento se programa una sola vez (O(log n)). Si luego el estado (o la
+    cancha) deja de tenerlo programado para ese tiempo (por ejemplo
+    prox_fin_juego = inf), la entrada queda obsoleta y se descarta recién al
+    llegar al tope. Ante tiempos iguales los fines se ordenan por cancha.
+    """
+    __slots__ = ("heap",)
+
+    def __init__(self, entradas=None):
+        self.heap = list(entradas) if entradas else []
+
+    def copy(self):
+        return ListaEventosFuturos(self.heap)
+
+    def programar(self, evento: str, tiempo: float, cancha: int = 0):
+        """Agrega un evento al heap (los tiempos infinitos no se programan)"""
+        if tiempo < float('inf'):
+            heapq.heappush(self.heap, (tiempo, PRIORIDAD_EVENTOS[evento], cancha, evento))
+
+    def proximo(self, estado) -> Tuple[str, float]:
+        """Devuelve el próximo evento vigente sin extraerlo"""
+        heap = self.heap
+        while heap:
+            tiempo, _, cancha, evento = heap[0]
+            origen = estado.canchas[cancha] if evento in EVENTOS_CANCHA else estado
+            if getattr(origen, ATRIBUTO_EVENTO[evento]) == tiempo:
+                return evento, tiempo
+            # Evento cancelado o reprogramado: se descarta
+            heapq.heappop(heap)
+        return ("Fin", float('inf'))
+
+    def extraer(self, estado) -> Tuple[str, float, int]:
+        """Extrae el próximo evento vigente junto con su cancha"""
+        evento, tiempo = self.proximo(estado)
+        if not self.heap:
+            return evento, tiempo, 0
+        return evento, tiempo, heapq.heappop(self.heap)[2]
+
+    def __len__(self):
+        return len(self.heap)
@@ -0,0 +1,272 @@
+import csv
+import os
+import tempfile
+from array import array
+from datetime import datetime
+from typing import Optional
+
+from eventos import CODIGOS_EVENTO
+from estado import CODIGOS_SERVIDOR
+from bitacora import VistaEquipos
+from filas import FilaCruda, formatear_fila
+
+NAN = float("nan")
+
+# ============================
+# Exportación de resultados
+# ============================
+
+# Orden de columnas del CSV (las columnas por equipo se agregan al final)
+COLUMNAS_CSV = [
+    'Iteracion', 'Evento', 'Reloj (min)', 'Reloj (h)',
+
+    'RND1_H', 'RND2_H', 'Tmp_Prox_H', 'Prox_Llegada_H',
+    'RND_F', 'Tmp_Prox_F', 'Prox_Llegada_F',
+    'RND1_B', 'RND2_B', 'Tmp_Prox_B', 'Prox_Llegada_B',
+
+    'RND1_Ocup_H', 'RND2_Ocup_H', 'TMP1_Ocup_H', 'TMP2_Ocup_H',
+    'RND1_Ocup_F', 'RND2_Ocup_F', 'TMP1_Ocup_F', 'TMP2_Ocup_F',
+    'RND1_Ocup_B', 'RND2_Ocup_B', 'TMP1_Ocup_B', 'TMP2_Ocup_B',
+
+    'Proximo_Fin_Juego',
+    'Cola_FH', 'Cola_B',
+    'Estado_Servidor', 'Equipos_Actuales',
+
+    'Cant_H_Atend', 'Acu_Espera_H',
+    'Cant_F_Atend', 'Acu_Espera_F',
+    'Cant_B_Atend', 'Acu_Espera_B',
+    'Equipos_Lista',
+]
+
+
+def ruta_con_timestamp(carpeta: str, extension: str, prefijo: str = "Simulacion") -> str:
+    """Arma la ruta del archivo de salida con fecha y hora"""
+    os.makedirs(carpeta, exist_ok=True)
+    timestamp = datetime.now().strftime("%d%m%Y_%H%M")
+    return os.path.join(carpeta, f"{prefijo}{timestamp}.{extension}")
+
+
+# Columnas solo numéricas que empiezan en 0 (int) y pasan a float. pandas
+# les daba un dtype por columna: float64 (0 → "0.0") si en la corrida
+# aparece algún float, int64 ("0") si la columna quedó toda en 0.
+COLUMNAS_REALES = {'Reloj (min)', 'Reloj (h)', 'Acu_Espera_H', 'Acu_Espera_F', 'Acu_Espera_B'}
+INDICES_REALES = [i for i, columna in enumerate(COLUMNAS_CSV) if columna in COLUMNAS_REALES]
+
+
+class ExportadorCSV:
+    """Escribe el CSV a medida que se generan las filas del vector.
+
+    Recibe las filas crudas del simulador y las formatea recién al
+    escribirlas; la vista por equipo se obtiene reproduciendo la bitácora
+    fila a fila. Las columnas por equipo se arman de forma incremental:
+    cada fila trae los equipos como tuplas (id, estado, tmp_llegada) y un equipo
+    "Finalizado" se muestra solo la primera vez. Como el ancho final
+    depende de cuántos equipos aparezcan, las filas se escriben primero a
+    un archivo temporal y al cerrar se copian completando las columnas
+    vacías, sin mantener las filas en memoria. En esa copia también se
+    pasan a float los enteros de las columnas reales que terminaron siendo
+    float (como el dtype por columna de pandas).
+    """
+    def __init__(self, carpeta: str = "simulaciones"):
+        self.carpeta = carpeta
+        self.temporal = None
+        self.escritor = None
+        self.equipos_por_fila = array('I')   # cantidad de equipos escritos en cada fila
+        self.max_equipos = 0
+        self.finalizados = set()             # equipos ya mostrados como "Finalizado"
+        self.vista = None                    # reproducción de la bitácora hasta la última fila
+        self.reales_con_enteros = set()      # índices de columnas reales con algún int...
+        self.reales_con_float = set()        # ...y con algún float
+        self.filas_con_enteros = array('I')  # filas con algún int en una columna real
+
+    def agregar(self, fila: FilaCruda):
+        if fila.bitacora is not None and (self.vista is None or self.vista.bitacora is not fila.bitacora):
+            self.vista = VistaEquipos(fila.bitacora)
+        fila = formatear_fila(fila, self.vista)
+        if self.temporal is None:
+            self.temporal = tempfile.TemporaryFile(mode="w+", newline="", encoding="utf-8")
+            self.escritor = csv.writer(self.temporal, lineterminator="\n")
+
+        valores = [fila.get(columna, "") for columna in COLUMNAS_CSV]
+        con_enteros = False
+        for i in INDICES_REALES:
+            if type(valores[i]) is int:
+                self.reales_con_enteros.add(i)
+                con_enteros = True
+            else:
+                self.reales_con_float.add(i)
+        if con_enteros:
+            self.filas_con_enteros.append(len(self.equipos_por_fila))
+
+        equipos = fila.get("Equipos", ())
+        for eq_id, estado, tmp_llegada in equipos:
+            # 🔴 REGLA DEFINITIVA: "Finalizado" solo la primera vez
+            if estado == "Finalizado":
+                if eq_id in self.finalizados:
+                    valores.extend(("", "", ""))
+                    continue
+                self.finalizados.add(eq_id)
+            valores.extend((eq_id, estado, tmp_llegada))
+
+        self.escritor.writerow(valores)
+        self.equipos_por_fila.append(len(equipos))
+        self.max_equipos = max(self.max_equipos, len(equipos))
+
+    def cerrar(self) -> Optional[str]:
+        """Escribe el archivo final y devuelve su ruta (None si no hubo filas)"""
+        if self.temporal is None:
+            return None
+
+        encabezado = list(COLUMNAS_CSV)
+        for i in range(1, self.max_equipos + 1):
+            encabezado.extend([
+                f"Equipo_{i}_ID",
+                f"Equipo_{i}_Estado",
+                f"Equipo_{i}_TMP_Llegada"
+            ])
+
+        # Columnas que mezclan int y float: pandas las escribía enteras como float
+        mezcladas = self.reales_con_enteros & self.reales_con_float
+        a_corregir = set(self.filas_con_enteros) if mezcladas else set()
+
+        ruta_archivo = ruta_con_timestamp(self.carpeta, "csv")
+        self.temporal.seek(0)
+        with open(ruta_archivo, "w", newline="", encoding="utf-8") as archivo:
+            escritor = csv.writer(archivo, lineterminator=os.linesep)
+            escritor.writerow(encabezado)
+            # Completar con celdas vacías hasta el ancho final
+            for numero, (linea, cantidad) in enumerate(zip(self.temporal, self.equipos_por_fila)):
+                faltantes = 3 * (self.max_equipos - cantidad)
+                if numero in a_corregir:
+                    celdas = next(csv.reader([linea]))
+                    for i in mezcladas:
+                        if celdas[i].lstrip("-").isdigit():
+                            celdas[i] = str(float(celdas[i]))
+                    escritor.writerow(celdas + [""] * faltantes)
+                else:
+                    archivo.write(linea[:-1] + "," * faltantes + os.linesep)
+
+        self.temporal.close()
+        self.temporal = None
+        return ruta_archivo
+
+
+# ============================
+# Exportación columnar (.npz)
+# ============================
+
+# Tabla de eventos de esquema fijo: (columna, atributo del estado, typecode de array)
+COLUMNAS_EVENTOS = [
+    ("reloj", "reloj", 'd'),
+    ("rnd_handball_1", "rnd_handball_1", 'd'),
+    ("rnd_handball_2", "rnd_handball_2", 'd'),
+    ("rnd_football", "rnd_football", 'd'),
+    ("rnd_basketball_1", "rnd_basketball_1", 'd'),
+    ("rnd_basketball_2", "rnd_basketball_2", 'd'),
+    ("rnd_ocupacion_handball_1", "rnd_ocupacion_handball_1", 'd'),
+    ("rnd_ocupacion_handball_2", "rnd_ocupacion_handball_2", 'd'),
+    ("rnd_ocupacion_football_1", "rnd_ocupacion_football_1", 'd'),
+    ("rnd_ocupacion_football_2", "rnd_ocupacion_football_2", 'd'),
+    ("rnd_ocupacion_basketball_1", "rnd_ocupacion_basketball_1", 'd'),
+    ("rnd_ocupacion_basketball_2", "rnd_ocupacion_basketball_2", 'd'),
+    ("prox_llegada_H", "prox_llegada_handball", 'd'),
+    ("prox_llegada_F", "prox_llegada_football", 'd'),
+    ("prox_llegada_B", "prox_llegada_basketball", 'd'),
+    ("prox_fin_juego", "prox_fin_juego", 'd'),
+    ("prox_fin_acondicionamiento", "prox_fin_acondicionamiento", 'd'),
+    ("atendidos_H", "equipos_handball_atendidos", 'q'),
+    ("atendidos_F", "equipos_football_atendidos", 'q'),
+    ("atendidos_B", "equipos_basketball_atendidos", 'q'),
+    ("espera_acum_H", "tiempo_espera_handball", 'd'),
+    ("espera_acum_F", "tiempo_espera_football", 'd'),
+    ("espera_acum_B", "tiempo_espera_basketball", 'd'),
+]
+
+# Código entero del tipo de equipo en la tabla de equipos
+CODIGOS_TIPO_EQUIPO = {"H": 0, "F": 1, "B": 2}
+
+
+class ExportadorColumnar:
+    """Guarda el vector de estado en columnas tipadas y al cerrar escribe un
+    .npz con dos tablas:
+
+    - eventos/*: una fila por iteración con esquema fijo (iteración, reloj,
+      código de evento y de estado de la primera cancha, canchas ocupadas y
+      en acondicionamiento, RNDs, próximos eventos, largo de colas y
+      acumuladores). Los RND vacíos se guardan como NaN.
+    - equipos/*: una fila por equipo creado con su ciclo de vida (llegada,
+      inicio y fin de juego, espera).
+
+    Durante la corrida solo se usan arrays de la biblioteca estándar; NumPy
+    se necesita recién al escribir el archivo.
+    """
+    def __init__(self, carpeta: str = "simulaciones"):
+        self.carpeta = carpeta
+        self.iteracion = array('q')
+        self.evento = array('b')
+        self.estado_servidor = array('b')
+        self.canchas_ocupadas = array('i')
+        self.canchas_acondicionamiento = array('i')
+        self.cola_FH = array('i')
+        self.cola_B = array('i')
+        self.columnas = {nombre: array(tipo) for nombre, _, tipo in COLUMNAS_EVENTOS}
+        self.equipos = []   # referencias a Equipo (en orden de llegada): sus tiempos finales se leen al cerrar
+
+    def agregar(self, estado, iteracion: int):
+        self.iteracion.append(iteracion)
+        self.evento.append(CODIGOS_EVENTO[estado.evento_actual])
+        self.estado_servidor.append(CODIGOS_SERVIDOR[estado.canchas[0].estado])
+        self.canchas_ocupadas.append(estado.canchas_ocupadas)
+        self.canchas_acondicionamiento.append(estado.canchas_en_acondicionamiento)
+        self.cola_FH.append(len(estado.cola_handball_football))
+        self.cola_B.append(len(estado.cola_basketball))
+        for nombre, atributo, _ in COLUMNAS_EVENTOS:
+            valor = getattr(estado, atributo)
+            self.columnas[nombre].append(NAN if valor is None else valor)
+
+    def agregar_equipo(self, equipo):
+        """Anota un equipo recién llegado (el simulador no guarda los finalizados)"""
+        self.equipos.append(equipo)
+
+    def cerrar(self) -> Optional[str]:
+        """Escribe el archivo .npz y devuelve su ruta (None si no hubo filas)"""
+        if not self.iteracion:
+            return None
+
+        import numpy as np
+
+        tablas = {
+            "eventos/iteracion": np.frombuffer(self.iteracion, dtype=np.int64),
+            "eventos/evento": np.frombuffer(self.evento, dtype=np.int8),
+            "eventos/estado_servidor": np.frombuffer(self.estado_servidor, dtype=np.int8),
+            "eventos/canchas_ocupadas": np.frombuffer(self.canchas_ocupadas, dtype=np.int32),
+            "eventos/canchas_acondicionamiento": np.frombuffer(self.canchas_acondicionamiento, dtype=np.int32),
+            "eventos/cola_FH": np.frombuffer(self.cola_FH, dtype=np.int32),
+            "eventos/cola_B": np.frombuffer(self.cola_B, dtype=np.int32),
+        }
+        for nombre, _, tipo in COLUMNAS_EVENTOS:
+            tablas[f"eventos/{nombre}"] = np.frombuffer(
+                self.columnas[nombre], dtype=np.float64 if tipo == 'd' else np.int64
+            )
+
+        def tiempo(valor):
+            return NAN if valor is None else valor
+
+        tablas["equipos/tipo"] = np.array([CODIGOS_TIPO_EQUIPO[e.tipo] for e in self.equipos], dtype=np.int8)
+        tablas["equipos/numero"] = np.array([e.id_num for e in self.equipos], dtype=np.int64)
+        tablas["equipos/llegada"] = np.array([e.tiempo_llegada for e in self.equipos], dtype=np.float64)
+        tablas["equipos/inicio_juego"] = np.array([tiempo(e.tiempo_inicio_juego) for e in self.equipos], dtype=np.float64)
+        tablas["equipos/fin_juego"] = np.array([tiempo(e.tiempo_fin_juego) for e in self.equipos], dtype=np.float64)
+        tablas["equipos/espera"] = np.array(
+            [e.tiempo_espera if e.tiempo_inicio_juego is not None else NAN for e in self.equipos],
+            dtype=np.float64
+        )
+
+        # Referencias de códigos para poder decodificar el archivo sin el simulador
+        tablas["codigos/evento"] = np.array(list(CODIGOS_EVENTO))
+        tablas["codigos/estado_servidor"] = np.array(list(CODIGOS_SERVIDOR))
+        tablas["codigos/tipo_equipo"] = np.array(list(CODIGOS_TIPO_EQUIPO))
+
+        ruta_archivo = ruta_con_timestamp(self.carpeta, "npz")
+        np.savez_compressed(ruta_archivo, **tablas)
+        return ruta_archivo
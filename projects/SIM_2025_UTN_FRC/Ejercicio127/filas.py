@@ -0,0 +1,234 @@
+from collections import namedtuple
+from typing import Dict, Iterable, List, Optional
+
+from bitacora import BitacoraEquipos, VistaEquipos
+
+# ============================
+# Filas del vector de estado
+# ============================
+
+# Fila cruda: solo números, textos e ids tal como están en el estado. El
+# redondeo y el armado de textos se hacen recién al mostrarla o exportarla.
+FilaCruda = namedtuple("FilaCruda", [
+    "iteracion", "evento_actual", "reloj",
+
+    # Llegadas
+    "rnd_handball_1", "rnd_handball_2", "z_handball_0", "z_handball_1",
+    "hay_z_disponible_handball", "tiempo_prox_handball", "prox_llegada_handball",
+    "rnd_football", "tiempo_prox_football", "prox_llegada_football",
+    "rnd_basketball_1", "rnd_basketball_2", "z_basketball_0", "z_basketball_1",
+    "hay_z_disponible_basketball", "tiempo_prox_basketball", "prox_llegada_basketball",
+
+    # Ocupación
+    "rnd_ocupacion_handball_1", "rnd_ocupacion_handball_2",
+    "tmp_handball_1_disponible", "tmp_handball_2_disponible",
+    "rnd_ocupacion_football_1", "rnd_ocupacion_football_2",
+    "tmp_football_1_disponible", "tmp_football_2_disponible",
+    "rnd_ocupacion_basketball_1", "rnd_ocupacion_basketball_2",
+    "tmp_basketball_1_disponible", "tmp_basketball_2_disponible",
+
+    # Colas (tuplas de ids) y canchas: una tupla (estado, ids, prox_fin_juego) por cancha
+    "cola_handball_football", "cola_basketball",
+    "canchas",
+
+    # Estadísticas
+    "equipos_handball_atendidos", "tiempo_espera_handball",
+    "equipos_football_atendidos", "tiempo_espera_football",
+    "equipos_basketball_atendidos", "tiempo_espera_basketball",
+
+    # Equipos: bitácora del ciclo de vida (None sin trazabilidad), transiciones
+    # registradas hasta esta fila y cantidad total
+    "bitacora", "transiciones", "equipos_lista",
+])
+
+
+def capturar_fila(estado, iteracion: int, bitacora: Optional[BitacoraEquipos] = None) -> FilaCruda:
+    """Toma una foto cruda del estado (sin redondeos ni textos)"""
+    return FilaCruda(
+        iteracion, estado.evento_actual, estado.reloj,
+
+        estado.rnd_handball_1, estado.rnd_handball_2, estado.z_handball_0, estado.z_handball_1,
+        estado.hay_z_disponible_handball, estado.tiempo_prox_handball, estado.prox_llegada_handball,
+        estado.rnd_football, estado.tiempo_prox_football, estado.prox_llegada_football,
+        estado.rnd_basketball_1, estado.rnd_basketball_2, estado.z_basketball_0, estado.z_basketball_1,
+        estado.hay_z_disponible_basketball, estado.tiempo_prox_basketball, estado.prox_llegada_basketball,
+
+        estado.rnd_ocupacion_handball_1, estado.rnd_ocupacion_handball_2,
+        estado.tmp_handball_1_disponible, estado.tmp_handball_2_disponible,
+        estado.rnd_ocupacion_football_1, estado.rnd_ocupacion_football_2,
+        estado.tmp_football_1_disponible, estado.tmp_football_2_disponible,
+        estado.rnd_ocupacion_basketball_1, estado.rnd_ocupacion_basketball_2,
+        estado.tmp_basketball_1_disponible, estado.tmp_basketball_2_disponible,
+
+        tuple(e.id for e in estado.cola_handball_football),
+        tuple(e.id for e in estado.cola_basketball),
+        tuple(estado.fotos_canchas),
+
+        estado.equipos_handball_atendidos, estado.tiempo_espera_handball,
+        estado.equipos_football_atendidos, estado.tiempo_espera_football,
+        estado.equipos_basketball_atendidos, estado.tiempo_espera_basketball,
+
+        bitacora, len(bitacora) if bitacora is not None else 0,
+        estado.equipos_creados,
+    )
+
+
+def formatear_fila(fila: FilaCruda, vista: Optional[VistaEquipos] = None) -> Dict:
+    """Convierte una fila cruda en la fila legible del vector de resultados.
+
+    vista permite reutilizar la reproducción de la bitácora entre filas
+    consecutivas (ver formatear_filas).
+    """
+
+    # =============================
+    # Formateo de colas
+    # =============================
+    cola_fh = ", ".join(fila.cola_handball_football)
+    cola_b = ", ".join(fila.cola_basketball)
+
+    # =============================
+    # Canchas (separadas por " | " si hay más de una)
+    # =============================
+    estado_servidor = " | ".join(cancha[0] for cancha in fila.canchas)
+    equipos_actuales = " | ".join(", ".join(cancha[1]) for cancha in fila.canchas)
+    prox_fin_juego = min(cancha[2] for cancha in fila.canchas)
+
+    # =============================
+    # Z usados Handball
+    # =============================
+    if fila.hay_z_disponible_handball:
+        z_handball_usado = (
+            fila.z_handball_1
+            if fila.z_handball_1 is not None
+            else fila.z_handball_0
+        )
+    else:
+        z_handball_usado = fila.z_handball_0
+
+    # =============================
+    # Z usados Basketball
+    # =============================
+    if fila.hay_z_disponible_basketball:
+        z_basketball_usado = (
+            fila.z_basketball_1
+            if fila.z_basketball_1 is not None
+            else fila.z_basketball_0
+        )
+    else:
+        z_basketball_usado = fila.z_basketball_0
+
+    # =============================
+    # Equipos (reconstruidos desde la bitácora)
+    # =============================
+    if fila.bitacora is None:
+        equipos = []
+    else:
+        if vista is None or vista.bitacora is not fila.bitacora:
+            vista = VistaEquipos(fila.bitacora)
+        equipos = [(eq_id, eq_estado, round(llegada, 2))
+                   for eq_id, eq_estado, llegada in vista.avanzar(fila.transiciones)]
+
+    # =============================
+    # Vector
+    # =============================
+    return {
+        "Iteracion": fila.iteracion,
+        "Evento": fila.evento_actual,
+        "Reloj (min)": round(fila.reloj, 2),
+        "Reloj (h)": round(fila.reloj / 60, 2),
+
+        # ---------- Handball ----------
+        "RND1_H": round(fila.rnd_handball_1, 4) if fila.rnd_handball_1 is not None else "",
+        "RND2_H": round(fila.rnd_handball_2, 4) if fila.rnd_handball_2 is not None else "",
+        "Z0_H": round(fila.z_handball_0, 4) if fila.z_handball_0 is not None else "",
+        "Z1_H": round(fila.z_handball_1, 4) if fila.z_handball_1 is not None else "",
+        "Z_Usado_H": round(z_handball_usado, 4) if z_handball_usado is not None else "",
+        "Tmp_Prox_H": round(fila.tiempo_prox_handball, 2) if fila.tiempo_prox_handball is not None else "",
+        "Prox_Llegada_H": round(fila.prox_llegada_handball, 2)
+        if fila.prox_llegada_handball != float("inf") else "",
+
+        # ---------- Football ----------
+        "RND_F": round(fila.rnd_football, 4) if fila.rnd_football is not None else "",
+        "Tmp_Prox_F": round(fila.tiempo_prox_football, 2) if fila.tiempo_prox_football is not None else "",
+        "Prox_Llegada_F": round(fila.prox_llegada_football, 2)
+        if fila.prox_llegada_football != float("inf") else "",
+
+        # ---------- Basketball ----------
+        "RND1_B": round(fila.rnd_basketball_1, 4) if fila.rnd_basketball_1 is not None else "",
+        "RND2_B": round(fila.rnd_basketball_2, 4) if fila.rnd_basketball_2 is not None else "",
+        "Z0_B": round(fila.z_basketball_0, 4) if fila.z_basketball_0 is not None else "",
+        "Z1_B": round(fila.z_basketball_1, 4) if fila.z_basketball_1 is not None else "",
+        "Z_Usado_B": round(z_basketball_usado, 4) if z_basketball_usado is not None else "",
+        "Tmp_Prox_B": round(fila.tiempo_prox_basketball, 2) if fila.tiempo_prox_basketball is not None else "",
+        "Prox_Llegada_B": round(fila.prox_llegada_basketball, 2)
+        if fila.prox_llegada_basketball != float("inf") else "",
+
+        # ---------- Ocupación Handball ----------
+        "RND1_Ocup_H": round(fila.rnd_ocupacion_handball_1, 4)
+            if fila.rnd_ocupacion_handball_1 is not None else "",
+        "RND2_Ocup_H": round(fila.rnd_ocupacion_handball_2, 4)
+            if fila.rnd_ocupacion_handball_2 is not None else "",
+        "TMP1_Ocup_H": round(fila.tmp_handball_1_disponible, 2)
+            if fila.tmp_handball_1_disponible is not None else "",
+        "TMP2_Ocup_H": round(fila.tmp_handball_2_disponible, 2)
+            if fila.tmp_handball_2_disponible is not None else "",
+
+        # ---------- Ocupación Football ----------
+        "RND1_Ocup_F": round(fila.rnd_ocupacion_football_1, 4)
+            if fila.rnd_ocupacion_football_1 is not None else "",
+        "RND2_Ocup_F": round(fila.rnd_ocupacion_football_2, 4)
+            if fila.rnd_ocupacion_football_2 is not None else "",
+        "TMP1_Ocup_F": round(fila.tmp_football_1_disponible, 2)
+            if fila.tmp_football_1_disponible is not None else "",
+        "TMP2_Ocup_F": round(fila.tmp_football_2_disponible, 2)
+            if fila.tmp_football_2_disponible is not None else "",
+
+        # ---------- Ocupación Basketball ----------
+        "RND1_Ocup_B": round(fila.rnd_ocupacion_basketball_1, 4)
+            if fila.rnd_ocupacion_basketball_1 is not None else "",
+        "RND2_Ocup_B": round(fila.rnd_ocupacion_basketball_2, 4)
+            if fila.rnd_ocupacion_basketball_2 is not None else "",
+        "TMP1_Ocup_B": round(fila.tmp_basketball_1_disponible, 2)
+            if fila.tmp_basketball_1_disponible is not None else "",
+        "TMP2_Ocup_B": round(fila.tmp_basketball_2_disponible, 2)
+            if fila.tmp_basketball_2_disponible is not None else "",
+
+        # ---------- Ocupación ----------
+        "Proximo_Fin_Juego": round(prox_fin_juego, 2)
+        if prox_fin_juego != float("inf") else "",
+
+        # ---------- Colas ----------
+        "Cola_FH": cola_fh,
+        "Cola_B": cola_b,
+
+        # ---------- Servidor ----------
+        "Estado_Servidor": estado_servidor,
+        "Equipos_Actuales": equipos_actuales,
+
+        # ---------- Estadísticas ----------
+        "Cant_H_Atend": fila.equipos_handball_atendidos,
+        "Acu_Espera_H": round(fila.tiempo_espera_handball, 2),
+        "Cant_F_Atend": fila.equipos_football_atendidos,
+        "Acu_Espera_F": round(fila.tiempo_espera_football, 2),
+        "Cant_B_Atend": fila.equipos_basketball_atendidos,
+        "Acu_Espera_B": round(fila.tiempo_espera_basketball, 2),
+
+        # ---------- Equipos ----------
+        "Equipos": equipos,
+
+        # ---------- Control ----------
+        "Equipos_Lista": fila.equipos_lista,
+        "Z_Disp_H": fila.hay_z_disponible_handball,
+        "Z_Disp_B": fila.hay_z_disponible_basketball,
+    }
+
+
+def formatear_filas(filas: Iterable[FilaCruda]) -> List[Dict]:
+    """Formatea filas en orden reproduciendo la bitácora una sola vez"""
+    vista = None
+    formateadas = []
+    for fila in filas:
+        if fila.bitacora is not None and (vista is None or vista.bitacora is not fila.bitacora):
+            vista = VistaEquipos(fila.bitacora)
+        formateadas.append(formatear_fila(fila, vista))
+    return formateadas
@@ -0,0 +1,134 @@
+import cProfile
+import io
+import pstats
+from time import perf_counter
+from typing import Dict, Tuple
+
+# ============================
+# Instrumentación del simulador
+# ============================
+
+# Etapas medidas en cada paso del bucle: (clave, descripción)
+ETAPAS = [
+    ("paso", "ejecutar_paso (copia, selección del evento y manejador)"),
+    ("manejadores", "  manejadores de eventos"),
+    ("aleatorios", "    generación de números aleatorios"),
+    ("estadisticas", "Estadísticas en línea"),
+    ("captura_filas", "Captura de filas"),
+    ("retencion_exportacion", "Retención y exportación de filas"),
+    ("cierre_exportacion", "Cierre de archivos exportados"),
+]
+
+# Manejador que atiende cada tipo de evento
+MANEJADORES = {
+    "Llegada_H": "manejar_llegada",
+    "Llegada_F": "manejar_llegada",
+    "Llegada_B": "manejar_llegada",
+    "Fin_Juego": "manejar_fin_juego",
+    "Fin_Acondicionamiento": "manejar_fin_acondicionamiento",
+}
+
+
+class Instrumentacion:
+    """Cantidades y tiempos acumulados (en segundos) de una corrida.
+
+    Se activa con SimuladorVectorial.instrumentar; sin ella el bucle no mide
+    nada. Los tiempos incluyen el costo de medir (unas decenas de ns por
+    medición), así que sirven para comparar etapas y versiones, no como
+    valores absolutos.
+    """
+    def __init__(self):
+        self.eventos: Dict[str, list] = {}        # evento -> [cantidad, segundos]
+        self.tiempos = {etapa: 0.0 for etapa, _ in ETAPAS}
+        self.llamadas_aleatorios = 0
+        self.pasos = 0
+        self.tiempo_total = 0.0                   # duración del bucle de eventos
+
+    def medir(self, etapa: str, funcion, *args):
+        """Llama a funcion(*args) sumando su duración a la etapa"""
+        inicio = perf_counter()
+        resultado = funcion(*args)
+        self.tiempos[etapa] += perf_counter() - inicio
+        return resultado
+
+    def registrar_evento(self, evento: str, segundos: float):
+        acumulado = self.eventos.get(evento)
+        if acumulado is None:
+            acumulado = self.eventos[evento] = [0, 0.0]
+        acumulado[0] += 1
+        acumulado[1] += segundos
+        self.tiempos["manejadores"] += segundos
+
+    def resumen(self) -> Dict:
+        """Datos estructurados de la medición (para JSON o para comparar corridas)"""
+        return {
+            "pasos": self.pasos,
+            "tiempo_total": self.tiempo_total,
+            "eventos_por_segundo": self.pasos / self.tiempo_total if self.tiempo_total > 0 else 0.0,
+            "tiempos": dict(self.tiempos),
+            "llamadas_aleatorios": self.llamadas_aleatorios,
+            "eventos": {
+                evento: {
+                    "manejador": MANEJADORES.get(evento, ""),
+                    "cantidad": cantidad,
+                    "tiempo": segundos,
+                    "tiempo_medio_us": segundos / cantidad * 1e6 if cantidad else 0.0,
+                }
+                for evento, (cantidad, segundos) in sorted(self.eventos.items())
+            },
+        }
+
+    def mostrar(self):
+        """Imprime el reporte de rendimiento"""
+        resumen = self.resumen()
+        total = resumen["tiempo_total"]
+
+        print("\n--- RENDIMIENTO DEL SIMULADOR ---")
+        print(f"Pasos: {resumen['pasos']} en {total:.3f} s "
+              f"({resumen['eventos_por_segundo']:,.0f} eventos/s)")
+
+        print("\nTiempo por etapa:")
+        for etapa, descripcion in ETAPAS:
+            segundos = resumen["tiempos"][etapa]
+            porcentaje = f"{segundos / total:6.1%}" if total > 0 else "     -"
+            print(f"  {descripcion:<56} {segundos:9.4f} s {porcentaje}")
+        print(f"  (llamadas al generador: {resumen['llamadas_aleatorios']})")
+
+        print("\nManejadores por tipo de evento:")
+        for evento, datos in resumen["eventos"].items():
+            print(f"  {evento:<22} {datos['manejador']:<30} {datos['cantidad']:>9} eventos "
+                  f"{datos['tiempo']:9.4f} s {datos['tiempo_medio_us']:8.2f} µs/evento")
+
+
+class AleatoriosMedidos:
+    """Envuelve una fuente de números aleatorios midiendo sus llamadas.
+
+    El simulador la coloca solo mientras corre el bucle instrumentado y la
+    quita al terminar; los puntos de control guardan la fuente original.
+    """
+    def __init__(self, origen, instrumentacion: Instrumentacion):
+        self.origen = origen
+        self.instrumentacion = instrumentacion
+
+    def rnd(self, fuente: str) -> float:
+        inicio = perf_counter()
+        valor = self.origen.rnd(fuente)
+        self.instrumentacion.tiempos["aleatorios"] += perf_counter() - inicio
+        self.instrumentacion.llamadas_aleatorios += 1
+        return valor
+
+    def par_box_muller(self, fuente: str) -> Tuple[float, float, float, float]:
+        inicio = perf_counter()
+        valores = self.origen.par_box_muller(fuente)
+        self.instrumentacion.tiempos["aleatorios"] += perf_counter() - inicio
+        self.instrumentacion.llamadas_aleatorios += 1
+        return valores
+
+
+def perfilar(funcion, *args, lineas: int = 25, orden: str = "cumulative"):
+    """Corre funcion(*args) bajo cProfile y devuelve (resultado, texto del perfil)"""
+    perfil = cProfile.Profile()
+    resultado = perfil.runcall(funcion, *args)
+    salida = io.StringIO()
+    pstats.Stats(perfil, stream=salida).sort_stats(orden).print_stats(lineas)
+    return resultado, salida.getvalue()
@@ -1,6 +1,6 @@
 from menu import *
 from simulador import SimuladorVectorial
-import random
+from distribuciones import AleatoriosIndependientes
 
 # ============================
 # Ejecución principal
@@ -29,12 +29,9 @@ if __name__ == "__main__":
         # Configuraciones comunes
         mostrar_primeras = configurar_visualizacion()
         semilla = configurar_semilla()
-        
-        # Configurar semilla si se especificó
-        if semilla is not None:
-            random.seed(semilla)
 
         exportar_csv = configurar_exportacion_csv()
+        exportar_columnar = configurar_exportacion_columnar()
         
         # Crear simulador
         simulador = SimuladorVectorial()
@@ -42,6 +39,11 @@ if __name__ == "__main__":
         simulador.limite_tiempo = limite_tiempo
         simulador.limite_iteraciones = limite_iteraciones
         simulador.exportar_csv = exportar_csv
+        simulador.exportar_columnar = exportar_columnar
+        simulador.modo_estado = 'en_sitio'  # Solo se necesitan las filas, no el historial de estados
+        # Un generador independiente por fuente (llegadas y ocupaciones) a partir de la semilla.
+        # Sin numpy y con las trayectorias de referencia; AleatoriosPorLotes es opcional (cli.py --generador lotes)
+        simulador.aleatorios = AleatoriosIndependientes(semilla)
 
         # Ejecutar simulación
         print("\n" + "="*80)
@@ -106,3 +106,11 @@ def configurar_exportacion_csv():
         if opcion in ("s", "n"):
             return opcion == "s"
         print("Por favor responda 's' o 'n'.")
+
+def configurar_exportacion_columnar():
+    """Pregunta si se desea exportar las tablas columnares (.npz)"""
+    while True:
+        opcion = input("¿Desea generar tablas columnares .npz (requiere numpy)? (s/n): ").strip().lower()
+        if opcion in ("s", "n"):
+            return opcion == "s"
+        print("Por favor responda 's' o 'n'.")
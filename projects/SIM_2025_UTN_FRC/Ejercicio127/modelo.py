@@ -0,0 +1,60 @@
+import json
+from dataclasses import dataclass, asdict, fields
+from typing import Dict
+
+# ============================
+# Parámetros del modelo
+# ============================
+
+@dataclass
+class ModeloConfig:
+    """Parámetros del polideportivo (llegadas en horas, ocupaciones en minutos).
+
+    Los valores por defecto son los del enunciado.
+    """
+    # Llegadas de handball: normal, la primera con otra media
+    llegada_handball_primera_media: float = 12
+    llegada_handball_primera_desvio: float = 2
+    llegada_handball_media: float = 6
+    llegada_handball_desvio: float = 2
+
+    # Llegadas de football: exponencial negativa
+    llegada_football_media: float = 10
+
+    # Llegadas de basketball: normal
+    llegada_basketball_media: float = 8
+    llegada_basketball_desvio: float = 2
+
+    # Ocupación de la cancha: normal (minutos)
+    ocupacion_handball_media: float = 80
+    ocupacion_handball_desvio: float = 20
+    ocupacion_football_media: float = 90
+    ocupacion_football_desvio: float = 10
+    ocupacion_basketball_media: float = 100
+    ocupacion_basketball_desvio: float = 30
+
+    # Acondicionamiento al cambiar de disciplina (minutos)
+    tiempo_acondicionamiento: float = 10
+
+    # Cantidad de canchas (servidores)
+    cantidad_canchas: int = 1
+
+    def validar(self):
+        for campo in fields(self):
+            valor = getattr(self, campo.name)
+            # bool es subclase de int: un true de JSON no es un número válido
+            if isinstance(valor, bool) or not isinstance(valor, (int, float)) or valor < 0:
+                raise ValueError(f"{campo.name} debe ser un número mayor o igual a 0")
+        if self.llegada_football_media == 0:
+            raise ValueError("llegada_football_media debe ser mayor que 0")
+        if self.cantidad_canchas < 1 or self.cantidad_canchas != int(self.cantidad_canchas):
+            raise ValueError("cantidad_canchas debe ser un entero mayor o igual a 1")
+
+    def a_dict(self) -> Dict:
+        return asdict(self)
+
+
+def cargar_modelo(ruta: str) -> ModeloConfig:
+    """Lee los parámetros del modelo desde un archivo JSON"""
+    with open(ruta, encoding="utf-8") as archivo:
+        return ModeloConfig(**json.load(archivo))
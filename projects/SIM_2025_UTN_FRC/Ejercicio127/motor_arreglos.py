@@ -0,0 +1,833 @@
+import math
+from collections import namedtuple
+from typing import Dict, Iterator, Optional
+
+from api import ConfiguracionEjecucion, crear_aleatorios
+from distribuciones import FUENTES, FUENTES_NORMALES, AleatoriosIndependientes
+from estado import CODIGOS_SERVIDOR, EstadoSimulacion
+from estadisticas import SITUACIONES_CANCHA
+from eventos import CODIGOS_EVENTO
+from exportadores import CODIGOS_TIPO_EQUIPO
+from politicas import crear_politica
+
+try:
+    from numba import njit
+except ImportError:  # sin Numba el mismo código corre en Python (lento, útil para depurar)
+    njit = None
+
+
+def compilable(funcion):
+    """Compila la función con Numba si está instalado; si no, la deja en Python.
+
+    Sin el runtime de memoria de Numba (_nrt=False): el núcleo no crea
+    arreglos, y así cada llamada no cuenta referencias de los que recibe
+    (eran ~90% del tiempo por evento).
+    """
+    return njit(cache=True, _nrt=False)(funcion) if njit is not None else funcion
+
+# ============================
+# Motor de arreglos: estado de tamaño fijo y códigos enteros
+# ============================
+#
+# Misma trayectoria que SimuladorVectorial (se comprueba con verificador.py),
+# pero el estado vive en arreglos de NumPy y eventos, disciplinas y estados
+# de cancha son códigos enteros, así el bucle de eventos se compila con
+# Numba. Los equipos no son objetos: la cola guarda (tipo, número, llegada)
+# y no hay bitácora ni filas, solo los indicadores finales.
+
+INF = math.inf
+NAN = math.nan
+
+# Códigos de evento, disciplina y estado de cancha (los mismos de la
+# exportación columnar)
+INICIO = CODIGOS_EVENTO["Inicio"]
+LLEGADA_H = CODIGOS_EVENTO["Llegada_H"]
+LLEGADA_B = CODIGOS_EVENTO["Llegada_B"]
+FIN_JUEGO = CODIGOS_EVENTO["Fin_Juego"]
+FIN_ACONDICIONAMIENTO = CODIGOS_EVENTO["Fin_Acondicionamiento"]
+FIN = CODIGOS_EVENTO["Fin"]
+
+H = CODIGOS_TIPO_EQUIPO["H"]
+F = CODIGOS_TIPO_EQUIPO["F"]
+B = CODIGOS_TIPO_EQUIPO["B"]
+DISCIPLINAS = ("H", "F", "B")    # por código
+
+LIBRE = CODIGOS_SERVIDOR["Libre"]
+ACONDICIONAMIENTO = CODIGOS_SERVIDOR["Acondicionamiento"]
+OCUPADO = (CODIGOS_SERVIDOR["Ocupado_H"], CODIGOS_SERVIDOR["Ocupado_F"], CODIGOS_SERVIDOR["Ocupado_B"])
+
+# El bucle supone llegadas consecutivas en el orden de las disciplinas
+assert [CODIGOS_EVENTO[f"Llegada_{d}"] - LLEGADA_H for d in DISCIPLINAS] == [H, F, B]
+# y fuentes en el orden llegada_H, llegada_F, llegada_B, ocupacion_H, ...
+assert FUENTES == tuple(f"{grupo}_{d}" for grupo in ("llegada", "ocupacion") for d in DISCIPLINAS)
+FUENTE_OCUPACION = len(DISCIPLINAS)
+
+# Políticas de asignación compiladas
+CODIGOS_POLITICA = {
+    "referencia": 0,
+    "menos_acondicionamientos": 1,
+    "trabajo_mas_corto": 2,
+    "equitativa": 3,
+}
+REFERENCIA, MENOS_ACONDICIONAMIENTOS, TRABAJO_MAS_CORTO, EQUITATIVA = range(4)
+
+# Colas (primer índice de los arreglos de colas)
+COLA_FH, COLA_B = 0, 1
+
+# enteros: escalares enteros del estado (los de a 3 se indexan con + disciplina)
+E_EVENTO = 0
+E_ITERACION = 1
+E_OCUPADAS = 2
+E_ACONDICIONAMIENTO = 3
+E_Z_DISPONIBLE = 4          # + disciplina (H y B)
+E_TMP2_USADO = 7            # + disciplina
+E_ATENDIDOS = 10            # + disciplina
+E_CONTADOR = 13             # + disciplina: número del próximo equipo
+E_COLA_INICIO = 16          # + cola
+E_COLA_LARGO = 18           # + cola
+E_POSICION_ALEATORIOS = 20  # + fuente (orden de FUENTES)
+N_ENTEROS = E_POSICION_ALEATORIOS + len(FUENTES)
+
+# reales: escalares reales
+R_RELOJ = 0
+R_PROXIMO = 1               # tiempo del próximo evento al detenerse
+N_REALES = 2
+
+# llegadas[disciplina, columna] (football solo usa RND1, TIEMPO y PROXIMA)
+L_RND1, L_RND2, L_Z0, L_Z1, L_TIEMPO, L_PROXIMA = range(6)
+# ocupacion[disciplina, columna] (NaN: vacío, None en SimuladorVectorial)
+O_RND1, O_RND2, O_TMP1, O_TMP2 = range(4)
+# espera[disciplina, columna]: acumulada y Welford (la cantidad es la de atendidos)
+S_ACUMULADA, S_MEDIA, S_M2, S_MAXIMA = range(4)
+# ponderados[indicador, columna]: promedios en el tiempo (como PromedioPonderado)
+P_AREA, P_VALOR, P_DESDE = range(3)
+PONDERADO_COLA_FH, PONDERADO_COLA_B, PONDERADO_OCUPADA, PONDERADO_ACONDICIONAMIENTO, PONDERADO_LIBRE = range(5)
+assert SITUACIONES_CANCHA == ("ocupada", "acondicionamiento", "libre")
+
+# canchas_enteros[cancha, columna] y canchas_reales[cancha, columna]; los
+# equipos de la cancha (hasta 2) van en C_NUMERO + k y C_LLEGADA + k
+C_ESTADO, C_ULTIMA, C_TIPO, C_CANTIDAD, C_NUMERO = range(5)      # C_ULTIMA = -1: sin usar
+C_FIN_JUEGO, C_FIN_ACONDICIONAMIENTO, C_LLEGADA = range(3)
+EQUIPOS_POR_CANCHA = 2
+
+# colas_enteros[cola, posición, columna]
+Q_TIPO, Q_NUMERO = range(2)
+
+# parametros: modelo en reales (+ disciplina) y pesos de la política equitativa
+M_LLEGADA_MEDIA = 0
+M_LLEGADA_DESVIO = 3
+M_OCUPACION_MEDIA = 6
+M_OCUPACION_DESVIO = 9
+M_ACONDICIONAMIENTO = 12
+M_PESO = 13
+N_PARAMETROS = 16
+
+# Causas por las que avanzar() devuelve el control
+SIN_EVENTOS, LIMITE_TIEMPO, LIMITE_ITERACIONES, PAUSA, FALTAN_ALEATORIOS, COLA_LLENA = range(6)
+
+EstadoArreglos = namedtuple("EstadoArreglos", [
+    "enteros", "reales", "llegadas", "ocupacion", "espera", "ponderados",
+    "canchas_enteros", "canchas_reales", "colas_enteros", "colas_llegada",
+    "aleatorios",   # aleatorios[fuente, i] = (rnd1, rnd2, z0, z1) o (rnd, nan, nan, nan)
+    "parametros",
+])
+
+# ============================
+# Núcleo (compilable con Numba)
+# ============================
+#
+# Las funciones reciben solo los arreglos que usan; bucle_eventos desarma
+# la tupla del estado una vez por llamada.
+
+@compilable
+def proximo_evento(llegadas, canchas_reales):
+    """(evento, tiempo, cancha) del próximo evento, con el desempate del heap
+    de ListaEventosFuturos: tiempo, prioridad del evento y número de cancha.
+    """
+    evento, tiempo, cancha = FIN, INF, 0
+    for d in range(3):
+        if llegadas[d, L_PROXIMA] < tiempo:
+            evento, tiempo = LLEGADA_H + d, llegadas[d, L_PROXIMA]
+    for c in range(canchas_reales.shape[0]):
+        if canchas_reales[c, C_FIN_JUEGO] < tiempo:
+            evento, tiempo, cancha = FIN_JUEGO, canchas_reales[c, C_FIN_JUEGO], c
+    for c in range(canchas_reales.shape[0]):
+        if canchas_reales[c, C_FIN_ACONDICIONAMIENTO] < tiempo:
+            evento, tiempo, cancha = FIN_ACONDICIONAMIENTO, canchas_reales[c, C_FIN_ACONDICIONAMIENTO], c
+    return evento, tiempo, cancha
+
+
+@compilable
+def siguiente_aleatorio(enteros, fuente):
+    """Posición en aleatorios del próximo valor de la fuente"""
+    posicion = enteros[E_POSICION_ALEATORIOS + fuente]
+    enteros[E_POSICION_ALEATORIOS + fuente] = posicion + 1
+    return posicion
+
+
+@compilable
+def indice_cola(enteros, colas_llegada, cola, posicion):
+    return (enteros[E_COLA_INICIO + cola] + posicion) % colas_llegada.shape[1]
+
+
+@compilable
+def encolar(enteros, colas_enteros, colas_llegada, cola, tipo, numero, llegada):
+    i = indice_cola(enteros, colas_llegada, cola, enteros[E_COLA_LARGO + cola])
+    colas_enteros[cola, i, Q_TIPO] = tipo
+    colas_enteros[cola, i, Q_NUMERO] = numero
+    colas_llegada[cola, i] = llegada
+    enteros[E_COLA_LARGO + cola] += 1
+
+
+@compilable
+def quitar(enteros, colas_enteros, colas_llegada, cola, posicion):
+    """Quita el equipo en `posicion` de la cola y devuelve (número, llegada)"""
+    i = indice_cola(enteros, colas_llegada, cola, posicion)
+    numero, llegada = colas_enteros[cola, i, Q_NUMERO], colas_llegada[cola, i]
+    largo = enteros[E_COLA_LARGO + cola]
+    if posicion == 0:
+        enteros[E_COLA_INICIO + cola] = indice_cola(enteros, colas_llegada, cola, 1)
+    else:
+        # Los que estaban detrás avanzan un lugar
+        for p in range(posicion, largo - 1):
+            destino = indice_cola(enteros, colas_llegada, cola, p)
+            origen = indice_cola(enteros, colas_llegada, cola, p + 1)
+            colas_enteros[cola, destino, Q_TIPO] = colas_enteros[cola, origen, Q_TIPO]
+            colas_enteros[cola, destino, Q_NUMERO] = colas_enteros[cola, origen, Q_NUMERO]
+            colas_llegada[cola, destino] = colas_llegada[cola, origen]
+    enteros[E_COLA_LARGO + cola] = largo - 1
+    return numero, llegada
+
+
+@compilable
+def tiempo_ocupacion(enteros, ocupacion, aleatorios, parametros, d):
+    """Como obtener_tiempo_ocupacion_*: usa TMP2 si está disponible o genera un par"""
+    if not math.isnan(ocupacion[d, O_TMP2]):
+        enteros[E_TMP2_USADO + d] = 1
+        return ocupacion[d, O_TMP2]
+
+    fuente = FUENTE_OCUPACION + d
+    i = siguiente_aleatorio(enteros, fuente)
+    media, desvio = parametros[M_OCUPACION_MEDIA + d], parametros[M_OCUPACION_DESVIO + d]
+    ocupacion[d, O_RND1] = aleatorios[fuente, i, 0]
+    ocupacion[d, O_RND2] = aleatorios[fuente, i, 1]
+    # ocupacion_normal_box_muller: max(0, media + desvio * z)
+    tiempo = media + desvio * aleatorios[fuente, i, 2]
+    ocupacion[d, O_TMP1] = tiempo if tiempo > 0 else 0.0
+    tiempo = media + desvio * aleatorios[fuente, i, 3]
+    ocupacion[d, O_TMP2] = tiempo if tiempo > 0 else 0.0
+    return ocupacion[d, O_TMP1]
+
+
+@compilable
+def iniciar_servicio(enteros, espera, reloj, d, llegada):
+    """Acumula la espera del equipo (suma y Welford, en el orden de EstadisticasEnLinea)"""
+    valor = reloj - llegada
+    n = enteros[E_ATENDIDOS + d] + 1
+    delta = valor - espera[d, S_MEDIA]
+    espera[d, S_MEDIA] += delta / n
+    espera[d, S_M2] += delta * (valor - espera[d, S_MEDIA])
+    if valor > espera[d, S_MAXIMA]:
+        espera[d, S_MAXIMA] = valor
+    enteros[E_ATENDIDOS + d] = n
+    espera[d, S_ACUMULADA] += valor
+
+
+@compilable
+def sin_acondicionamiento(canchas_enteros, d):
+    """Cancha libre de menor número donde `d` no requiere acondicionamiento (-1 si no hay)"""
+    for c in range(canchas_enteros.shape[0]):
+        ultima = canchas_enteros[c, C_ULTIMA]
+        if canchas_enteros[c, C_ESTADO] == LIBRE and (ultima == d or ultima < 0):
+            return c
+    return -1
+
+
+@compilable
+def tomar_cancha(canchas_enteros, d):
+    """Como CanchasLibres.tomar: la libre de menor número sin acondicionamiento
+    para `d` y, si no hay, la libre de menor número.
+    """
+    c = sin_acondicionamiento(canchas_enteros, d)
+    if c >= 0:
+        return c
+    for c in range(canchas_enteros.shape[0]):
+        if canchas_enteros[c, C_ESTADO] == LIBRE:
+            return c
+    return -1
+
+
+@compilable
+def iniciar_juego(enteros, reloj, ocupacion, espera, canchas_enteros, canchas_reales, aleatorios, parametros, c, d):
+    """Los equipos ya cargados en la cancha empiezan a jugar (o a esperar el acondicionamiento)"""
+    ultima = canchas_enteros[c, C_ULTIMA]
+    if ultima >= 0 and ultima != d:
+        canchas_enteros[c, C_ESTADO] = ACONDICIONAMIENTO
+        canchas_reales[c, C_FIN_ACONDICIONAMIENTO] = reloj + parametros[M_ACONDICIONAMIENTO]
+        enteros[E_ACONDICIONAMIENTO] += 1
+        return
+
+    for k in range(canchas_enteros[c, C_CANTIDAD]):
+        iniciar_servicio(enteros, espera, reloj, d, canchas_reales[c, C_LLEGADA + k])
+    canchas_enteros[c, C_ESTADO] = OCUPADO[d]
+    canchas_reales[c, C_FIN_JUEGO] = reloj + tiempo_ocupacion(enteros, ocupacion, aleatorios, parametros, d)
+    enteros[E_OCUPADAS] += 1
+
+
+@compilable
+def candidatos(enteros, colas_enteros, colas_llegada):
+    """Como PoliticaAsignacion.candidatos: posición del primer H y del primer F
+    en la cola F/H (-1 si no hay) y si puede empezar basketball.
+    """
+    posicion_h, posicion_f = -1, -1
+    for p in range(enteros[E_COLA_LARGO + COLA_FH]):
+        tipo = colas_enteros[COLA_FH, indice_cola(enteros, colas_llegada, COLA_FH, p), Q_TIPO]
+        if tipo == H and posicion_h < 0:
+            posicion_h = p
+        elif tipo == F and posicion_f < 0:
+            posicion_f = p
+        if posicion_h >= 0 and posicion_f >= 0:
+            break
+    largo_b = enteros[E_COLA_LARGO + COLA_B]
+    hay_b = largo_b >= 2 or (largo_b == 1 and enteros[E_COLA_LARGO + COLA_FH] == 0)
+    return posicion_h, posicion_f, hay_b
+
+
+@compilable
+def seleccion_referencia(enteros, colas_enteros, colas_llegada):
+    largo_fh, largo_b = enteros[E_COLA_LARGO + COLA_FH], enteros[E_COLA_LARGO + COLA_B]
+    if largo_fh == 0 and largo_b == 0:
+        return -1, 0
+    if largo_b >= 2 or (largo_b == 1 and largo_fh == 0):
+        return B, 0
+    return colas_enteros[COLA_FH, indice_cola(enteros, colas_llegada, COLA_FH, 0), Q_TIPO], 0
+
+
+@compilable
+def seleccionar(enteros, reloj, canchas_enteros, colas_enteros, colas_llegada, parametros, politica):
+    """(disciplina, posición en su cola) que pasa a una cancha, o (-1, 0)"""
+    if politica == REFERENCIA:
+        return seleccion_referencia(enteros, colas_enteros, colas_llegada)
+
+    posicion_h, posicion_f, hay_b = candidatos(enteros, colas_enteros, colas_llegada)
+    # Candidatos en el orden del diccionario de las políticas: H y F según
+    # su posición en la cola, después B (posición -1: no es candidato)
+    orden_d, orden_posicion = (H, F, B), (posicion_h, posicion_f, 0 if hay_b else -1)
+    if posicion_f >= 0 and (posicion_h < 0 or posicion_f < posicion_h):
+        orden_d, orden_posicion = (F, H, B), (posicion_f, posicion_h, 0 if hay_b else -1)
+
+    if politica == MENOS_ACONDICIONAMIENTOS:
+        # B primero, luego F/H por posición
+        if hay_b and sin_acondicionamiento(canchas_enteros, B) >= 0:
+            return B, 0
+        for k in range(2):
+            if orden_posicion[k] >= 0 and sin_acondicionamiento(canchas_enteros, orden_d[k]) >= 0:
+                return orden_d[k], orden_posicion[k]
+        return seleccion_referencia(enteros, colas_enteros, colas_llegada)
+
+    elegida, posicion_elegida = -1, 0
+    mejor_costo, mejor_desempate = INF, INF
+    for k in range(3):
+        d, posicion = orden_d[k], orden_posicion[k]
+        if posicion < 0:
+            continue
+        if politica == TRABAJO_MAS_CORTO:
+            costo = parametros[M_OCUPACION_MEDIA + d]
+            if sin_acondicionamiento(canchas_enteros, d) < 0:
+                costo += parametros[M_ACONDICIONAMIENTO]
+            desempate = float(posicion)
+        else:  # EQUITATIVA
+            cola = COLA_B if d == B else COLA_FH
+            llegada = colas_llegada[cola, indice_cola(enteros, colas_llegada, cola, posicion)]
+            costo = -(reloj - llegada) * parametros[M_PESO + d]
+            desempate = llegada
+        if elegida < 0 or costo < mejor_costo or (costo == mejor_costo and desempate < mejor_desempate):
+            elegida, posicion_elegida = d, posicion
+            mejor_costo, mejor_desempate = costo, desempate
+    return elegida, posicion_elegida
+
+
+@compilable
+def asignar_canchas(enteros, reloj, ocupacion, espera, canchas_enteros, canchas_reales, colas_enteros,
+                    colas_llegada, aleatorios, parametros, politica):
+    """Ocupa canchas libres mientras la política elija equipos"""
+    cantidad = canchas_enteros.shape[0]
+    while cantidad - enteros[E_OCUPADAS] - enteros[E_ACONDICIONAMIENTO] > 0:
+        d, posicion = seleccionar(enteros, reloj, canchas_enteros, colas_enteros, colas_llegada, parametros,
+                                  politica)
+        if d < 0:
+            return
+        c = tomar_cancha(canchas_enteros, d)
+        if d == B:
+            n = 2 if enteros[E_COLA_LARGO + COLA_B] >= 2 else 1
+            for k in range(n):
+                numero, llegada = quitar(enteros, colas_enteros, colas_llegada, COLA_B, 0)
+                canchas_enteros[c, C_NUMERO + k] = numero
+                canchas_reales[c, C_LLEGADA + k] = llegada
+        else:
+            n = 1
+            numero, llegada = quitar(enteros, colas_enteros, colas_llegada, COLA_FH, posicion)
+            canchas_enteros[c, C_NUMERO] = numero
+            canchas_reales[c, C_LLEGADA] = llegada
+        canchas_enteros[c, C_TIPO] = d
+        canchas_enteros[c, C_CANTIDAD] = n
+        iniciar_juego(enteros, reloj, ocupacion, espera, canchas_enteros, canchas_reales, aleatorios,
+                      parametros, c, d)
+
+
+@compilable
+def programar_llegada(enteros, reloj, llegadas, aleatorios, parametros, d):
+    """Próxima llegada del mismo tipo (misma aritmética que distribuciones.py)"""
+    media, desvio = parametros[M_LLEGADA_MEDIA + d], parametros[M_LLEGADA_DESVIO + d]
+    if d == F:
+        i = siguiente_aleatorio(enteros, d)
+        rnd = aleatorios[d, i, 0]
+        llegadas[d, L_RND1] = rnd
+        tiempo = -media * 60 * math.log(1 - rnd)
+    else:
+        if enteros[E_Z_DISPONIBLE + d]:
+            z = llegadas[d, L_Z1]
+            enteros[E_Z_DISPONIBLE + d] = 0
+        else:
+            i = siguiente_aleatorio(enteros, d)
+            for k in range(4):
+                llegadas[d, L_RND1 + k] = aleatorios[d, i, k]
+            z = llegadas[d, L_Z0]
+            enteros[E_Z_DISPONIBLE + d] = 1
+        tiempo = media * 60 + desvio * 60 * z
+    llegadas[d, L_TIEMPO] = tiempo
+    llegadas[d, L_PROXIMA] = reloj + tiempo
+
+
+@compilable
+def actualizar_ponderado(ponderados, indicador, reloj, valor):
+    ponderados[indicador, P_AREA] += ponderados[indicador, P_VALOR] * (reloj - ponderados[indicador, P_DESDE])
+    ponderados[indicador, P_VALOR] = valor
+    ponderados[indicador, P_DESDE] = reloj
+
+
+@compilable
+def observar(enteros, reloj, ponderados, cantidad):
+    """Como EstadisticasEnLinea.observar: colas y situación de las canchas"""
+    ocupadas, acondicionamiento = enteros[E_OCUPADAS], enteros[E_ACONDICIONAMIENTO]
+    actualizar_ponderado(ponderados, PONDERADO_COLA_FH, reloj, enteros[E_COLA_LARGO + COLA_FH])
+    actualizar_ponderado(ponderados, PONDERADO_COLA_B, reloj, enteros[E_COLA_LARGO + COLA_B])
+    actualizar_ponderado(ponderados, PONDERADO_OCUPADA, reloj, ocupadas / cantidad)
+    actualizar_ponderado(ponderados, PONDERADO_ACONDICIONAMIENTO, reloj, acondicionamiento / cantidad)
+    actualizar_ponderado(ponderados, PONDERADO_LIBRE, reloj, (cantidad - ocupadas - acondicionamiento) / cantidad)
+
+
+@compilable
+def box_muller_lote(valores):
+    """Completa z0 y z1 de cada fila (rnd1, rnd2, z0, z1) con la misma
+    expresión que distribuciones.box_muller (math de C, no la de NumPy, que
+    puede diferir en el último bit).
+    """
+    for i in range(valores.shape[0]):
+        rnd1, rnd2 = valores[i, 0], valores[i, 1]
+        valores[i, 2] = math.sqrt(-2 * math.log(rnd1)) * math.cos(2 * math.pi * rnd2)
+        valores[i, 3] = math.sqrt(-2 * math.log(rnd1)) * math.sin(2 * math.pi * rnd2)
+
+
+@compilable
+def bucle_eventos(e, politica, limite_tiempo, limite_iteraciones, max_pasos):
+    """Corre hasta max_pasos eventos y devuelve la causa por la que se detuvo.
+
+    Cada paso sigue el orden de SimuladorVectorial.ejecutar_paso. Antes de
+    cada uno comprueba el criterio de parada y que alcancen los aleatorios
+    pre-generados y el lugar en las colas; si no, devuelve FALTAN_ALEATORIOS
+    o COLA_LLENA para que Python los amplíe y vuelva a llamar (el estado
+    queda listo para seguir).
+    """
+    enteros, reales, llegadas, ocupacion, espera, ponderados = (
+        e.enteros, e.reales, e.llegadas, e.ocupacion, e.espera, e.ponderados)
+    canchas_enteros, canchas_reales, colas_enteros, colas_llegada, aleatorios, parametros = (
+        e.canchas_enteros, e.canchas_reales, e.colas_enteros, e.colas_llegada, e.aleatorios, e.parametros)
+    cantidad_canchas = canchas_enteros.shape[0]
+    disponibles = aleatorios.shape[1]
+    capacidad = colas_llegada.shape[1]
+    pasos = 0
+    while True:
+        evento, tiempo, cancha = proximo_evento(llegadas, canchas_reales)
+        reales[R_PROXIMO] = tiempo
+        if evento == FIN:
+            return SIN_EVENTOS
+        if tiempo > limite_tiempo:
+            return LIMITE_TIEMPO
+        if enteros[E_ITERACION] >= limite_iteraciones:
+            return LIMITE_ITERACIONES
+        if pasos >= max_pasos:
+            return PAUSA
+        # Un paso consume a lo sumo un valor por fuente y por cancha que empieza
+        for fuente in range(len(FUENTES)):
+            if enteros[E_POSICION_ALEATORIOS + fuente] + cantidad_canchas >= disponibles:
+                return FALTAN_ALEATORIOS
+        for cola in range(2):
+            if enteros[E_COLA_LARGO + cola] >= capacidad:
+                return COLA_LLENA
+
+        # El TMP2 usado en el paso anterior se descarta al empezar este
+        for d in range(3):
+            if enteros[E_TMP2_USADO + d]:
+                ocupacion[d, :] = NAN
+                enteros[E_TMP2_USADO + d] = 0
+
+        reales[R_RELOJ] = tiempo
+        enteros[E_EVENTO] = evento
+        if evento <= LLEGADA_B:
+            d = evento - LLEGADA_H
+            encolar(enteros, colas_enteros, colas_llegada, COLA_B if d == B else COLA_FH, d,
+                    enteros[E_CONTADOR + d], tiempo)
+            enteros[E_CONTADOR + d] += 1
+            programar_llegada(enteros, tiempo, llegadas, aleatorios, parametros, d)
+        elif evento == FIN_JUEGO:
+            canchas_enteros[cancha, C_ULTIMA] = canchas_enteros[cancha, C_TIPO]
+            canchas_enteros[cancha, C_CANTIDAD] = 0
+            canchas_enteros[cancha, C_ESTADO] = LIBRE
+            canchas_reales[cancha, C_FIN_JUEGO] = INF
+            enteros[E_OCUPADAS] -= 1
+        else:  # FIN_ACONDICIONAMIENTO: los equipos cargados empiezan a jugar
+            canchas_enteros[cancha, C_ULTIMA] = canchas_enteros[cancha, C_TIPO]
+            canchas_reales[cancha, C_FIN_ACONDICIONAMIENTO] = INF
+            enteros[E_ACONDICIONAMIENTO] -= 1
+            iniciar_juego(enteros, tiempo, ocupacion, espera, canchas_enteros, canchas_reales, aleatorios,
+                          parametros, cancha, canchas_enteros[cancha, C_TIPO])
+        if evento != FIN_ACONDICIONAMIENTO:
+            asignar_canchas(enteros, tiempo, ocupacion, espera, canchas_enteros, canchas_reales, colas_enteros,
+                            colas_llegada, aleatorios, parametros, politica)
+
+        enteros[E_ITERACION] += 1
+        observar(enteros, tiempo, ponderados, cantidad_canchas)
+        pasos += 1
+
+# ============================
+# Simulador (Python) sobre el núcleo
+# ============================
+
+class SimuladorArreglos:
+    """Corre el modelo con el núcleo de arreglos.
+
+    Parte del mismo estado inicial que SimuladorVectorial y, con la misma
+    configuración, recorre la misma trayectoria. Sin filas, exportación ni
+    bitácora: devuelve los indicadores finales (salvo los percentiles de
+    espera). Necesita fuentes independientes ('independiente' o 'lotes')
+    porque los aleatorios se pre-generan por fuente.
+    """
+    def __init__(self, config: ConfiguracionEjecucion, tamano_lote: int = 1024, capacidad_colas: int = 64):
+        import numpy as np
+
+        config.validar()
+        if config.generador == 'global':
+            raise ValueError("El motor de arreglos pre-genera los aleatorios de cada fuente: requiere "
+                             "el generador 'independiente' o 'lotes' (con 'global' comparten una secuencia)")
+        if config.politica not in CODIGOS_POLITICA:
+            raise ValueError(f"Política sin versión compilada: {config.politica!r}")
+
+        self.config = config
+        self.modelo = config.modelo
+        self.politica = CODIGOS_POLITICA[config.politica]
+        if config.modo_parada == 'tiempo':
+            self.limite_tiempo, self.limite_iteraciones = float(config.limite_horas * 60), np.iinfo(np.int64).max
+        else:
+            self.limite_tiempo, self.limite_iteraciones = INF, config.limite_iteraciones
+        self.aleatorios = crear_aleatorios(config.generador, config.semilla)
+
+        # Estado inicial de la referencia, pasado a arreglos (el lote debe
+        # alcanzar para un paso en el que empiecen todas las canchas)
+        estado = EstadoSimulacion(aleatorios=self.aleatorios, modelo=self.modelo)
+        tamano_lote = max(tamano_lote, 2 * len(estado.canchas))
+        self.estado = estado_a_arreglos(estado, self.modelo, crear_politica(config.politica),
+                                        tamano_lote, capacidad_colas)
+        self.rellenar_aleatorios()
+        e = self.estado
+        observar(e.enteros, e.reales[R_RELOJ], e.ponderados, e.canchas_enteros.shape[0])
+
+    @property
+    def iteraciones(self) -> int:
+        return int(self.estado.enteros[E_ITERACION])
+
+    def avanzar(self, max_pasos: Optional[int] = None) -> int:
+        """Avanza hasta max_pasos eventos (None: hasta el criterio de parada)"""
+        restantes = self.limite_iteraciones if max_pasos is None else max_pasos
+        while True:
+            antes = self.iteraciones
+            causa = bucle_eventos(self.estado, self.politica, self.limite_tiempo, self.limite_iteraciones,
+                                  restantes)
+            restantes -= self.iteraciones - antes
+            if causa == FALTAN_ALEATORIOS:
+                self.rellenar_aleatorios()
+            elif causa == COLA_LLENA:
+                self.ampliar_colas()
+            else:
+                return causa
+
+    def simular(self) -> str:
+        """Corre hasta el criterio de parada y devuelve el motivo de fin"""
+        return self.motivo(self.avanzar())
+
+    def motivo(self, causa: int) -> str:
+        """Motivo de fin con el texto de SimuladorVectorial.motivo_parada"""
+        if causa == SIN_EVENTOS:
+            return "No hay más eventos programados. Finalizando simulación."
+        if causa == LIMITE_TIEMPO:
+            tiempo = self.estado.reales[R_PROXIMO]
+            return f"Próximo evento ({tiempo/60:.2f}h) supera el tiempo límite ({self.limite_tiempo/60:.2f}h)."
+        if causa == LIMITE_ITERACIONES:
+            return f"Alcanzado el límite de {self.limite_iteraciones} iteraciones."
+        raise ValueError(f"La corrida no terminó (causa {causa})")
+
+    def rellenar_aleatorios(self):
+        """Descarta los valores ya usados de cada fuente y completa el lote
+        con los siguientes de la fuente de aleatorios, en bloque: son los
+        mismos que devolverían rnd() y par_box_muller() llamados de a uno.
+        """
+        import numpy as np
+
+        enteros, lote = self.estado.enteros, self.estado.aleatorios
+        for fuente, nombre in enumerate(FUENTES):
+            usados = int(enteros[E_POSICION_ALEATORIOS + fuente])
+            if usados == 0:
+                continue
+            restantes = lote.shape[1] - usados
+            lote[fuente, :restantes] = lote[fuente, usados:]
+            nuevos = lote[fuente, restantes:]
+            normal = nombre in FUENTES_NORMALES
+            if isinstance(self.aleatorios, AleatoriosIndependientes):
+                generador = self.aleatorios.generadores[nombre]
+                uniformes = np.array([generador.random() for _ in range(2 * usados if normal else usados)])
+                if normal:
+                    nuevos[:, 0], nuevos[:, 1] = uniformes[0::2], uniformes[1::2]
+                    box_muller_lote(nuevos)
+                else:
+                    nuevos[:, 0] = uniformes
+            elif normal:
+                nuevos[:] = np.array(self.aleatorios.flujos[nombre].tomar(usados))
+            else:
+                nuevos[:, 0] = self.aleatorios.flujos[nombre].tomar(usados)
+            enteros[E_POSICION_ALEATORIOS + fuente] = 0
+
+    def ampliar_colas(self):
+        """Duplica la capacidad de las colas (quedan desde la posición 0)"""
+        import numpy as np
+
+        e = self.estado
+        capacidad = e.colas_llegada.shape[1]
+        colas_enteros = np.zeros((2, 2 * capacidad, 2), dtype=np.int64)
+        colas_llegada = np.zeros((2, 2 * capacidad))
+        for cola in range(2):
+            orden = (e.enteros[E_COLA_INICIO + cola] + np.arange(e.enteros[E_COLA_LARGO + cola])) % capacidad
+            colas_enteros[cola, :len(orden)] = e.colas_enteros[cola, orden]
+            colas_llegada[cola, :len(orden)] = e.colas_llegada[cola, orden]
+            e.enteros[E_COLA_INICIO + cola] = 0
+        self.estado = e._replace(colas_enteros=colas_enteros, colas_llegada=colas_llegada)
+
+    def fila(self) -> Dict:
+        """Fila del estado actual con los campos de FilaCruda (para verificador.py)"""
+        e = self.estado
+        llegadas, ocupacion = e.llegadas, e.ocupacion
+        fila = {
+            "iteracion": self.iteraciones,
+            "evento_actual": NOMBRES_EVENTO[int(e.enteros[E_EVENTO])],
+            "reloj": float(e.reales[R_RELOJ]),
+        }
+        for d, nombre in ((H, "handball"), (F, "football"), (B, "basketball")):
+            if d == F:
+                fila["rnd_football"] = float(llegadas[d, L_RND1])
+            else:
+                fila[f"rnd_{nombre}_1"] = float(llegadas[d, L_RND1])
+                fila[f"rnd_{nombre}_2"] = float(llegadas[d, L_RND2])
+                fila[f"z_{nombre}_0"] = float(llegadas[d, L_Z0])
+                fila[f"z_{nombre}_1"] = float(llegadas[d, L_Z1])
+                fila[f"hay_z_disponible_{nombre}"] = bool(e.enteros[E_Z_DISPONIBLE + d])
+            fila[f"tiempo_prox_{nombre}"] = float(llegadas[d, L_TIEMPO])
+            fila[f"prox_llegada_{nombre}"] = float(llegadas[d, L_PROXIMA])
+        for d, nombre in ((H, "handball"), (F, "football"), (B, "basketball")):
+            fila[f"rnd_ocupacion_{nombre}_1"] = real_o_none(ocupacion[d, O_RND1])
+            fila[f"rnd_ocupacion_{nombre}_2"] = real_o_none(ocupacion[d, O_RND2])
+            fila[f"tmp_{nombre}_1_disponible"] = real_o_none(ocupacion[d, O_TMP1])
+            fila[f"tmp_{nombre}_2_disponible"] = real_o_none(ocupacion[d, O_TMP2])
+
+        fila["cola_handball_football"] = self.ids_cola(COLA_FH)
+        fila["cola_basketball"] = self.ids_cola(COLA_B)
+        fila["canchas"] = tuple(
+            (NOMBRES_SERVIDOR[int(e.canchas_enteros[c, C_ESTADO])],
+             tuple(f"{DISCIPLINAS[e.canchas_enteros[c, C_TIPO]]}{e.canchas_enteros[c, C_NUMERO + k]}"
+                   for k in range(e.canchas_enteros[c, C_CANTIDAD])),
+             float(e.canchas_reales[c, C_FIN_JUEGO]))
+            for c in range(e.canchas_enteros.shape[0])
+        )
+        for d, nombre in ((H, "handball"), (F, "football"), (B, "basketball")):
+            fila[f"equipos_{nombre}_atendidos"] = int(e.enteros[E_ATENDIDOS + d])
+            fila[f"tiempo_espera_{nombre}"] = float(e.espera[d, S_ACUMULADA])
+        return fila
+
+    def ids_cola(self, cola: int) -> tuple:
+        e = self.estado
+        capacidad = e.colas_llegada.shape[1]
+        inicio = int(e.enteros[E_COLA_INICIO + cola])
+        return tuple(
+            f"{DISCIPLINAS[e.colas_enteros[cola, i, Q_TIPO]]}{e.colas_enteros[cola, i, Q_NUMERO]}"
+            for i in ((inicio + p) % capacidad for p in range(e.enteros[E_COLA_LARGO + cola]))
+        )
+
+    def resultados(self) -> Dict:
+        """Indicadores finales con las claves de SimuladorVectorial.resultados()
+        (sin los percentiles de espera, que no se estiman en el núcleo)
+        """
+        return resultados_arreglos(self.estado)
+
+
+NOMBRES_EVENTO = {codigo: evento for evento, codigo in CODIGOS_EVENTO.items()}
+NOMBRES_SERVIDOR = {codigo: estado for estado, codigo in CODIGOS_SERVIDOR.items()}
+
+
+def real_o_none(valor) -> Optional[float]:
+    return None if math.isnan(valor) else float(valor)
+
+
+def resultados_arreglos(e: EstadoArreglos) -> Dict:
+    """Indicadores finales de un estado en arreglos (ver SimuladorArreglos.resultados)"""
+    reloj = float(e.reales[R_RELOJ])
+    resultado = {
+        "iteraciones": int(e.enteros[E_ITERACION]),
+        "reloj": reloj,
+        "cola_FH": int(e.enteros[E_COLA_LARGO + COLA_FH]),
+        "cola_B": int(e.enteros[E_COLA_LARGO + COLA_B]),
+    }
+    for d, tipo in enumerate(DISCIPLINAS):
+        cantidad, tiempo_total = int(e.enteros[E_ATENDIDOS + d]), float(e.espera[d, S_ACUMULADA])
+        resultado[f"atendidos_{tipo}"] = cantidad
+        resultado[f"espera_promedio_{tipo}"] = tiempo_total / cantidad if cantidad > 0 else NAN
+    atendidos = resultado["atendidos_H"] + resultado["atendidos_F"] + resultado["atendidos_B"]
+    espera_total = float(e.espera[H, S_ACUMULADA]) + float(e.espera[F, S_ACUMULADA]) + float(e.espera[B, S_ACUMULADA])
+    resultado["espera_promedio"] = espera_total / atendidos if atendidos > 0 else NAN
+
+    # Como EstadisticasEnLinea.resumen()
+    for clave, indicador in (("cola_promedio_FH", PONDERADO_COLA_FH), ("cola_promedio_B", PONDERADO_COLA_B),
+                             ("cancha_ocupada", PONDERADO_OCUPADA),
+                             ("cancha_acondicionamiento", PONDERADO_ACONDICIONAMIENTO),
+                             ("cancha_libre", PONDERADO_LIBRE)):
+        area, valor, desde = (float(x) for x in e.ponderados[indicador])
+        resultado[clave] = (area + valor * (reloj - desde)) / reloj if reloj > 0 else NAN
+    for d, tipo in enumerate(DISCIPLINAS):
+        n = int(e.enteros[E_ATENDIDOS + d])
+        resultado[f"espera_desvio_{tipo}"] = math.sqrt(e.espera[d, S_M2] / (n - 1)) if n > 1 else NAN
+        resultado[f"espera_maxima_{tipo}"] = float(e.espera[d, S_MAXIMA]) if n else NAN
+    return resultado
+
+
+def estado_a_arreglos(estado: EstadoSimulacion, modelo, politica, tamano_lote: int = 1024,
+                      capacidad_colas: int = 64) -> EstadoArreglos:
+    """Pasa un EstadoSimulacion (por ejemplo, el inicial) a arreglos.
+
+    El lote de aleatorios queda vacío (todo consumido): hay que rellenarlo
+    antes de avanzar.
+    """
+    import numpy as np
+
+    def opcional(valor):
+        return NAN if valor is None else valor
+
+    enteros = np.zeros(N_ENTEROS, dtype=np.int64)
+    enteros[E_EVENTO] = CODIGOS_EVENTO[estado.evento_actual]
+    enteros[E_OCUPADAS] = estado.canchas_ocupadas
+    enteros[E_ACONDICIONAMIENTO] = estado.canchas_en_acondicionamiento
+    enteros[E_Z_DISPONIBLE + H] = estado.hay_z_disponible_handball
+    enteros[E_Z_DISPONIBLE + B] = estado.hay_z_disponible_basketball
+    enteros[E_POSICION_ALEATORIOS:] = tamano_lote
+
+    reales = np.zeros(N_REALES)
+    reales[R_RELOJ] = estado.reloj
+
+    llegadas = np.full((3, 6), NAN)
+    llegadas[H] = (estado.rnd_handball_1, estado.rnd_handball_2, estado.z_handball_0, estado.z_handball_1,
+                   estado.tiempo_prox_handball, estado.prox_llegada_handball)
+    llegadas[F, [L_RND1, L_TIEMPO, L_PROXIMA]] = (estado.rnd_football, estado.tiempo_prox_football,
+                                                  estado.prox_llegada_football)
+    llegadas[B] = (estado.rnd_basketball_1, estado.rnd_basketball_2, estado.z_basketball_0, estado.z_basketball_1,
+                   estado.tiempo_prox_basketball, estado.prox_llegada_basketball)
+
+    ocupacion = np.full((3, 4), NAN)
+    espera = np.zeros((3, 4))
+    espera[:, S_MAXIMA] = -INF
+    for d, nombre in ((H, "handball"), (F, "football"), (B, "basketball")):
+        ocupacion[d] = [opcional(getattr(estado, campo)) for campo in (
+            f"rnd_ocupacion_{nombre}_1", f"rnd_ocupacion_{nombre}_2",
+            f"tmp_{nombre}_1_disponible", f"tmp_{nombre}_2_disponible")]
+        enteros[E_TMP2_USADO + d] = getattr(estado, f"tmp_{nombre}_2_usado")
+        enteros[E_ATENDIDOS + d] = getattr(estado, f"equipos_{nombre}_atendidos")
+        enteros[E_CONTADOR + d] = getattr(estado, f"id_counter_{nombre}")
+        espera[d, S_ACUMULADA] = getattr(estado, f"tiempo_espera_{nombre}")
+
+    ponderados = np.zeros((5, 3))
+    ponderados[:, P_DESDE] = estado.reloj
+
+    cantidad = len(estado.canchas)
+    canchas_enteros = np.zeros((cantidad, C_NUMERO + EQUIPOS_POR_CANCHA), dtype=np.int64)
+    canchas_reales = np.zeros((cantidad, C_LLEGADA + EQUIPOS_POR_CANCHA))
+    for c, cancha in enumerate(estado.canchas):
+        canchas_enteros[c, C_ESTADO] = CODIGOS_SERVIDOR[cancha.estado]
+        canchas_enteros[c, C_ULTIMA] = -1 if cancha.ultima_disciplina is None else CODIGOS_TIPO_EQUIPO[cancha.ultima_disciplina]
+        canchas_enteros[c, C_CANTIDAD] = len(cancha.equipos)
+        canchas_reales[c, C_FIN_JUEGO] = cancha.prox_fin_juego
+        canchas_reales[c, C_FIN_ACONDICIONAMIENTO] = cancha.prox_fin_acondicionamiento
+        for k, equipo in enumerate(cancha.equipos):
+            canchas_enteros[c, C_TIPO] = CODIGOS_TIPO_EQUIPO[equipo.tipo]
+            canchas_enteros[c, C_NUMERO + k] = equipo.id_num
+            canchas_reales[c, C_LLEGADA + k] = equipo.tiempo_llegada
+
+    colas = (estado.cola_handball_football, estado.cola_basketball)
+    capacidad = max(capacidad_colas, 2 * max(len(cola) for cola in colas))
+    colas_enteros = np.zeros((2, capacidad, 2), dtype=np.int64)
+    colas_llegada = np.zeros((2, capacidad))
+    for q, cola in enumerate(colas):
+        enteros[E_COLA_LARGO + q] = len(cola)
+        for p, equipo in enumerate(cola):
+            colas_enteros[q, p] = (CODIGOS_TIPO_EQUIPO[equipo.tipo], equipo.id_num)
+            colas_llegada[q, p] = equipo.tiempo_llegada
+
+    parametros = np.zeros(N_PARAMETROS)
+    parametros[M_LLEGADA_MEDIA:M_LLEGADA_MEDIA + 3] = (modelo.llegada_handball_media, modelo.llegada_football_media,
+                                                       modelo.llegada_basketball_media)
+    parametros[M_LLEGADA_DESVIO:M_LLEGADA_DESVIO + 3] = (modelo.llegada_handball_desvio, NAN,
+                                                         modelo.llegada_basketball_desvio)
+    parametros[M_OCUPACION_MEDIA:M_OCUPACION_MEDIA + 3] = (modelo.ocupacion_handball_media,
+                                                           modelo.ocupacion_football_media,
+                                                           modelo.ocupacion_basketball_media)
+    parametros[M_OCUPACION_DESVIO:M_OCUPACION_DESVIO + 3] = (modelo.ocupacion_handball_desvio,
+                                                             modelo.ocupacion_football_desvio,
+                                                             modelo.ocupacion_basketball_desvio)
+    parametros[M_ACONDICIONAMIENTO] = modelo.tiempo_acondicionamiento
+    pesos = getattr(politica, "pesos", {})
+    parametros[M_PESO:M_PESO + 3] = [pesos.get(tipo, 1.0) for tipo in DISCIPLINAS]
+
+    return EstadoArreglos(
+        enteros, reales, llegadas, ocupacion, espera, ponderados,
+        canchas_enteros, canchas_reales, colas_enteros, colas_llegada,
+        np.full((len(FUENTES), tamano_lote, 4), NAN), parametros,
+    )
+
+# ============================
+# Motor para verificador.py y réplicas
+# ============================
+
+def filas_motor_arreglos(config: ConfiguracionEjecucion) -> Iterator[Dict]:
+    """Filas del motor de arreglos avanzando de a un evento"""
+    simulador = SimuladorArreglos(config)
+    yield simulador.fila()
+    while True:
+        antes = simulador.iteraciones
+        simulador.avanzar(1)
+        if simulador.iteraciones == antes:
+            return
+        yield simulador.fila()
+
+
+def ejecutar_replica_arreglos(config: ConfiguracionEjecucion) -> Dict:
+    """Como replicaciones.ejecutar_replica, con el motor de arreglos"""
+    simulador = SimuladorArreglos(config)
+    simulador.simular()
+
+    resultado = simulador.resultados()
+    resultado["semilla"] = config.semilla
+    return resultado
@@ -0,0 +1,515 @@
+import math
+from dataclasses import replace
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from api import ConfiguracionEjecucion
+from distribuciones import FUENTES, FUENTES_NORMALES, AleatoriosPorLotes
+from estado import EstadoSimulacion
+from motor_arreglos import (
+    ACONDICIONAMIENTO, B, C_CANTIDAD, C_ESTADO, C_FIN_ACONDICIONAMIENTO, C_FIN_JUEGO, C_LLEGADA, C_NUMERO,
+    C_TIPO, C_ULTIMA, CODIGOS_POLITICA, COLA_B, COLA_FH, E_ACONDICIONAMIENTO, E_ATENDIDOS, E_COLA_INICIO,
+    E_COLA_LARGO, E_CONTADOR, E_EVENTO, E_ITERACION, E_OCUPADAS, E_POSICION_ALEATORIOS, E_TMP2_USADO,
+    E_Z_DISPONIBLE, EQUIPOS_POR_CANCHA, F, FIN_ACONDICIONAMIENTO, FIN_JUEGO, FUENTE_OCUPACION, H, INF,
+    L_PROXIMA, L_RND1, L_TIEMPO, L_Z1, LIBRE, LLEGADA_H, M_ACONDICIONAMIENTO, M_LLEGADA_DESVIO,
+    M_LLEGADA_MEDIA, M_OCUPACION_DESVIO, M_OCUPACION_MEDIA, M_PESO, MENOS_ACONDICIONAMIENTOS, NAN, O_RND1,
+    O_RND2, O_TMP1, O_TMP2, OCUPADO, P_AREA, P_DESDE, P_VALOR, Q_NUMERO, Q_TIPO, R_PROXIMO, R_RELOJ,
+    REFERENCIA, S_ACUMULADA, S_M2, S_MAXIMA, S_MEDIA, TRABAJO_MAS_CORTO, EstadoArreglos, estado_a_arreglos,
+    resultados_arreglos,
+)
+from politicas import crear_politica
+
+# ============================
+# Réplicas simultáneas: K corridas avanzando juntas
+# ============================
+#
+# Apila los estados de motor_arreglos.py de K réplicas (un eje más al
+# principio de cada arreglo) y en cada paso ejecuta el próximo evento de
+# todas las réplicas activas a la vez, con operaciones de NumPy sobre las
+# que tienen cada tipo de evento. Las que alcanzan su criterio de parada
+# quedan fuera de los pasos siguientes. Cada réplica recorre la misma
+# trayectoria que SimuladorVectorial con su semilla y el generador 'lotes'.
+#
+# Dentro de una operación cada réplica aparece a lo sumo una vez (un
+# evento y una cancha por vez), así `a[filas] += x` no pierde sumas.
+
+# Estado de cancha de cada disciplina ocupando la cancha
+OCUPADOS = np.array(OCUPADO)
+
+
+class SimuladorReplicas:
+    """Corre juntas las réplicas de `configuraciones`, iguales salvo la semilla.
+
+    Los aleatorios salen de un AleatoriosPorLotes por réplica (generador
+    'lotes'): se piden en bloque a sus flujos de NumPy, con los mismos
+    valores que verían SimuladorVectorial o SimuladorArreglos.
+    """
+    def __init__(self, configuraciones: Sequence[ConfiguracionEjecucion], tamano_lote: int = 256,
+                 capacidad_colas: int = 64):
+        if not configuraciones:
+            raise ValueError("No hay réplicas para correr")
+        base = configuraciones[0]
+        for config in configuraciones:
+            config.validar()
+            if replace(config, semilla=base.semilla) != base:
+                raise ValueError("Las réplicas simultáneas deben tener la misma configuración salvo la semilla")
+        if base.generador != 'lotes':
+            raise ValueError("Las réplicas simultáneas piden los aleatorios en bloque a NumPy: "
+                             "requieren el generador 'lotes'")
+        if base.politica not in CODIGOS_POLITICA:
+            raise ValueError(f"Política sin versión en arreglos: {base.politica!r}")
+
+        self.configuraciones = list(configuraciones)
+        self.modelo = base.modelo
+        self.politica = CODIGOS_POLITICA[base.politica]
+        if base.modo_parada == 'tiempo':
+            self.limite_tiempo, self.limite_iteraciones = float(base.limite_horas * 60), np.iinfo(np.int64).max
+        else:
+            self.limite_tiempo, self.limite_iteraciones = INF, base.limite_iteraciones
+
+        # Estado inicial de cada réplica (el de la referencia), apilado. Los
+        # flujos arrancan con lotes de un valor: la secuencia no depende del
+        # tamaño del lote y después se piden en bloque con tomar_arreglo()
+        self.aleatorios = [AleatoriosPorLotes(config.semilla, tamano_lote=1) for config in configuraciones]
+        self.cantidad_canchas = self.modelo.cantidad_canchas
+        tamano_lote = max(tamano_lote, 2 * self.cantidad_canchas)
+        politica = crear_politica(base.politica)
+        estados = [
+            estado_a_arreglos(EstadoSimulacion(aleatorios=aleatorios, modelo=self.modelo), self.modelo, politica,
+                              tamano_lote, capacidad_colas)
+            for aleatorios in self.aleatorios
+        ]
+        self.estado = EstadoArreglos(*(np.stack(campo) for campo in zip(*estados)))
+        self.parametros = self.estado.parametros[0]   # iguales en todas las réplicas
+        self.activas = np.ones(len(estados), dtype=bool)
+
+        todas = np.arange(len(estados))
+        self.rellenar_aleatorios(todas)
+        self.observar(todas)
+
+    @property
+    def cantidad(self) -> int:
+        return len(self.configuraciones)
+
+    def simular(self):
+        """Avanza hasta que todas las réplicas alcanzan el criterio de parada"""
+        while self.paso():
+            pass
+
+    def paso(self) -> bool:
+        """Ejecuta el próximo evento de cada réplica activa (False si no queda ninguna)"""
+        e = self.estado
+        filas = np.flatnonzero(self.activas)
+        if filas.size == 0:
+            return False
+
+        # Próximo evento: llegadas, fines de juego y fines de acondicionamiento
+        # en ese orden, así argmin desempata como ListaEventosFuturos
+        tiempos = np.concatenate((e.llegadas[filas, :, L_PROXIMA], e.canchas_reales[filas, :, C_FIN_JUEGO],
+                                  e.canchas_reales[filas, :, C_FIN_ACONDICIONAMIENTO]), axis=1)
+        columna = tiempos.argmin(axis=1)
+        tiempo = tiempos[np.arange(filas.size), columna]
+        e.reales[filas, R_PROXIMO] = tiempo
+
+        terminadas = (np.isinf(tiempo) | (tiempo > self.limite_tiempo)
+                      | (e.enteros[filas, E_ITERACION] >= self.limite_iteraciones))
+        if terminadas.any():
+            self.activas[filas[terminadas]] = False
+            siguen = ~terminadas
+            filas, columna, tiempo = filas[siguen], columna[siguen], tiempo[siguen]
+            if filas.size == 0:
+                return False
+
+        # Un paso consume a lo sumo un valor por fuente y por cancha que empieza
+        escasas = (e.enteros[filas, E_POSICION_ALEATORIOS:E_POSICION_ALEATORIOS + len(FUENTES)]
+                   + self.cantidad_canchas >= e.aleatorios.shape[2]).any(axis=1)
+        if escasas.any():
+            self.rellenar_aleatorios(filas[escasas])
+        if (e.enteros[filas, E_COLA_LARGO:E_COLA_LARGO + 2] >= e.colas_llegada.shape[2]).any():
+            self.ampliar_colas()
+            e = self.estado
+
+        # El TMP2 usado en el paso anterior se descarta al empezar este
+        usados = e.enteros[filas, E_TMP2_USADO:E_TMP2_USADO + 3] != 0
+        if usados.any():
+            fila, d = np.nonzero(usados)
+            e.ocupacion[filas[fila], d, :] = NAN
+            e.enteros[filas[fila], E_TMP2_USADO + d] = 0
+
+        canchas = self.cantidad_canchas
+        llegada = columna < 3
+        fin_juego = (columna >= 3) & (columna < 3 + canchas)
+        fin_acondicionamiento = columna >= 3 + canchas
+        e.reales[filas, R_RELOJ] = tiempo
+        e.enteros[filas, E_EVENTO] = np.where(llegada, LLEGADA_H + columna,
+                                              np.where(fin_juego, FIN_JUEGO, FIN_ACONDICIONAMIENTO))
+
+        if llegada.any():
+            self.manejar_llegada(filas[llegada], columna[llegada], tiempo[llegada])
+        if fin_juego.any():
+            self.manejar_fin_juego(filas[fin_juego], columna[fin_juego] - 3)
+        if fin_acondicionamiento.any():
+            self.manejar_fin_acondicionamiento(filas[fin_acondicionamiento],
+                                               columna[fin_acondicionamiento] - 3 - canchas)
+        self.asignar_canchas(filas[~fin_acondicionamiento])
+
+        e.enteros[filas, E_ITERACION] += 1
+        self.observar(filas)
+        return True
+
+    # --- MANEJADORES DE EVENTOS ---
+
+    def manejar_llegada(self, filas, d, reloj):
+        e, parametros = self.estado, self.parametros
+        self.encolar(filas, np.where(d == B, COLA_B, COLA_FH), d, e.enteros[filas, E_CONTADOR + d], reloj)
+        e.enteros[filas, E_CONTADOR + d] += 1
+
+        # Próxima llegada del mismo tipo (misma aritmética que distribuciones.py)
+        media, desvio = parametros[M_LLEGADA_MEDIA + d], parametros[M_LLEGADA_DESVIO + d]
+        tiempo = np.empty(filas.size)
+        football = d == F
+        if football.any():
+            filas_f = filas[football]
+            valores = e.aleatorios[filas_f, F, self.siguiente_aleatorio(filas_f, F)]
+            e.llegadas[filas_f, F, L_RND1] = valores[:, 0]
+            tiempo[football] = -media[football] * 60 * valores[:, 1]
+
+        normal = ~football
+        if normal.any():
+            filas_n, d_n = filas[normal], d[normal]
+            z = np.empty(filas_n.size)
+            hay_z = e.enteros[filas_n, E_Z_DISPONIBLE + d_n] != 0
+            z[hay_z] = e.llegadas[filas_n[hay_z], d_n[hay_z], L_Z1]
+            e.enteros[filas_n[hay_z], E_Z_DISPONIBLE + d_n[hay_z]] = 0
+            nuevo = ~hay_z
+            if nuevo.any():
+                filas_z, d_z = filas_n[nuevo], d_n[nuevo]
+                valores = e.aleatorios[filas_z, d_z, self.siguiente_aleatorio(filas_z, d_z)]
+                e.llegadas[filas_z, d_z, L_RND1:L_Z1 + 1] = valores
+                z[nuevo] = valores[:, 2]
+                e.enteros[filas_z, E_Z_DISPONIBLE + d_z] = 1
+            tiempo[normal] = media[normal] * 60 + desvio[normal] * 60 * z
+
+        e.llegadas[filas, d, L_TIEMPO] = tiempo
+        e.llegadas[filas, d, L_PROXIMA] = reloj + tiempo
+
+    def manejar_fin_juego(self, filas, c):
+        e = self.estado
+        e.canchas_enteros[filas, c, C_ULTIMA] = e.canchas_enteros[filas, c, C_TIPO]
+        e.canchas_enteros[filas, c, C_CANTIDAD] = 0
+        e.canchas_enteros[filas, c, C_ESTADO] = LIBRE
+        e.canchas_reales[filas, c, C_FIN_JUEGO] = INF
+        e.enteros[filas, E_OCUPADAS] -= 1
+
+    def manejar_fin_acondicionamiento(self, filas, c):
+        """Los equipos cargados en la cancha empiezan a jugar"""
+        e = self.estado
+        d = e.canchas_enteros[filas, c, C_TIPO]
+        e.canchas_enteros[filas, c, C_ULTIMA] = d
+        e.canchas_reales[filas, c, C_FIN_ACONDICIONAMIENTO] = INF
+        e.enteros[filas, E_ACONDICIONAMIENTO] -= 1
+        self.iniciar_juego(filas, c, d)
+
+    # --- ASIGNACIÓN DE CANCHAS ---
+
+    def asignar_canchas(self, filas):
+        """Ocupa canchas libres mientras la política elija equipos (una cancha
+        por réplica en cada vuelta)
+        """
+        e = self.estado
+        while filas.size:
+            libres = self.cantidad_canchas - e.enteros[filas, E_OCUPADAS] - e.enteros[filas, E_ACONDICIONAMIENTO]
+            filas = filas[libres > 0]
+            if filas.size == 0:
+                return
+            d, posicion = self.seleccionar(filas)
+            elegidas = d >= 0
+            filas, d, posicion = filas[elegidas], d[elegidas], posicion[elegidas]
+            if filas.size == 0:
+                return
+
+            c = self.tomar_cancha(filas, d)
+            cantidad = np.ones(filas.size, dtype=np.int64)
+            basketball = d == B
+            if basketball.any():
+                filas_b, c_b = filas[basketball], c[basketball]
+                dos = e.enteros[filas_b, E_COLA_LARGO + COLA_B] >= 2
+                cantidad[basketball] = np.where(dos, 2, 1)
+                for k, (filas_k, c_k) in enumerate(((filas_b, c_b), (filas_b[dos], c_b[dos]))):
+                    numero, llegada = self.quitar(filas_k, COLA_B, np.zeros(filas_k.size, dtype=np.int64))
+                    e.canchas_enteros[filas_k, c_k, C_NUMERO + k] = numero
+                    e.canchas_reales[filas_k, c_k, C_LLEGADA + k] = llegada
+            otras = ~basketball
+            if otras.any():
+                filas_o, c_o = filas[otras], c[otras]
+                numero, llegada = self.quitar(filas_o, COLA_FH, posicion[otras])
+                e.canchas_enteros[filas_o, c_o, C_NUMERO] = numero
+                e.canchas_reales[filas_o, c_o, C_LLEGADA] = llegada
+            e.canchas_enteros[filas, c, C_TIPO] = d
+            e.canchas_enteros[filas, c, C_CANTIDAD] = cantidad
+            self.iniciar_juego(filas, c, d)
+
+    def seleccionar(self, filas):
+        """(disciplina, posición en su cola) que pasa a una cancha en cada
+        réplica, o (-1, 0); como motor_arreglos.seleccionar
+        """
+        e, parametros = self.estado, self.parametros
+        largo_fh, largo_b = e.enteros[filas, E_COLA_LARGO + COLA_FH], e.enteros[filas, E_COLA_LARGO + COLA_B]
+        hay_b = (largo_b >= 2) | ((largo_b == 1) & (largo_fh == 0))
+        if self.politica == REFERENCIA:
+            return self.seleccion_referencia(filas, largo_fh, hay_b)
+
+        # Candidatos en el orden del diccionario de las políticas: H y F según
+        # su posición en la cola, después B (posición -1: no es candidato)
+        posicion_h, posicion_f = self.primeros_fh(filas, largo_fh)
+        f_primero = (posicion_f >= 0) & ((posicion_h < 0) | (posicion_f < posicion_h))
+        orden_d = (np.where(f_primero, F, H), np.where(f_primero, H, F), np.full(filas.size, B))
+        orden_posicion = (np.where(f_primero, posicion_f, posicion_h), np.where(f_primero, posicion_h, posicion_f),
+                          np.where(hay_b, 0, -1))
+        sin_acondicionamiento = self.sin_acondicionamiento(filas)
+        indice = np.arange(filas.size)
+
+        if self.politica == MENOS_ACONDICIONAMIENTOS:
+            # B primero, luego F/H por posición y si no, la referencia
+            elegida = np.where(hay_b & sin_acondicionamiento[:, B], B, -1)
+            posicion_elegida = np.zeros(filas.size, dtype=np.int64)
+            for d, posicion in zip(orden_d[:2], orden_posicion[:2]):
+                toma = (elegida < 0) & (posicion >= 0) & sin_acondicionamiento[indice, d]
+                elegida[toma], posicion_elegida[toma] = d[toma], posicion[toma]
+            resto = elegida < 0
+            if resto.any():
+                elegida[resto], posicion_elegida[resto] = self.seleccion_referencia(
+                    filas[resto], largo_fh[resto], hay_b[resto])
+            return elegida, posicion_elegida
+
+        elegida = np.full(filas.size, -1)
+        posicion_elegida = np.zeros(filas.size, dtype=np.int64)
+        mejor_costo, mejor_desempate = np.full(filas.size, INF), np.full(filas.size, INF)
+        reloj = e.reales[filas, R_RELOJ]
+        capacidad = e.colas_llegada.shape[2]
+        for d, posicion in zip(orden_d, orden_posicion):
+            if self.politica == TRABAJO_MAS_CORTO:
+                media = parametros[M_OCUPACION_MEDIA + d]
+                costo = np.where(sin_acondicionamiento[indice, d], media, media + parametros[M_ACONDICIONAMIENTO])
+                desempate = posicion.astype(np.float64)
+            else:  # EQUITATIVA
+                cola = np.where(d == B, COLA_B, COLA_FH)
+                i = (e.enteros[filas, E_COLA_INICIO + cola] + np.maximum(posicion, 0)) % capacidad
+                llegada = e.colas_llegada[filas, cola, i]
+                costo = -(reloj - llegada) * parametros[M_PESO + d]
+                desempate = llegada
+            mejor = (posicion >= 0) & ((elegida < 0) | (costo < mejor_costo)
+                                       | ((costo == mejor_costo) & (desempate < mejor_desempate)))
+            elegida, posicion_elegida = np.where(mejor, d, elegida), np.where(mejor, posicion, posicion_elegida)
+            mejor_costo, mejor_desempate = np.where(mejor, costo, mejor_costo), np.where(mejor, desempate, mejor_desempate)
+        return elegida, posicion_elegida
+
+    def seleccion_referencia(self, filas, largo_fh, hay_b):
+        e = self.estado
+        primero = e.colas_enteros[filas, COLA_FH, e.enteros[filas, E_COLA_INICIO + COLA_FH], Q_TIPO]
+        elegida = np.where(hay_b, B, np.where(largo_fh > 0, primero, -1))
+        return elegida, np.zeros(filas.size, dtype=np.int64)
+
+    def primeros_fh(self, filas, largo_fh):
+        """Posición del primer H y del primer F en la cola F/H (-1 si no hay)"""
+        e = self.estado
+        capacidad = e.colas_llegada.shape[2]
+        posiciones = np.arange(capacidad)
+        indices = (e.enteros[filas, E_COLA_INICIO + COLA_FH][:, None] + posiciones) % capacidad
+        tipos = e.colas_enteros[filas[:, None], COLA_FH, indices, Q_TIPO]
+        en_cola = posiciones < largo_fh[:, None]
+        primeros = []
+        for tipo in (H, F):
+            es_tipo = en_cola & (tipos == tipo)
+            primeros.append(np.where(es_tipo.any(axis=1), es_tipo.argmax(axis=1), -1))
+        return primeros
+
+    def sin_acondicionamiento(self, filas):
+        """[réplica, disciplina]: hay una cancha libre donde no requiere acondicionamiento"""
+        e = self.estado
+        libre = (e.canchas_enteros[filas, :, C_ESTADO] == LIBRE)[:, :, None]
+        ultima = e.canchas_enteros[filas, :, C_ULTIMA][:, :, None]
+        return (libre & ((ultima == np.arange(3)) | (ultima < 0))).any(axis=1)
+
+    def tomar_cancha(self, filas, d):
+        """Como CanchasLibres.tomar: la libre de menor número sin acondicionamiento
+        para `d` y, si no hay, la libre de menor número.
+        """
+        e = self.estado
+        libre = e.canchas_enteros[filas, :, C_ESTADO] == LIBRE
+        ultima = e.canchas_enteros[filas, :, C_ULTIMA]
+        sin_acondicionamiento = libre & ((ultima == d[:, None]) | (ultima < 0))
+        return np.where(sin_acondicionamiento.any(axis=1), sin_acondicionamiento.argmax(axis=1),
+                        libre.argmax(axis=1))
+
+    def iniciar_juego(self, filas, c, d):
+        """Los equipos ya cargados en la cancha empiezan a jugar (o a esperar el acondicionamiento)"""
+        e = self.estado
+        reloj = e.reales[filas, R_RELOJ]
+        ultima = e.canchas_enteros[filas, c, C_ULTIMA]
+        acondiciona = (ultima >= 0) & (ultima != d)
+        if acondiciona.any():
+            filas_a, c_a = filas[acondiciona], c[acondiciona]
+            e.canchas_enteros[filas_a, c_a, C_ESTADO] = ACONDICIONAMIENTO
+            e.canchas_reales[filas_a, c_a, C_FIN_ACONDICIONAMIENTO] = (reloj[acondiciona]
+                                                                       + self.parametros[M_ACONDICIONAMIENTO])
+            e.enteros[filas_a, E_ACONDICIONAMIENTO] += 1
+
+        juegan = ~acondiciona
+        if juegan.any():
+            filas_j, c_j, d_j = filas[juegan], c[juegan], d[juegan]
+            cantidad = e.canchas_enteros[filas_j, c_j, C_CANTIDAD]
+            for k in range(EQUIPOS_POR_CANCHA):
+                equipo = k < cantidad
+                if equipo.any():
+                    self.iniciar_servicio(filas_j[equipo], d_j[equipo],
+                                          e.canchas_reales[filas_j[equipo], c_j[equipo], C_LLEGADA + k])
+            e.canchas_enteros[filas_j, c_j, C_ESTADO] = OCUPADOS[d_j]
+            e.canchas_reales[filas_j, c_j, C_FIN_JUEGO] = reloj[juegan] + self.tiempo_ocupacion(filas_j, d_j)
+            e.enteros[filas_j, E_OCUPADAS] += 1
+
+    def iniciar_servicio(self, filas, d, llegada):
+        """Acumula la espera de los equipos (suma y Welford, en el orden de EstadisticasEnLinea)"""
+        e = self.estado
+        valor = e.reales[filas, R_RELOJ] - llegada
+        n = e.enteros[filas, E_ATENDIDOS + d] + 1
+        media = e.espera[filas, d, S_MEDIA]
+        delta = valor - media
+        media = media + delta / n
+        e.espera[filas, d, S_MEDIA] = media
+        e.espera[filas, d, S_M2] += delta * (valor - media)
+        e.espera[filas, d, S_MAXIMA] = np.maximum(e.espera[filas, d, S_MAXIMA], valor)
+        e.enteros[filas, E_ATENDIDOS + d] = n
+        e.espera[filas, d, S_ACUMULADA] += valor
+
+    def tiempo_ocupacion(self, filas, d):
+        """Como obtener_tiempo_ocupacion_*: usa TMP2 si está disponible o genera un par"""
+        e, parametros = self.estado, self.parametros
+        tiempo = e.ocupacion[filas, d, O_TMP2]
+        disponible = ~np.isnan(tiempo)
+        e.enteros[filas[disponible], E_TMP2_USADO + d[disponible]] = 1
+
+        nuevo = ~disponible
+        if nuevo.any():
+            filas_n, d_n = filas[nuevo], d[nuevo]
+            fuente = FUENTE_OCUPACION + d_n
+            valores = e.aleatorios[filas_n, fuente, self.siguiente_aleatorio(filas_n, fuente)]
+            media, desvio = parametros[M_OCUPACION_MEDIA + d_n], parametros[M_OCUPACION_DESVIO + d_n]
+            # ocupacion_normal_box_muller: max(0, media + desvio * z)
+            tmp1, tmp2 = media + desvio * valores[:, 2], media + desvio * valores[:, 3]
+            tmp1, tmp2 = np.where(tmp1 > 0, tmp1, 0.0), np.where(tmp2 > 0, tmp2, 0.0)
+            e.ocupacion[filas_n, d_n, O_RND1] = valores[:, 0]
+            e.ocupacion[filas_n, d_n, O_RND2] = valores[:, 1]
+            e.ocupacion[filas_n, d_n, O_TMP1] = tmp1
+            e.ocupacion[filas_n, d_n, O_TMP2] = tmp2
+            tiempo[nuevo] = tmp1
+        return tiempo
+
+    # --- COLAS, ALEATORIOS Y ESTADÍSTICAS ---
+
+    def encolar(self, filas, cola, tipo, numero, llegada):
+        e = self.estado
+        i = (e.enteros[filas, E_COLA_INICIO + cola] + e.enteros[filas, E_COLA_LARGO + cola]) % e.colas_llegada.shape[2]
+        e.colas_enteros[filas, cola, i, Q_TIPO] = tipo
+        e.colas_enteros[filas, cola, i, Q_NUMERO] = numero
+        e.colas_llegada[filas, cola, i] = llegada
+        e.enteros[filas, E_COLA_LARGO + cola] += 1
+
+    def quitar(self, filas, cola: int, posicion):
+        """Quita de la cola el equipo en `posicion` de cada réplica y devuelve (números, llegadas)"""
+        e = self.estado
+        capacidad = e.colas_llegada.shape[2]
+        inicio = e.enteros[filas, E_COLA_INICIO + cola]
+        i = (inicio + posicion) % capacidad
+        numero, llegada = e.colas_enteros[filas, cola, i, Q_NUMERO], e.colas_llegada[filas, cola, i]
+
+        frente = posicion == 0
+        e.enteros[filas[frente], E_COLA_INICIO + cola] = (inicio[frente] + 1) % capacidad
+        medio = ~frente
+        if medio.any():
+            # Los que estaban detrás avanzan un lugar
+            p = np.arange(capacidad - 1)
+            inicio_m = inicio[medio, None]
+            destino = (inicio_m + p) % capacidad
+            origen = (inicio_m + p + (p >= posicion[medio, None])) % capacidad
+            fila = filas[medio, None]
+            e.colas_enteros[fila, cola, destino] = e.colas_enteros[fila, cola, origen]
+            e.colas_llegada[fila, cola, destino] = e.colas_llegada[fila, cola, origen]
+        e.enteros[filas, E_COLA_LARGO + cola] -= 1
+        return numero, llegada
+
+    def ampliar_colas(self):
+        """Duplica la capacidad de las colas de todas las réplicas (quedan desde la posición 0)"""
+        e = self.estado
+        capacidad = e.colas_llegada.shape[2]
+        orden = (e.enteros[:, E_COLA_INICIO:E_COLA_INICIO + 2, None] + np.arange(capacidad)) % capacidad
+        colas_enteros = np.zeros((self.cantidad, 2, 2 * capacidad, 2), dtype=np.int64)
+        colas_llegada = np.zeros((self.cantidad, 2, 2 * capacidad))
+        colas_enteros[:, :, :capacidad] = np.take_along_axis(e.colas_enteros, orden[..., None], axis=2)
+        colas_llegada[:, :, :capacidad] = np.take_along_axis(e.colas_llegada, orden, axis=2)
+        e.enteros[:, E_COLA_INICIO:E_COLA_INICIO + 2] = 0
+        self.estado = e._replace(colas_enteros=colas_enteros, colas_llegada=colas_llegada)
+
+    def siguiente_aleatorio(self, filas, fuente):
+        """Posición del próximo valor de la fuente en el lote de cada réplica"""
+        columna = E_POSICION_ALEATORIOS + fuente
+        posicion = self.estado.enteros[filas, columna]
+        self.estado.enteros[filas, columna] = posicion + 1
+        return posicion
+
+    def rellenar_aleatorios(self, filas):
+        """Descarta los valores usados de las réplicas indicadas y completa
+        sus lotes con los siguientes de cada flujo.
+
+        En llegada_F la segunda columna guarda log(1 - rnd) calculado con
+        math.log, como tiempo_exponencial (np.log puede diferir en el último bit).
+        """
+        enteros, lote = self.estado.enteros, self.estado.aleatorios
+        for k in filas:
+            flujos = self.aleatorios[k].flujos
+            for fuente, nombre in enumerate(FUENTES):
+                usados = int(enteros[k, E_POSICION_ALEATORIOS + fuente])
+                if usados == 0:
+                    continue
+                restantes = lote.shape[2] - usados
+                lote[k, fuente, :restantes] = lote[k, fuente, usados:]
+                nuevos = flujos[nombre].tomar_arreglo(usados)
+                if nombre in FUENTES_NORMALES:
+                    lote[k, fuente, restantes:] = nuevos
+                else:
+                    lote[k, fuente, restantes:, 0] = nuevos
+                    lote[k, fuente, restantes:, 1] = [math.log(1 - rnd) for rnd in nuevos.tolist()]
+                enteros[k, E_POSICION_ALEATORIOS + fuente] = 0
+
+    def observar(self, filas):
+        """Como EstadisticasEnLinea.observar: colas y situación de las canchas"""
+        e = self.estado
+        canchas = self.cantidad_canchas
+        reloj = e.reales[filas, R_RELOJ][:, None]
+        ocupadas, acondicionamiento = e.enteros[filas, E_OCUPADAS], e.enteros[filas, E_ACONDICIONAMIENTO]
+        valores = np.column_stack((
+            e.enteros[filas, E_COLA_LARGO + COLA_FH], e.enteros[filas, E_COLA_LARGO + COLA_B],
+            ocupadas / canchas, acondicionamiento / canchas, (canchas - ocupadas - acondicionamiento) / canchas,
+        ))
+        ponderados = e.ponderados[filas]
+        ponderados[:, :, P_AREA] += ponderados[:, :, P_VALOR] * (reloj - ponderados[:, :, P_DESDE])
+        ponderados[:, :, P_VALOR] = valores
+        ponderados[:, :, P_DESDE] = reloj
+        e.ponderados[filas] = ponderados
+
+    def resultados(self) -> List[Dict]:
+        """Indicadores finales de cada réplica, con las claves de SimuladorArreglos.resultados()"""
+        return [resultados_arreglos(EstadoArreglos(*(campo[k] for campo in self.estado)))
+                for k in range(self.cantidad)]
+
+
+def ejecutar_replicas_simultaneas(configuraciones: Sequence[ConfiguracionEjecucion], **opciones) -> List[Dict]:
+    """Como replicaciones.ejecutar_replica para cada configuración, todas en un paso por evento"""
+    simulador = SimuladorReplicas(configuraciones, **opciones)
+    simulador.simular()
+
+    resultados = simulador.resultados()
+    for resultado, config in zip(resultados, configuraciones):
+        resultado["semilla"] = config.semilla
+    return resultados
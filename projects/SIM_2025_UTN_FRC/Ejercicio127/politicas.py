@@ -0,0 +1,173 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+# ============================
+# Políticas de asignación de canchas
+# ============================
+
+class PoliticaAsignacion(ABC):
+    """Decide qué equipos pasan a la próxima cancha libre.
+
+    seleccionar() se llama mientras haya canchas libres: devuelve los
+    equipos que empiezan (todos de la misma disciplina, ya quitados de su
+    cola) o None para no ocupar más canchas por ahora. La cancha la elige
+    después CanchasLibres (preferentemente una que no requiera
+    acondicionamiento).
+    """
+    nombre = "base"
+
+    @abstractmethod
+    def seleccionar(self, estado, modelo) -> Optional[List]:
+        ...
+
+    # -----------------------------
+    # Utilidades para las subclases
+    # -----------------------------
+
+    @staticmethod
+    def candidatos(estado) -> Dict[str, int]:
+        """Disciplinas que pueden empezar y la posición de su equipo en la cola.
+
+        H y F: el primero de cada tipo en la cola F/H. B: dos equipos si hay,
+        o uno solo si la cola F/H está vacía (igual que la regla original).
+        """
+        candidatos = {}
+        for posicion, equipo in enumerate(estado.cola_handball_football):
+            if equipo.tipo not in candidatos:
+                candidatos[equipo.tipo] = posicion
+                if len(candidatos) == 2:
+                    break
+        cant_b = len(estado.cola_basketball)
+        if cant_b >= 2 or (cant_b == 1 and not estado.cola_handball_football):
+            candidatos["B"] = 0
+        return candidatos
+
+    @staticmethod
+    def tomar(estado, disciplina: str, posicion: int) -> List:
+        """Quita de su cola los equipos de la disciplina elegida"""
+        if disciplina == "B":
+            cola = estado.cola_basketball
+            return [cola.popleft(), cola.popleft()] if len(cola) >= 2 else [cola.popleft()]
+        cola = estado.cola_handball_football
+        if posicion == 0:
+            return [cola.popleft()]
+        equipo = cola[posicion]
+        del cola[posicion]
+        return [equipo]
+
+    @staticmethod
+    def duracion_esperada(disciplina: str, modelo) -> float:
+        return {
+            "H": modelo.ocupacion_handball_media,
+            "F": modelo.ocupacion_football_media,
+            "B": modelo.ocupacion_basketball_media,
+        }[disciplina]
+
+
+class PoliticaReferencia(PoliticaAsignacion):
+    """Regla del enunciado: dos basketball primero, un basketball solo si no
+    hay otros esperando y, si no, el primero de la cola F/H.
+    """
+    nombre = "referencia"
+
+    def seleccionar(self, estado, modelo) -> Optional[List]:
+        hay_fh = len(estado.cola_handball_football) > 0
+        cant_b = len(estado.cola_basketball)
+
+        if not hay_fh and cant_b == 0:
+            return None
+
+        if cant_b >= 2:
+            # Basketball PRIORIDAD por tener 2 esperando
+            return [estado.cola_basketball.popleft(), estado.cola_basketball.popleft()]
+
+        if cant_b == 1 and not hay_fh:
+            # Único Basket y no hay otros esperando
+            return [estado.cola_basketball.popleft()]
+
+        # Caso contrario → prioridad H/F
+        return [estado.cola_handball_football.popleft()]
+
+
+class PoliticaMenosAcondicionamientos(PoliticaAsignacion):
+    """Prioriza disciplinas que tienen una cancha libre sin acondicionar; si
+    ninguna la tiene, aplica la regla de referencia.
+    """
+    nombre = "menos_acondicionamientos"
+
+    def __init__(self):
+        self.referencia = PoliticaReferencia()
+
+    def seleccionar(self, estado, modelo) -> Optional[List]:
+        candidatos = self.candidatos(estado)
+        # Mismo orden de preferencia que la referencia: B, luego el primero de F/H
+        orden = sorted(candidatos, key=lambda d: (d != "B", candidatos[d]))
+        for disciplina in orden:
+            if estado.canchas_libres.sin_acondicionamiento(disciplina):
+                return self.tomar(estado, disciplina, candidatos[disciplina])
+        return self.referencia.seleccionar(estado, modelo)
+
+
+class PoliticaTrabajoMasCorto(PoliticaAsignacion):
+    """Empieza el juego de menor duración esperada (incluyendo el
+    acondicionamiento si la cancha lo requiere).
+    """
+    nombre = "trabajo_mas_corto"
+
+    def seleccionar(self, estado, modelo) -> Optional[List]:
+        candidatos = self.candidatos(estado)
+        if not candidatos:
+            return None
+
+        def costo(disciplina):
+            acondicionamiento = (0 if estado.canchas_libres.sin_acondicionamiento(disciplina)
+                                 else modelo.tiempo_acondicionamiento)
+            return (self.duracion_esperada(disciplina, modelo) + acondicionamiento, candidatos[disciplina])
+
+        disciplina = min(candidatos, key=costo)
+        return self.tomar(estado, disciplina, candidatos[disciplina])
+
+
+class PoliticaEquitativa(PoliticaAsignacion):
+    """Empieza la disciplina cuyo primer equipo lleva más espera ponderada.
+
+    Con pesos iguales es FIFO entre todas las colas; un peso mayor adelanta
+    a esa disciplina.
+    """
+    nombre = "equitativa"
+
+    def __init__(self, pesos: Optional[Dict[str, float]] = None):
+        self.pesos = {"H": 1.0, "F": 1.0, "B": 1.0}
+        if pesos:
+            self.pesos.update(pesos)
+
+    def seleccionar(self, estado, modelo) -> Optional[List]:
+        candidatos = self.candidatos(estado)
+        if not candidatos:
+            return None
+
+        def primero(disciplina):
+            if disciplina == "B":
+                return estado.cola_basketball[0]
+            return estado.cola_handball_football[candidatos[disciplina]]
+
+        def prioridad(disciplina):
+            espera = estado.reloj - primero(disciplina).tiempo_llegada
+            return (-espera * self.pesos[disciplina], primero(disciplina).tiempo_llegada)
+
+        disciplina = min(candidatos, key=prioridad)
+        return self.tomar(estado, disciplina, candidatos[disciplina])
+
+
+# Políticas disponibles por nombre
+POLITICAS = {
+    politica.nombre: politica
+    for politica in (PoliticaReferencia, PoliticaMenosAcondicionamientos,
+                     PoliticaTrabajoMasCorto, PoliticaEquitativa)
+}
+
+
+def crear_politica(nombre: str) -> PoliticaAsignacion:
+    if nombre not in POLITICAS:
+        raise ValueError(f"Política desconocida: {nombre!r}")
+    return POLITICAS[nombre]()
@@ -0,0 +1,97 @@
+import gzip
+import os
+import pickle
+from typing import Dict, Tuple
+
+from bitacora import BitacoraEquipos
+
+# ============================
+# Puntos de control (checkpoints)
+# ============================
+
+# Se incrementa si cambia el contenido del punto de control
+VERSION_PUNTO_CONTROL = 2
+
+
+def escribir_punto_control(datos: Dict, ruta: str) -> str:
+    """Guarda el punto de control como pickle comprimido con gzip.
+
+    Se escribe primero a un temporal y después se reemplaza el archivo, así
+    una interrupción a mitad de la escritura no pisa el último punto válido.
+    """
+    crear_carpeta(ruta)
+    temporal = ruta + ".tmp"
+    with gzip.open(temporal, "wb", compresslevel=1) as archivo:
+        pickle.dump(dict(datos, version=VERSION_PUNTO_CONTROL), archivo, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporal, ruta)
+    return ruta
+
+
+def crear_carpeta(ruta: str):
+    carpeta = os.path.dirname(ruta)
+    if carpeta:
+        os.makedirs(carpeta, exist_ok=True)
+
+
+def leer_punto_control(ruta: str) -> Dict:
+    """Lee un punto de control escrito por escribir_punto_control (con su
+    bitácora, si la corrida la llevaba)
+    """
+    with gzip.open(ruta, "rb") as archivo:
+        datos = pickle.load(archivo)
+    if datos.get("version") != VERSION_PUNTO_CONTROL:
+        raise ValueError(f"Versión de punto de control no soportada: {datos.get('version')!r}")
+    if datos["bitacora"] is not None:
+        datos["bitacora"] = leer_bitacora(ruta_bitacora(ruta), datos["bitacora"])
+    return datos
+
+
+# ============================
+# Bitácora de equipos (archivo aparte, incremental)
+# ============================
+
+def ruta_bitacora(ruta: str) -> str:
+    """Archivo donde se va agregando la bitácora del punto de control `ruta`"""
+    return ruta + ".bitacora"
+
+
+def agregar_bitacora(bitacora: BitacoraEquipos, ruta: str, desde: Tuple[int, int] = (0, 0)) -> Tuple[int, int]:
+    """Agrega al archivo las transiciones y los equipos nuevos desde `desde`
+    (transiciones, equipos) ya guardados; con (0, 0) lo reescribe completo.
+
+    Cada punto de control escribe solo lo nuevo, así su costo no crece con
+    el largo de la corrida. Devuelve hasta dónde quedó guardada la bitácora.
+    """
+    transiciones, equipos = desde
+    hasta = (len(bitacora), len(bitacora.ids))
+    if hasta == desde and desde != (0, 0):
+        return hasta
+    crear_carpeta(ruta)
+    with gzip.open(ruta, "ab" if desde != (0, 0) else "wb", compresslevel=1) as archivo:
+        pickle.dump((bitacora.ids[equipos:], bitacora.llegadas[equipos:], bitacora.equipo[transiciones:],
+                     bitacora.estado[transiciones:], bitacora.tiempo[transiciones:]),
+                    archivo, protocol=pickle.HIGHEST_PROTOCOL)
+    return hasta
+
+
+def leer_bitacora(ruta: str, hasta: Tuple[int, int]) -> BitacoraEquipos:
+    """Bitácora guardada por agregar_bitacora, hasta (transiciones, equipos).
+
+    Lo que haya después (un tramo escrito justo antes de una interrupción)
+    se descarta: el punto de control indica hasta dónde es válida.
+    """
+    transiciones, equipos = hasta
+    bitacora = BitacoraEquipos()
+    with gzip.open(ruta, "rb") as archivo:
+        while len(bitacora) < transiciones or len(bitacora.ids) < equipos:
+            ids, llegadas, equipo, estado, tiempo = pickle.load(archivo)
+            bitacora.ids.extend(ids)
+            bitacora.llegadas.extend(llegadas)
+            bitacora.equipo.extend(equipo)
+            bitacora.estado.extend(estado)
+            bitacora.tiempo.extend(tiempo)
+
+    del bitacora.ids[equipos:], bitacora.llegadas[equipos:]
+    del bitacora.equipo[transiciones:], bitacora.estado[transiciones:], bitacora.tiempo[transiciones:]
+    bitacora.posiciones = {equipo_id: posicion for posicion, equipo_id in enumerate(bitacora.ids)}
+    return bitacora
@@ -0,0 +1,128 @@
+import argparse
+import multiprocessing
+from dataclasses import replace
+from typing import Dict, List, Optional, Tuple
+
+from api import ConfiguracionEjecucion, crear_simulador
+from estadisticas import intervalo_confianza
+
+# ============================
+# Replicaciones independientes en paralelo
+# ============================
+
+# Indicadores que se agregan entre réplicas: (clave en resultados(), descripción)
+INDICADORES = [
+    ("espera_promedio_H", "Espera promedio HANDBALL (min)"),
+    ("espera_promedio_F", "Espera promedio FOOTBALL (min)"),
+    ("espera_promedio_B", "Espera promedio BASKETBALL (min)"),
+    ("atendidos_H", "Equipos HANDBALL atendidos"),
+    ("atendidos_F", "Equipos FOOTBALL atendidos"),
+    ("atendidos_B", "Equipos BASKETBALL atendidos"),
+    ("cola_FH", "Equipos en cola F/H al final"),
+    ("cola_B", "Equipos en cola B al final"),
+]
+
+
+def ejecutar_replica(config: ConfiguracionEjecucion) -> Dict:
+    """Corre una réplica sin salida por consola (nivel módulo para poder enviarla al pool)"""
+    simulador = crear_simulador(config)
+    simulador.simular()
+
+    resultado = simulador.resultados()
+    resultado["semilla"] = config.semilla
+    return resultado
+
+def ejecutar_replica_arreglos(config: ConfiguracionEjecucion) -> Dict:
+    """Réplica con el motor de arreglos (importado al usarlo: requiere NumPy)"""
+    from motor_arreglos import ejecutar_replica_arreglos as ejecutar
+    return ejecutar(config)
+
+def ejecutar_replicas_simultaneas(configuraciones: List[ConfiguracionEjecucion]) -> List[Dict]:
+    """Todas las réplicas juntas en un proceso (motor_replicas.py: requiere NumPy)"""
+    from motor_replicas import ejecutar_replicas_simultaneas as ejecutar
+    return ejecutar(configuraciones)
+
+# Motores con los que se pueden correr las réplicas: de a una (en el pool)
+# o todas juntas en el proceso actual
+MOTORES = {
+    "vectorial": ejecutar_replica,
+    "arreglos": ejecutar_replica_arreglos,
+}
+MOTORES_EN_BLOQUE = {
+    "simultaneas": ejecutar_replicas_simultaneas,
+}
+
+def configuracion_replica(config: ConfiguracionEjecucion, semilla: int, **cambios) -> ConfiguracionEjecucion:
+    """Configuración de una réplica: sin filas mostradas ni CSV y en avance
+    rápido, salvo que se exporten las tablas columnares (necesitan todas las filas)
+    """
+    replica = replace(config, semilla=semilla, mostrar_primeras=0, exportar_csv=False, **cambios)
+    return replace(replica, avance_rapido=not replica.exportar_columnar)
+
+def replicar(cantidad: int, semilla_base: int, config: ConfiguracionEjecucion,
+             procesos: Optional[int] = None, motor: str = "vectorial") -> List[Dict]:
+    """Corre `cantidad` réplicas de `config` con semillas semilla_base, semilla_base + 1, ...
+
+    procesos=None usa todos los núcleos; procesos=1 corre en el proceso actual.
+    motor='arreglos' usa el núcleo compilado de motor_arreglos.py (misma
+    trayectoria, sin percentiles de espera) y 'simultaneas' avanza todas las
+    réplicas juntas con NumPy (ignora procesos; requiere el generador 'lotes').
+    """
+    configuraciones = [configuracion_replica(config, semilla_base + r) for r in range(cantidad)]
+    if motor in MOTORES_EN_BLOQUE:
+        return MOTORES_EN_BLOQUE[motor](configuraciones)
+
+    ejecutar = MOTORES[motor]
+    if procesos == 1:
+        return [ejecutar(c) for c in configuraciones]
+
+    with multiprocessing.Pool(procesos) as pool:
+        return pool.map(ejecutar, configuraciones)
+
+def resumir_replicas(resultados: List[Dict], confianza: float = 0.95,
+                     indicadores=INDICADORES) -> Dict[str, Tuple[float, float]]:
+    """Media y semiamplitud del intervalo de confianza de cada indicador"""
+    return {
+        clave: intervalo_confianza([float(r[clave]) for r in resultados], confianza)
+        for clave, _ in indicadores
+    }
+
+def mostrar_resumen(resumen: Dict[str, Tuple[float, float]], cantidad: int, confianza: float):
+    """Imprime los intervalos de confianza de cada indicador"""
+    print("\n" + "="*80)
+    print(f"RESUMEN DE {cantidad} REPLICACIONES (IC {confianza:.0%}, t de Student)")
+    print("="*80)
+
+    for clave, descripcion in INDICADORES:
+        media, semiamplitud = resumen[clave]
+        print(f"{descripcion:<36} {media:>12.2f} ± {semiamplitud:.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replicaciones independientes del simulador del polideportivo")
+    parser.add_argument("-r", "--replicas", type=int, default=30, help="cantidad de réplicas")
+    parser.add_argument("--semilla", type=int, default=1, help="semilla de la primera réplica")
+    parada = parser.add_mutually_exclusive_group(required=True)
+    parada.add_argument("--horas", type=float, help="tiempo máximo simulado por réplica (horas)")
+    parada.add_argument("--iteraciones", type=int, help="iteraciones por réplica")
+    parser.add_argument("--procesos", type=int, default=None, help="procesos del pool (por defecto, todos los núcleos)")
+    parser.add_argument("--confianza", type=float, default=0.95, help="nivel de confianza")
+    parser.add_argument("--motor", choices=sorted({**MOTORES, **MOTORES_EN_BLOQUE}), default="vectorial",
+                        help="motor de simulación ('arreglos': núcleo compilado con Numba si está instalado; "
+                             "'simultaneas': todas las réplicas juntas con NumPy)")
+    parser.add_argument("--generador", choices=["independiente", "global", "lotes"],
+                        help="fuente de números aleatorios ('simultaneas' requiere 'lotes')")
+    args = parser.parse_args()
+
+    if args.horas is not None:
+        config = ConfiguracionEjecucion(modo_parada='tiempo', limite_horas=args.horas)
+    else:
+        config = ConfiguracionEjecucion(modo_parada='iteraciones', limite_iteraciones=args.iteraciones)
+
+    if args.generador is not None:
+        config.generador = args.generador
+    try:
+        resultados = replicar(args.replicas, args.semilla, config, args.procesos, args.motor)
+    except ValueError as error:
+        parser.error(str(error))
+    mostrar_resumen(resumir_replicas(resultados, args.confianza), args.replicas, args.confianza)
@@ -1,9 +1,19 @@
-from typing import List, Dict, Tuple
+import random
+from collections import deque
+from time import perf_counter
+from typing import Deque, List, Dict, Optional, Tuple
 from estado import EstadoSimulacion
-from entidades import Equipo
+from entidades import Cancha, Equipo
+from exportadores import ExportadorCSV, ExportadorColumnar
+from filas import FilaCruda, capturar_fila, formatear_fila, formatear_filas
+from bitacora import BitacoraEquipos
+from modelo import ModeloConfig
+from politicas import PoliticaAsignacion, PoliticaReferencia
+from estadisticas import EstadisticasEnLinea, PERCENTILES_ESPERA
+from puntos_control import agregar_bitacora, escribir_punto_control, leer_punto_control, ruta_bitacora
+from instrumentacion import AleatoriosMedidos, Instrumentacion
 from distribuciones import (
-    generar_rnd,
-    box_muller,
+    AleatoriosGlobales,
     tiempo_exponencial,
     tiempo_normal_box_muller,
     ocupacion_normal_box_muller
@@ -12,14 +22,32 @@ from distribuciones import (
 class SimuladorVectorial:
     """Simulador que trabaja con vectores de estado i-1 e i"""
     def __init__(self):
-        self.estados: List[EstadoSimulacion] = []
-        self.vector_resultados = []
+        self.estados: Deque[EstadoSimulacion] = deque()
+        self.vector_resultados: List[FilaCruda] = []   # primeras filas crudas (todas si historial_completo)
+        self.ultimas_filas: Deque[FilaCruda] = deque(maxlen=2)
+        self.total_filas = 0
+        self.historial_completo = False      # False: solo se retienen las filas que se muestran
+        self.exportador = None
+        self.exportar_columnar = False       # True: tablas de eventos y de equipos en .npz
+        self.exportador_columnar = None
         self.modo_parada = None  # 'tiempo' o 'iteraciones'
         self.limite_tiempo = None  # en minutos
         self.limite_iteraciones = None
-    
-        self.max_trazabilidad = 1000
-        self.trazabilidad_completa = True    
+        self.iteraciones = 0
+        self.aleatorios = AleatoriosGlobales()  # o AleatoriosPorLotes(semilla) para generar por lotes con NumPy
+        self.modelo = ModeloConfig()            # parámetros de llegadas, ocupación y acondicionamiento
+        self.politica: PoliticaAsignacion = PoliticaReferencia()  # qué equipos pasan a una cancha libre
+        self.modo_estado = 'copia'  # 'copia' (un estado nuevo por paso) o 'en_sitio' (un único estado mutable)
+        self.max_trazabilidad = 1000         # filas que llevan la vista por equipo (filas mostradas y CSV)
+        self.trazabilidad_completa = False   # True: todas las filas la llevan y la bitácora cubre toda la corrida
+        self.bitacora: Optional[BitacoraEquipos] = None
+        self.estadisticas: Optional[EstadisticasEnLinea] = None   # indicadores en línea de la última corrida
+        self.ruta_punto_control: Optional[str] = None   # archivo del punto de control (None: no se guarda)
+        self.punto_control_cada = 0          # iteraciones entre puntos de control (0: solo al terminar)
+        self.bitacora_guardada: Optional[Tuple[str, int, int]] = None   # (ruta, transiciones, equipos) ya escritos
+        self.instrumentar = False            # True: mide tiempos por etapa y por tipo de evento
+        self.avance_rapido = False           # True: sin filas intermedias (solo las primeras y las 2 últimas)
+        self.instrumentacion: Optional[Instrumentacion] = None   # mediciones de la última corrida
 
     def limpiar_ocupacion_si_corresponde(self, estado: EstadoSimulacion):
         # Handball
@@ -54,15 +82,16 @@ class SimuladorVectorial:
             estado.hay_z_disponible_handball = False  # Ya no hay z disponible
         else:
             # Generar nuevos números aleatorios y nuevos números Box-Muller
-            estado.rnd_handball_1 = generar_rnd()
-            estado.rnd_handball_2 = generar_rnd()
-            estado.z_handball_0, estado.z_handball_1 = box_muller(estado.rnd_handball_1, estado.rnd_handball_2)
+            (estado.rnd_handball_1, estado.rnd_handball_2,
+             estado.z_handball_0, estado.z_handball_1) = self.aleatorios.par_box_muller("llegada_H")
             z_a_usar = estado.z_handball_0  # Usar z0 (coseno)
             estado.hay_z_disponible_handball = True  # z1 (seno) queda disponible para próxima llegada
         
         # Calcular tiempo de próxima llegada
-        estado.tiempo_prox_handball = tiempo_normal_box_muller(z_a_usar, 6, 2)
+        estado.tiempo_prox_handball = tiempo_normal_box_muller(
+            z_a_usar, self.modelo.llegada_handball_media, self.modelo.llegada_handball_desvio)
         estado.prox_llegada_handball = estado.reloj + estado.tiempo_prox_handball
+        estado.eventos_futuros.programar("Llegada_H", estado.prox_llegada_handball)
     
     def generar_proxima_llegada_basketball(self, estado: EstadoSimulacion):
         """Genera la próxima llegada de basketball usando z disponibles o generando nuevos"""
@@ -72,15 +101,16 @@ class SimuladorVectorial:
             estado.hay_z_disponible_basketball = False  # Ya no hay z disponible
         else:
             # Generar nuevos números aleatorios y nuevos números Box-Muller
-            estado.rnd_basketball_1 = generar_rnd()
-            estado.rnd_basketball_2 = generar_rnd()
-            estado.z_basketball_0, estado.z_basketball_1 = box_muller(estado.rnd_basketball_1, estado.rnd_basketball_2)
+            (estado.rnd_basketball_1, estado.rnd_basketball_2,
+             estado.z_basketball_0, estado.z_basketball_1) = self.aleatorios.par_box_muller("llegada_B")
             z_a_usar = estado.z_basketball_0  # Usar z0 (coseno)
             estado.hay_z_disponible_basketball = True  # z1 (seno) queda disponible para próxima llegada
         
         # Calcular tiempo de próxima llegada
-        estado.tiempo_prox_basketball = tiempo_normal_box_muller(z_a_usar, 8, 2)
+        estado.tiempo_prox_basketball = tiempo_normal_box_muller(
+            z_a_usar, self.modelo.llegada_basketball_media, self.modelo.llegada_basketball_desvio)
         estado.prox_llegada_basketball = estado.reloj + estado.tiempo_prox_basketball
+        estado.eventos_futuros.programar("Llegada_B", estado.prox_llegada_basketball)
     
     def obtener_tiempo_ocupacion_handball(self, estado: EstadoSimulacion):
         """Obtiene tiempo de ocupación para handball"""
@@ -91,16 +121,13 @@ class SimuladorVectorial:
             return estado.tmp_handball_2_disponible
 
         # CASO 2: generar nuevos valores
-        estado.rnd_ocupacion_handball_1 = generar_rnd()
-        estado.rnd_ocupacion_handball_2 = generar_rnd()
-
-        z0, z1 = box_muller(
-            estado.rnd_ocupacion_handball_1,
-            estado.rnd_ocupacion_handball_2
-        )
+        (estado.rnd_ocupacion_handball_1, estado.rnd_ocupacion_handball_2,
+         z0, z1) = self.aleatorios.par_box_muller("ocupacion_H")
 
-        estado.tmp_handball_1_disponible = ocupacion_normal_box_muller(z0, 80, 20)
-        estado.tmp_handball_2_disponible = ocupacion_normal_box_muller(z1, 80, 20)
+        estado.tmp_handball_1_disponible = ocupacion_normal_box_muller(
+            z0, self.modelo.ocupacion_handball_media, self.modelo.ocupacion_handball_desvio)
+        estado.tmp_handball_2_disponible = ocupacion_normal_box_muller(
+            z1, self.modelo.ocupacion_handball_media, self.modelo.ocupacion_handball_desvio)
 
         return estado.tmp_handball_1_disponible
 
@@ -113,16 +140,13 @@ class SimuladorVectorial:
             return estado.tmp_football_2_disponible
 
         # CASO 2: generar nuevos valores
-        estado.rnd_ocupacion_football_1 = generar_rnd()
-        estado.rnd_ocupacion_football_2 = generar_rnd()
+        (estado.rnd_ocupacion_football_1, estado.rnd_ocupacion_football_2,
+         z0, z1) = self.aleatorios.par_box_muller("ocupacion_F")
 
-        z0, z1 = box_muller(
-            estado.rnd_ocupacion_football_1,
-            estado.rnd_ocupacion_football_2
-        )
-
-        estado.tmp_football_1_disponible = ocupacion_normal_box_muller(z0, 90, 10)
-        estado.tmp_football_2_disponible = ocupacion_normal_box_muller(z1, 90, 10)
+        estado.tmp_football_1_disponible = ocupacion_normal_box_muller(
+            z0, self.modelo.ocupacion_football_media, self.modelo.ocupacion_football_desvio)
+        estado.tmp_football_2_disponible = ocupacion_normal_box_muller(
+            z1, self.modelo.ocupacion_football_media, self.modelo.ocupacion_football_desvio)
 
         return estado.tmp_football_1_disponible
 
@@ -135,45 +159,20 @@ class SimuladorVectorial:
             return estado.tmp_basketball_2_disponible
 
         # CASO 2: generar nuevos valores
-        estado.rnd_ocupacion_basketball_1 = generar_rnd()
-        estado.rnd_ocupacion_basketball_2 = generar_rnd()
-
-        z0, z1 = box_muller(
-            estado.rnd_ocupacion_basketball_1,
-            estado.rnd_ocupacion_basketball_2
-        )
+        (estado.rnd_ocupacion_basketball_1, estado.rnd_ocupacion_basketball_2,
+         z0, z1) = self.aleatorios.par_box_muller("ocupacion_B")
 
-        estado.tmp_basketball_1_disponible = ocupacion_normal_box_muller(z0, 100, 30)
-        estado.tmp_basketball_2_disponible = ocupacion_normal_box_muller(z1, 100, 30)
+        estado.tmp_basketball_1_disponible = ocupacion_normal_box_muller(
+            z0, self.modelo.ocupacion_basketball_media, self.modelo.ocupacion_basketball_desvio)
+        estado.tmp_basketball_2_disponible = ocupacion_normal_box_muller(
+            z1, self.modelo.ocupacion_basketball_media, self.modelo.ocupacion_basketball_desvio)
 
         return estado.tmp_basketball_1_disponible
 
     def determinar_proximo_evento(self, estado: EstadoSimulacion) -> Tuple[str, float]:
-        """Determina el próximo evento a ocurrir"""
-        eventos = []
-        
-        # Llegadas
-        if estado.prox_llegada_handball < float('inf'):
-            eventos.append(("Llegada_H", estado.prox_llegada_handball))
-        if estado.prox_llegada_football < float('inf'):
-            eventos.append(("Llegada_F", estado.prox_llegada_football))
-        if estado.prox_llegada_basketball < float('inf'):
-            eventos.append(("Llegada_B", estado.prox_llegada_basketball))
-        
-        # Fin de juego 
-        if estado.prox_fin_juego < float('inf'):
-            eventos.append(("Fin_Juego", estado.prox_fin_juego))
-
-        # Fin de acondicionamiento
-        if estado.prox_fin_acondicionamiento < float('inf'):
-             eventos.append(("Fin_Acondicionamiento", estado.prox_fin_acondicionamiento))
-
-        # Si no hay eventos, terminar
-        if not eventos:
-            return ("Fin", float('inf'))
-        
-        # Encontrar el evento más próximo
-        return min(eventos, key=lambda x: x[1])
+        """Determina el próximo evento a ocurrir (tope del heap, sin extraerlo)"""
+        # Si no hay eventos programados devuelve ("Fin", inf)
+        return estado.eventos_futuros.proximo(estado)
     
     def manejar_llegada(self, tipo: str, estado: EstadoSimulacion):
         """Maneja la llegada de un equipo"""
@@ -189,7 +188,9 @@ class SimuladorVectorial:
             estado.id_counter_basketball += 1
         
         equipo = Equipo(tipo, id_equipo, estado.reloj)
-        estado.equipos.append(equipo)
+        self.registrar_transicion(equipo)
+        if self.exportador_columnar is not None:
+            self.exportador_columnar.agregar_equipo(equipo)
         
         # Agregar a la cola correspondiente
         if tipo == "B":
@@ -201,9 +202,10 @@ class SimuladorVectorial:
         if tipo == "H":
             self.generar_proxima_llegada_handball(estado)
         elif tipo == "F":
-            estado.rnd_football = generar_rnd()
-            estado.tiempo_prox_football = tiempo_exponencial(estado.rnd_football, 10)
+            estado.rnd_football = self.aleatorios.rnd("llegada_F")
+            estado.tiempo_prox_football = tiempo_exponencial(estado.rnd_football, self.modelo.llegada_football_media)
             estado.prox_llegada_football = estado.reloj + estado.tiempo_prox_football
+            estado.eventos_futuros.programar("Llegada_F", estado.prox_llegada_football)
         else:  # B
             self.generar_proxima_llegada_basketball(estado)
         
@@ -211,46 +213,31 @@ class SimuladorVectorial:
         self.asignar_cancha(estado)
     
     def asignar_cancha(self, estado):
+        """Asigna equipos en espera a las canchas libres según la política"""
+        while len(estado.canchas_libres) > 0:
+            equipos = self.politica.seleccionar(estado, self.modelo)
+            if not equipos:
+                return
+            if equipos[0].tipo == "B":
+                self.iniciar_basketball(equipos, estado)
+            else:
+                self.iniciar_equipo_individual(equipos[0], estado)
 
-        if estado.estado_servidor != "Libre":
-            return
-
-        hay_fh = len(estado.cola_handball_football) > 0
-        cant_b = len(estado.cola_basketball)
-
-        if not hay_fh and cant_b == 0:
-            return
-
-        # ===============================
-        # DECISIÓN DE PRIORIDAD (DOMINIO)
-        # ===============================
-
-        if cant_b >= 2:
-            # Basketball PRIORIDAD por tener 2 esperando
-            equipos = [
-                estado.cola_basketball.pop(0),
-                estado.cola_basketball.pop(0)
-            ]
-            self.iniciar_basketball(equipos, estado)
-            return
-
-        if cant_b == 1 and not hay_fh:
-            # Único Basket y no hay otros esperando
-            equipo = estado.cola_basketball.pop(0)
-            self.iniciar_basketball([equipo], estado)
-            return
-
-        # Caso contrario → prioridad H/F
-        if hay_fh:
-            equipo = estado.cola_handball_football.pop(0)
-            self.iniciar_equipo_individual(equipo, estado)
+    def iniciar_acondicionamiento(self, cancha: Cancha, equipos, estado):
+        """La cancha se acondiciona antes de que los equipos empiecen a jugar"""
+        cancha.estado = "Acondicionamiento"
+        cancha.equipos = equipos
+        cancha.prox_fin_acondicionamiento = estado.reloj + self.modelo.tiempo_acondicionamiento
+        estado.canchas_en_acondicionamiento += 1
+        estado.fotos_canchas[cancha.numero] = cancha.foto()
+        estado.eventos_futuros.programar("Fin_Acondicionamiento", cancha.prox_fin_acondicionamiento, cancha.numero)
 
     def iniciar_equipo_individual(self, equipo, estado):
+        cancha = estado.canchas[estado.canchas_libres.tomar(equipo.tipo)]
+
         # Caso con acondicionamiento
-        if estado.ultima_disciplina is not None and equipo.tipo != estado.ultima_disciplina:
-            estado.estado_servidor = "Acondicionamiento"
-            estado.equipos_actuales = [equipo]
-            estado.prox_fin_acondicionamiento = estado.reloj + 10
+        if cancha.ultima_disciplina is not None and equipo.tipo != cancha.ultima_disciplina:
+            self.iniciar_acondicionamiento(cancha, [equipo], estado)
             return
 
         # ✅ INICIO DE SERVICIO UNIFICADO
@@ -262,21 +249,27 @@ class SimuladorVectorial:
         else:  # F
             tiempo = self.obtener_tiempo_ocupacion_football(estado)
 
-        estado.equipos_actuales = [equipo]
-        estado.estado_servidor = f"Ocupado_{equipo.tipo}"
-        estado.prox_fin_juego = estado.reloj + tiempo
+        cancha.equipos = [equipo]
+        cancha.estado = f"Ocupado_{equipo.tipo}"
+        cancha.prox_fin_juego = estado.reloj + tiempo
+        estado.canchas_ocupadas += 1
+        estado.fotos_canchas[cancha.numero] = cancha.foto()
+        estado.eventos_futuros.programar("Fin_Juego", cancha.prox_fin_juego, cancha.numero)
 
     def iniciar_basketball(self, equipos, estado):
-        if estado.ultima_disciplina is not None and estado.ultima_disciplina != "B":
-            estado.estado_servidor = "Acondicionamiento"
-            estado.equipos_actuales = equipos
-            estado.prox_fin_acondicionamiento = estado.reloj + 10
+        cancha = estado.canchas[estado.canchas_libres.tomar("B")]
+
+        if cancha.ultima_disciplina is not None and cancha.ultima_disciplina != "B":
+            self.iniciar_acondicionamiento(cancha, equipos, estado)
             return
 
         tiempo = self.obtener_tiempo_ocupacion_basketball(estado)
-        estado.estado_servidor = "Ocupado_B"
-        estado.equipos_actuales = equipos
-        estado.prox_fin_juego = estado.reloj + tiempo
+        cancha.estado = "Ocupado_B"
+        cancha.equipos = equipos
+        cancha.prox_fin_juego = estado.reloj + tiempo
+        estado.canchas_ocupadas += 1
+        estado.fotos_canchas[cancha.numero] = cancha.foto()
+        estado.eventos_futuros.programar("Fin_Juego", cancha.prox_fin_juego, cancha.numero)
 
         # ✅ TODOS pasan por iniciar_servicio
         for e in equipos:
@@ -285,6 +278,9 @@ class SimuladorVectorial:
     def iniciar_servicio(self, equipo: Equipo, estado: EstadoSimulacion):
         """Inicia el servicio de un equipo y actualiza estadísticas"""
         equipo.iniciar_juego(estado.reloj)
+        self.registrar_transicion(equipo)
+        if self.estadisticas is not None:
+            self.estadisticas.registrar_espera(equipo.tipo, equipo.tiempo_espera)
 
         if equipo.tipo == "H":
             estado.equipos_handball_atendidos += 1
@@ -298,28 +294,39 @@ class SimuladorVectorial:
             estado.equipos_basketball_atendidos += 1
             estado.tiempo_espera_basketball += equipo.tiempo_espera
         
-    def manejar_fin_juego(self, estado):
+    def registrar_transicion(self, equipo: Equipo):
+        """Anota el cambio de estado del equipo en la bitácora (si hay trazabilidad)"""
+        if self.bitacora is not None:
+            self.bitacora.registrar(equipo)
 
-        for equipo in estado.equipos_actuales:
+    def manejar_fin_juego(self, estado, cancha: Cancha):
+
+        for equipo in cancha.equipos:
             equipo.finalizar_juego(estado.reloj)
-            estado.ultima_disciplina = equipo.tipo
+            self.registrar_transicion(equipo)
+            cancha.ultima_disciplina = equipo.tipo
 
-        estado.equipos_actuales = []
-        estado.estado_servidor = "Libre"
-        estado.prox_fin_juego = float("inf")
+        cancha.equipos = []
+        cancha.estado = "Libre"
+        cancha.prox_fin_juego = float("inf")
+        estado.canchas_ocupadas -= 1
+        estado.canchas_libres.liberar(cancha)
+        estado.fotos_canchas[cancha.numero] = cancha.foto()
 
         self.asignar_cancha(estado)
 
-    def manejar_fin_acondicionamiento(self, estado: EstadoSimulacion):
-        equipos = estado.equipos_actuales
+    def manejar_fin_acondicionamiento(self, estado: EstadoSimulacion, cancha: Cancha):
+        equipos = cancha.equipos
 
         # ✅ TODOS inician servicio juntos
         for e in equipos:
             self.iniciar_servicio(e, estado)
 
         tipo = equipos[0].tipo
-        estado.estado_servidor = f"Ocupado_{tipo}"
-        estado.ultima_disciplina = tipo
+        cancha.estado = f"Ocupado_{tipo}"
+        cancha.ultima_disciplina = tipo
+        estado.canchas_en_acondicionamiento -= 1
+        estado.canchas_ocupadas += 1
 
         # Tiempo de ocupación
         if tipo == "H":
@@ -329,22 +336,36 @@ class SimuladorVectorial:
         else:
             tiempo = self.obtener_tiempo_ocupacion_basketball(estado)
 
-        estado.prox_fin_juego = estado.reloj + tiempo
-        estado.prox_fin_acondicionamiento = float("inf")
+        cancha.prox_fin_juego = estado.reloj + tiempo
+        estado.eventos_futuros.programar("Fin_Juego", cancha.prox_fin_juego, cancha.numero)
+        cancha.prox_fin_acondicionamiento = float("inf")
+        estado.fotos_canchas[cancha.numero] = cancha.foto()
 
     def ejecutar_paso(self, estado_anterior: EstadoSimulacion) -> EstadoSimulacion:
-        """Ejecuta un paso de la simulación"""
-        estado = EstadoSimulacion(estado_anterior)
+        """Ejecuta un paso de la simulación.
+
+        En modo 'en_sitio' el estado i-1 se modifica directamente y se devuelve
+        el mismo objeto: la fila i-1 ya fue emitida, así que no hace falta
+        conservarlo y se evita copiar colas y la lista de equipos en cada paso.
+        """
+        if self.modo_estado == 'en_sitio':
+            estado = estado_anterior
+        else:
+            estado = EstadoSimulacion(estado_anterior)
         
         self.limpiar_ocupacion_si_corresponde(estado)
 
-        # Determinar próximo evento
-        evento, tiempo_evento = self.determinar_proximo_evento(estado)
+        # Extraer próximo evento del heap
+        evento, tiempo_evento, numero_cancha = estado.eventos_futuros.extraer(estado)
         
         # Avanzar reloj al tiempo del evento
         estado.reloj = tiempo_evento
         estado.evento_actual = evento
-        
+
+        medicion = self.instrumentacion
+        if medicion is not None:
+            inicio = perf_counter()
+
         # Manejar el evento
         if evento == "Llegada_H":
             self.manejar_llegada("H", estado)
@@ -353,177 +374,25 @@ class SimuladorVectorial:
         elif evento == "Llegada_B":
             self.manejar_llegada("B", estado)
         elif evento == "Fin_Juego":
-            self.manejar_fin_juego(estado)
+            self.manejar_fin_juego(estado, estado.canchas[numero_cancha])
         elif evento == "Fin_Acondicionamiento":
-            self.manejar_fin_acondicionamiento(estado)
+            self.manejar_fin_acondicionamiento(estado, estado.canchas[numero_cancha])
         elif evento == "Fin":
             # No hay más eventos programados
             pass
-        
+
+        if medicion is not None:
+            medicion.registrar_evento(evento, perf_counter() - inicio)
         return estado
     
     def crear_vector_fila(self, estado: EstadoSimulacion, iteracion: int) -> Dict:
         """Crea una fila para el vector de resultados"""
+        return formatear_fila(self.capturar_fila(estado, iteracion))
 
-        # =============================
-        # Formateo de colas
-        # =============================
-        cola_fh = ", ".join(str(e) for e in estado.cola_handball_football)
-        cola_b = ", ".join(str(e) for e in estado.cola_basketball)
-
-        # =============================
-        # Equipos actuales en cancha
-        # =============================
-        equipos_actuales = ", ".join(str(e) for e in estado.equipos_actuales)
-
-        # =============================
-        # Z usados Handball
-        # =============================
-        z_handball_usado = None
-        if estado.hay_z_disponible_handball:
-            z_handball_usado = (
-                estado.z_handball_1
-                if estado.z_handball_1 is not None
-                else estado.z_handball_0
-            )
-        else:
-            z_handball_usado = (
-                estado.z_handball_0
-                if estado.z_handball_0 is not None
-                else None
-            )
+    def capturar_fila(self, estado: EstadoSimulacion, iteracion: int) -> FilaCruda:
+        """Foto cruda del estado; el formateo se hace al mostrarla o exportarla"""
+        return capturar_fila(estado, iteracion, self.bitacora)
 
-        # =============================
-        # Z usados Basketball
-        # =============================
-        z_basketball_usado = None
-        if estado.hay_z_disponible_basketball:
-            z_basketball_usado = (
-                estado.z_basketball_1
-                if estado.z_basketball_1 is not None
-                else estado.z_basketball_0
-            )
-        else:
-            z_basketball_usado = (
-                estado.z_basketball_0
-                if estado.z_basketball_0 is not None
-                else None
-            )
-
-        # =============================
-        # === EQUIPOS (COLUMNAS CLAVE) ===
-        # =============================
-       
-        if self.trazabilidad_completa or iteracion <= self.max_trazabilidad:
-            equipos_id = ", ".join(e.id for e in estado.equipos)
-            equipos_estado = ", ".join(
-                f"{e.id}:{e.estado}" for e in estado.equipos
-            )
-            equipos_tmp_llegada = ", ".join(
-                f"{e.id}:{round(e.tiempo_llegada, 2)}" for e in estado.equipos
-            )
-        else:
-            equipos_id = ""
-            equipos_estado = ""
-            equipos_tmp_llegada = ""
-
-        # =============================
-        # Vector
-        # =============================
-        return {
-            "Iteracion": len(self.estados) - 1,
-            "Evento": estado.evento_actual,
-            "Reloj (min)": round(estado.reloj, 2),
-            "Reloj (h)": round(estado.reloj / 60, 2),
-
-            # ---------- Handball ----------
-            "RND1_H": round(estado.rnd_handball_1, 4) if estado.rnd_handball_1 is not None else "",
-            "RND2_H": round(estado.rnd_handball_2, 4) if estado.rnd_handball_2 is not None else "",
-            "Z0_H": round(estado.z_handball_0, 4) if estado.z_handball_0 is not None else "",
-            "Z1_H": round(estado.z_handball_1, 4) if estado.z_handball_1 is not None else "",
-            "Z_Usado_H": round(z_handball_usado, 4) if z_handball_usado is not None else "",
-            "Tmp_Prox_H": round(estado.tiempo_prox_handball, 2) if estado.tiempo_prox_handball is not None else "",
-            "Prox_Llegada_H": round(estado.prox_llegada_handball, 2)
-            if estado.prox_llegada_handball != float("inf") else "",
-
-            # ---------- Football ----------
-            "RND_F": round(estado.rnd_football, 4) if estado.rnd_football is not None else "",
-            "Tmp_Prox_F": round(estado.tiempo_prox_football, 2) if estado.tiempo_prox_football is not None else "",
-            "Prox_Llegada_F": round(estado.prox_llegada_football, 2)
-            if estado.prox_llegada_football != float("inf") else "",
-
-            # ---------- Basketball ----------
-            "RND1_B": round(estado.rnd_basketball_1, 4) if estado.rnd_basketball_1 is not None else "",
-            "RND2_B": round(estado.rnd_basketball_2, 4) if estado.rnd_basketball_2 is not None else "",
-            "Z0_B": round(estado.z_basketball_0, 4) if estado.z_basketball_0 is not None else "",
-            "Z1_B": round(estado.z_basketball_1, 4) if estado.z_basketball_1 is not None else "",
-            "Z_Usado_B": round(z_basketball_usado, 4) if z_basketball_usado is not None else "",
-            "Tmp_Prox_B": round(estado.tiempo_prox_basketball, 2) if estado.tiempo_prox_basketball is not None else "",
-            "Prox_Llegada_B": round(estado.prox_llegada_basketball, 2)
-            if estado.prox_llegada_basketball != float("inf") else "",
-
-            # ---------- Ocupación Handball ----------
-            "RND1_Ocup_H": round(estado.rnd_ocupacion_handball_1, 4)
-                if estado.rnd_ocupacion_handball_1 is not None else "",
-            "RND2_Ocup_H": round(estado.rnd_ocupacion_handball_2, 4)
-                if estado.rnd_ocupacion_handball_2 is not None else "",
-            "TMP1_Ocup_H": round(estado.tmp_handball_1_disponible, 2)
-                if estado.tmp_handball_1_disponible is not None else "",
-            "TMP2_Ocup_H": round(estado.tmp_handball_2_disponible, 2)
-                if estado.tmp_handball_2_disponible is not None else "",
-
-            # ---------- Ocupación Football ----------
-            "RND1_Ocup_F": round(estado.rnd_ocupacion_football_1, 4)
-                if estado.rnd_ocupacion_football_1 is not None else "",
-            "RND2_Ocup_F": round(estado.rnd_ocupacion_football_2, 4)
-                if estado.rnd_ocupacion_football_2 is not None else "",
-            "TMP1_Ocup_F": round(estado.tmp_football_1_disponible, 2)
-                if estado.tmp_football_1_disponible is not None else "",
-            "TMP2_Ocup_F": round(estado.tmp_football_2_disponible, 2)
-                if estado.tmp_football_2_disponible is not None else "",
-
-            # ---------- Ocupación Basketball ----------
-            "RND1_Ocup_B": round(estado.rnd_ocupacion_basketball_1, 4)
-                if estado.rnd_ocupacion_basketball_1 is not None else "",
-            "RND2_Ocup_B": round(estado.rnd_ocupacion_basketball_2, 4)
-                if estado.rnd_ocupacion_basketball_2 is not None else "",
-            "TMP1_Ocup_B": round(estado.tmp_basketball_1_disponible, 2)
-                if estado.tmp_basketball_1_disponible is not None else "",
-            "TMP2_Ocup_B": round(estado.tmp_basketball_2_disponible, 2)
-                if estado.tmp_basketball_2_disponible is not None else "",
-
-            # ---------- Ocupación ----------
-            "Proximo_Fin_Juego": round(estado.prox_fin_juego, 2)
-            if estado.prox_fin_juego != float("inf") else "",
-
-            # ---------- Colas ----------
-            "Cola_FH": cola_fh,
-            "Cola_B": cola_b,
-
-            # ---------- Servidor ----------
-            "Estado_Servidor": estado.estado_servidor,
-            "Equipos_Actuales": equipos_actuales,
-
-            # ---------- Estadísticas ----------
-            "Cant_H_Atend": estado.equipos_handball_atendidos,
-            "Acu_Espera_H": round(estado.tiempo_espera_handball, 2),
-            "Cant_F_Atend": estado.equipos_football_atendidos,
-            "Acu_Espera_F": round(estado.tiempo_espera_football, 2),
-            "Cant_B_Atend": estado.equipos_basketball_atendidos,
-            "Acu_Espera_B": round(estado.tiempo_espera_basketball, 2),
-
-            # ---------- Equipos ----------
-            "Equipos_ID": equipos_id,
-            "Equipos_Estado": equipos_estado,
-            "Equipos_TMP_Llegada": equipos_tmp_llegada,
-
-            # ---------- Control ----------
-            "Equipos_Lista": len(estado.equipos),
-            "Z_Disp_H": estado.hay_z_disponible_handball,
-            "Z_Disp_B": estado.hay_z_disponible_basketball,
-        }
-
-    
     def ejecutar(self, mostrar_primeras: int = 10):
         """Ejecuta la simulación completa con el criterio de parada seleccionado"""
         print("="*80)
@@ -536,58 +405,10 @@ class SimuladorVectorial:
             print(f"Iteraciones máximas: {self.limite_iteraciones} filas")
         print()
 
-        if self.modo_parada == "iteraciones" and self.limite_iteraciones > self.max_trazabilidad:
-            self.trazabilidad_completa = False
-
-        if self.modo_parada == "tiempo":  
-            self.trazabilidad_completa = False
+        motivo_fin = self.simular(mostrar_primeras, progreso=self.imprimir_progreso)
+        print(motivo_fin)
         
-        # Estado inicial
-        estado_inicial = EstadoSimulacion()
-        self.estados.append(estado_inicial)
-        self.vector_resultados.append(self.crear_vector_fila(estado_inicial, iteracion=0))
-        
-        iteracion = 0
-        seguir = True
-        
-        while seguir:
-            estado_anterior = self.estados[-1]
-            
-            # Verificar si hay eventos pendientes
-            evento, tiempo_evento = self.determinar_proximo_evento(estado_anterior)
-            if evento == "Fin":
-                # No hay más eventos programados
-                print("No hay más eventos programados. Finalizando simulación.")
-                break
-            
-            # Verificar criterio de parada según el modo seleccionado
-            if self.modo_parada == 'tiempo':
-                # Parar por tiempo: si el próximo evento supera el tiempo límite
-                if tiempo_evento > self.limite_tiempo:
-                    print(f"Próximo evento ({tiempo_evento/60:.2f}h) supera el tiempo límite ({self.limite_tiempo/60:.2f}h).")
-                    seguir = False
-                    break
-            elif self.modo_parada == 'iteraciones':
-                # Parar por iteraciones: si alcanzamos el límite de filas
-                if iteracion >= self.limite_iteraciones:
-                    print(f"Alcanzado el límite de {self.limite_iteraciones} iteraciones.")
-                    seguir = False
-                    break
-            
-            # Ejecutar un paso
-            nuevo_estado = self.ejecutar_paso(estado_anterior)
-            self.estados.append(nuevo_estado)
-
-            iteracion += 1
-            self.vector_resultados.append(
-                self.crear_vector_fila(nuevo_estado, iteracion)
-            )
-            
-            # Mostrar progreso cada 10 iteraciones
-            if iteracion % 10 == 0:
-                print(f"Progreso: Iteración {iteracion}, Reloj: {nuevo_estado.reloj/60:.2f}h")
-        
-        print(f"\nSimulación completada en {iteracion} iteraciones")
+        print(f"\nSimulación completada en {self.iteraciones} iteraciones")
         print(f"Tiempo final: {self.estados[-1].reloj/60:.2f} horas")
         
         # Mostrar resultados según lo solicitado
@@ -601,14 +422,379 @@ class SimuladorVectorial:
             self.exportar_a_csv()
         else:
             print("\n(No se generó archivo CSV)")
+
+        if self.exportar_columnar:
+            ruta_archivo = self.guardar_columnar()
+            if ruta_archivo is not None:
+                print(f"Tablas columnares exportadas a {ruta_archivo}")
+
+        # Reporte de rendimiento (solo si se instrumentó la corrida)
+        self.generar_reporte_rendimiento()
+
+    def imprimir_progreso(self, iteracion: int, estado: EstadoSimulacion):
+        """Muestra el progreso cada 10 iteraciones"""
+        if iteracion % 10 == 0:
+            print(f"Progreso: Iteración {iteracion}, Reloj: {estado.reloj/60:.2f}h")
+
+    def simular(self, mostrar_primeras: int = 0, progreso=None) -> str:
+        """Corre el bucle de eventos sin escribir en consola.
+
+        progreso, si se indica, se llama como progreso(iteracion, estado)
+        después de cada paso. Devuelve el motivo por el que terminó.
+        """
+        # La bitácora se lleva solo si alguien va a ver los equipos (filas mostradas,
+        # historial o CSV); sin trazabilidad completa se corta en max_trazabilidad
+        con_equipos = (self.trazabilidad_completa or mostrar_primeras > 0 or self.historial_completo
+                       or getattr(self, "exportar_csv", False))
+        self.bitacora = BitacoraEquipos() if con_equipos else None
+
+        # =============================
+        # Retención: estados i-1 e i, primeras filas y últimas 2;
+        # el resto va directo al exportador
+        # =============================
+        self.estados = deque(maxlen=None if self.historial_completo else 2)
+        self.vector_resultados = []
+        self.ultimas_filas = deque(maxlen=2)
+        self.total_filas = 0
+        self.mostrar_primeras = mostrar_primeras
+        self.exportador = ExportadorCSV() if getattr(self, "exportar_csv", False) else None
+        self.exportador_columnar = ExportadorColumnar() if self.exportar_columnar else None
+        self.instrumentacion = Instrumentacion() if self.instrumentar else None
+        self.bitacora_guardada = None
+        
+        # Estado inicial
+        estado_inicial = EstadoSimulacion(aleatorios=self.aleatorios, modelo=self.modelo)
+        self.estados.append(estado_inicial)
+        self.estadisticas = EstadisticasEnLinea(estado_inicial.reloj)
+        self.estadisticas.observar(estado_inicial)
+        self.registrar_fila(estado_inicial, iteracion=0)
+        self.iteraciones = 0
+
+        return self.bucle_eventos(progreso)
+
+    def reanudar(self, progreso=None) -> str:
+        """Continúa una corrida restaurada con restaurar_punto_control.
+
+        Los exportadores empiezan vacíos: el CSV y el .npz de una corrida
+        reanudada cubren solo las filas generadas desde el punto de control.
+        """
+        self.exportador = ExportadorCSV() if getattr(self, "exportar_csv", False) else None
+        self.exportador_columnar = ExportadorColumnar() if self.exportar_columnar else None
+        if self.exportador_columnar is not None:
+            # Los equipos que siguen en cola o en una cancha entran en la tabla de equipos
+            for equipo in self.estados[-1].equipos_vivos():
+                self.exportador_columnar.agregar_equipo(equipo)
+        self.instrumentacion = Instrumentacion() if self.instrumentar else None
+        return self.bucle_eventos(progreso)
+
+    def bucle_eventos(self, progreso=None) -> str:
+        """Avanza desde el último estado hasta cumplir el criterio de parada"""
+        iteracion = iteracion_inicial = self.iteraciones
+        cada = self.punto_control_cada if self.ruta_punto_control else 0
+        corte = self.corte_bitacora()
+        rapido = self.avance_rapido
+        if rapido and (self.exportador_columnar is not None or self.historial_completo):
+            raise ValueError("El avance rápido no genera todas las filas: no admite la exportación "
+                             "columnar ni el historial completo")
+        medicion = self.instrumentacion
+        if medicion is not None:
+            self.aleatorios = AleatoriosMedidos(self.aleatorios, medicion)
+            inicio = perf_counter()
+
+        while True:
+            if rapido and iteracion >= self.mostrar_primeras:
+                # Ya se generaron las filas que se muestran: el resto, en avance rápido
+                motivo_fin, iteracion = self.avanzar_rapido(iteracion, cada, corte)
+                break
+
+            estado_anterior = self.estados[-1]
+
+            motivo_fin = self.motivo_parada(estado_anterior, iteracion)
+            if motivo_fin is not None:
+                break
+
+            if iteracion == corte:
+                self.bitacora = None   # las filas siguientes ya no llevan equipos
+
+            # Ejecutar un paso (en modo 'en_sitio' el historial queda con un único estado)
+            if medicion is None:
+                nuevo_estado = self.ejecutar_paso(estado_anterior)
+            else:
+                nuevo_estado = medicion.medir("paso", self.ejecutar_paso, estado_anterior)
+            if nuevo_estado is not estado_anterior:
+                self.estados.append(nuevo_estado)
+
+            iteracion += 1
+            if medicion is None:
+                self.estadisticas.observar(nuevo_estado)
+                self.registrar_fila(nuevo_estado, iteracion)
+            else:
+                medicion.medir("estadisticas", self.estadisticas.observar, nuevo_estado)
+                fila = medicion.medir("captura_filas", self.capturar_fila, nuevo_estado, iteracion)
+                medicion.medir("retencion_exportacion", self.retener_fila, fila, nuevo_estado, iteracion)
+
+            if progreso is not None:
+                progreso(iteracion, nuevo_estado)
+
+            if cada and iteracion % cada == 0:
+                self.iteraciones = iteracion
+                self.guardar_punto_control()
+
+        if medicion is not None:
+            medicion.tiempo_total += perf_counter() - inicio
+            medicion.pasos += iteracion - iteracion_inicial
+            self.aleatorios = self.aleatorios.origen
+
+        self.iteraciones = iteracion
+        if self.ruta_punto_control:
+            self.guardar_punto_control()
+        return motivo_fin
+
+    def corte_bitacora(self) -> Optional[int]:
+        """Iteración de la última fila con vista por equipo (None: no se corta)"""
+        if self.bitacora is None or self.trazabilidad_completa:
+            return None
+        return self.max_trazabilidad
+
+    # =============================
+    # Puntos de control
+    # =============================
+
+    def punto_control(self) -> Dict:
+        """Estado vivo mínimo para continuar la corrida en otro proceso.
+
+        El estado solo referencia a los equipos en cola o en una cancha, y las
+        filas retenidas van sin su bitácora: la bitácora se escribe aparte y
+        de forma incremental (ver guardar_punto_control).
+        """
+        aleatorios = self.aleatorios
+        if isinstance(aleatorios, AleatoriosMedidos):
+            aleatorios = aleatorios.origen
+        return {
+            "iteraciones": self.iteraciones,
+            "estado": self.estados[-1],
+            "aleatorios": aleatorios,
+            # AleatoriosGlobales no guarda estado propio: se usa el del módulo random
+            "estado_random": random.getstate() if isinstance(aleatorios, AleatoriosGlobales) else None,
+            "modelo": self.modelo,
+            "politica": self.politica,
+            "modo_parada": self.modo_parada,
+            "limite_tiempo": self.limite_tiempo,
+            "limite_iteraciones": self.limite_iteraciones,
+            "modo_estado": self.modo_estado,
+            "historial_completo": self.historial_completo,
+            "bitacora": None,   # (transiciones, equipos) guardados en el archivo de la bitácora
+            "bitacora_activa": self.bitacora is not None,
+            "trazabilidad_completa": self.trazabilidad_completa,
+            "max_trazabilidad": self.max_trazabilidad,
+            "estadisticas": self.estadisticas,
+            "mostrar_primeras": self.mostrar_primeras,
+            "vector_resultados": [fila._replace(bitacora=None) for fila in self.vector_resultados],
+            "ultimas_filas": [fila._replace(bitacora=None) for fila in self.ultimas_filas],
+            "total_filas": self.total_filas,
+        }
+
+    def guardar_punto_control(self, ruta: Optional[str] = None) -> str:
+        """Escribe el punto de control (por defecto en ruta_punto_control).
+
+        La bitácora va a un archivo aparte al que cada punto de control le
+        agrega solo las transiciones nuevas desde el anterior.
+        """
+        ruta = ruta or self.ruta_punto_control
+        datos = self.punto_control()
+        bitacora = self.bitacora_en_uso()
+        if bitacora is not None:
+            desde = (0, 0)
+            if self.bitacora_guardada is not None and self.bitacora_guardada[0] == ruta:
+                desde = self.bitacora_guardada[1:]
+            datos["bitacora"] = agregar_bitacora(bitacora, ruta_bitacora(ruta), desde)
+            self.bitacora_guardada = (ruta,) + datos["bitacora"]
+        return escribir_punto_control(datos, ruta)
+
+    def bitacora_en_uso(self) -> Optional[BitacoraEquipos]:
+        """Bitácora de la corrida: la activa o, pasado el corte, la de las filas retenidas"""
+        if self.bitacora is not None:
+            return self.bitacora
+        for fila in self.vector_resultados:
+            if fila.bitacora is not None:
+                return fila.bitacora
+        return next((fila.bitacora for fila in self.ultimas_filas if fila.bitacora is not None), None)
+
+    def restaurar_punto_control(self, datos: Dict, aleatorios=None):
+        """Deja el simulador listo para reanudar() desde `datos`.
+
+        aleatorios, si se indica, reemplaza a la fuente guardada: desde un
+        mismo punto (por ejemplo, después del calentamiento) se pueden
+        ramificar corridas con semillas distintas.
+        """
+        for atributo in ("iteraciones", "modelo", "politica", "modo_parada", "limite_tiempo",
+                         "limite_iteraciones", "modo_estado", "historial_completo",
+                         "trazabilidad_completa", "max_trazabilidad", "estadisticas",
+                         "mostrar_primeras", "total_filas"):
+            setattr(self, atributo, datos[atributo])
+        self.estados = deque([datos["estado"]], maxlen=None if self.historial_completo else 2)
+
+        # Las filas que tenían transiciones vuelven a apuntar a la bitácora leída
+        bitacora = datos["bitacora"]
+        self.bitacora = bitacora if datos["bitacora_activa"] else None
+        self.vector_resultados = [fila._replace(bitacora=bitacora) if fila.transiciones else fila
+                                  for fila in datos["vector_resultados"]]
+        self.ultimas_filas = deque((fila._replace(bitacora=bitacora) if fila.transiciones else fila
+                                    for fila in datos["ultimas_filas"]), maxlen=2)
+        self.bitacora_guardada = None   # el primer punto de control reescribe la bitácora completa
+
+        if aleatorios is not None:
+            self.aleatorios = aleatorios
+        else:
+            self.aleatorios = datos["aleatorios"]
+            if datos["estado_random"] is not None:
+                random.setstate(datos["estado_random"])
+
+    @classmethod
+    def desde_punto_control(cls, ruta: str, aleatorios=None) -> "SimuladorVectorial":
+        """Crea un simulador restaurado desde el archivo de punto de control"""
+        simulador = cls()
+        simulador.restaurar_punto_control(leer_punto_control(ruta), aleatorios)
+        return simulador
+
+    def avanzar_rapido(self, iteracion: int, cada: int = 0, corte: Optional[int] = None) -> Tuple[str, int]:
+        """Corre hasta el criterio de parada sin armar filas ni llamar al progreso.
+
+        El estado se modifica en el lugar (en cualquier modo_estado: la
+        trayectoria es la misma) y siguen al día los acumuladores, las
+        estadísticas en línea y la bitácora (hasta la iteración `corte`). Solo se captura una fila antes de
+        un paso que podría ser el último, para tener las 2 últimas filas al
+        terminar. Devuelve el motivo de fin y la última iteración.
+        """
+        estado = self.estados[-1]
+        bitacora = self.bitacora
+        estadisticas = self.estadisticas
+        eventos_futuros = estado.eventos_futuros
+        modo_estado, self.modo_estado = self.modo_estado, 'en_sitio'
+
+        INF = float("inf")
+        limite_tiempo = self.limite_tiempo if self.modo_parada == 'tiempo' else INF
+        limite_iteraciones = self.limite_iteraciones if self.modo_parada == 'iteraciones' else None
+        comienzo = inicial = iteracion   # la fila de `comienzo` ya se registró
+        previa = None
+
+        while True:
+            evento, tiempo_evento = eventos_futuros.proximo(estado)
+            if (evento == "Fin" or tiempo_evento > limite_tiempo
+                    or (limite_iteraciones is not None and iteracion >= limite_iteraciones)):
+                motivo_fin = self.motivo_parada(estado, iteracion)
+                break
+
+            # Cota del evento siguiente a este paso: las llegadas de los otros
+            # tipos no cambian en este paso y siguen programadas. Si la cota
+            # cae dentro del límite, este paso no puede ser el último.
+            if evento == "Llegada_H":
+                cota = min(estado.prox_llegada_football, estado.prox_llegada_basketball)
+            elif evento == "Llegada_F":
+                cota = min(estado.prox_llegada_handball, estado.prox_llegada_basketball)
+            elif evento == "Llegada_B":
+                cota = min(estado.prox_llegada_handball, estado.prox_llegada_football)
+            else:
+                cota = min(estado.prox_llegada_handball, estado.prox_llegada_football,
+                           estado.prox_llegada_basketball)
+            if (cota > limite_tiempo or cota == INF
+                    or (limite_iteraciones is not None and iteracion + 1 >= limite_iteraciones)):
+                previa = capturar_fila(estado, iteracion, bitacora)
+            if iteracion == corte:
+                self.bitacora = bitacora = None
+
+            self.ejecutar_paso(estado)
+            iteracion += 1
+            estadisticas.observar(estado)
+
+            if cada and iteracion % cada == 0:
+                self.iteraciones = iteracion
+                self.total_filas += iteracion - inicial
+                inicial = iteracion
+                self.guardar_punto_control()
+
+        self.modo_estado = modo_estado
+        self.estados[-1] = estado
+        self.total_filas += iteracion - inicial
+
+        # Materializar las 2 últimas filas (pasan también por el exportador CSV)
+        if iteracion > comienzo:
+            if previa is None or previa.iteracion != iteracion - 1:
+                raise RuntimeError("Avance rápido: no se capturó la anteúltima fila")
+            ultimas = [previa, capturar_fila(estado, iteracion, bitacora)]
+            if previa.iteracion == comienzo:
+                ultimas = ultimas[1:]   # la anteúltima ya pasó por registrar_fila
+            for fila in ultimas:
+                self.ultimas_filas.append(fila)
+                if self.exportador is not None:
+                    self.exportador.agregar(fila)
+        return motivo_fin, iteracion
+
+    def motivo_parada(self, estado: EstadoSimulacion, iteracion: int) -> Optional[str]:
+        """Motivo por el que la corrida termina antes del próximo evento (None si sigue)"""
+        # Verificar si hay eventos pendientes
+        evento, tiempo_evento = self.determinar_proximo_evento(estado)
+        if evento == "Fin":
+            # No hay más eventos programados
+            return "No hay más eventos programados. Finalizando simulación."
+
+        # Verificar criterio de parada según el modo seleccionado
+        if self.modo_parada == 'tiempo':
+            # Parar por tiempo: si el próximo evento supera el tiempo límite
+            if tiempo_evento > self.limite_tiempo:
+                return f"Próximo evento ({tiempo_evento/60:.2f}h) supera el tiempo límite ({self.limite_tiempo/60:.2f}h)."
+        elif self.modo_parada == 'iteraciones':
+            # Parar por iteraciones: si alcanzamos el límite de filas
+            if iteracion >= self.limite_iteraciones:
+                return f"Alcanzado el límite de {self.limite_iteraciones} iteraciones."
+        return None
+
+    def resultados(self) -> Dict:
+        """Indicadores del estado final (sin formato, para análisis o replicaciones)"""
+        estado_final = self.estados[-1]
+        resultado = {
+            "iteraciones": self.iteraciones,
+            "reloj": estado_final.reloj,
+            "cola_FH": len(estado_final.cola_handball_football),
+            "cola_B": len(estado_final.cola_basketball),
+        }
+        for tipo, cantidad, tiempo_total in [
+            ("H", estado_final.equipos_handball_atendidos, estado_final.tiempo_espera_handball),
+            ("F", estado_final.equipos_football_atendidos, estado_final.tiempo_espera_football),
+            ("B", estado_final.equipos_basketball_atendidos, estado_final.tiempo_espera_basketball),
+        ]:
+            resultado[f"atendidos_{tipo}"] = cantidad
+            resultado[f"espera_promedio_{tipo}"] = tiempo_total / cantidad if cantidad > 0 else float("nan")
+        atendidos = resultado["atendidos_H"] + resultado["atendidos_F"] + resultado["atendidos_B"]
+        espera_total = (estado_final.tiempo_espera_handball + estado_final.tiempo_espera_football
+                        + estado_final.tiempo_espera_basketball)
+        resultado["espera_promedio"] = espera_total / atendidos if atendidos > 0 else float("nan")
+        if self.estadisticas is not None:
+            resultado.update(self.estadisticas.resumen())
+        return resultado
     
+    def registrar_fila(self, estado: EstadoSimulacion, iteracion: int):
+        """Captura la fila cruda del vector y le aplica la política de retención"""
+        self.retener_fila(self.capturar_fila(estado, iteracion), estado, iteracion)
+
+    def retener_fila(self, fila: FilaCruda, estado: EstadoSimulacion, iteracion: int):
+        """Guarda la fila si se muestra y la pasa a los exportadores"""
+        self.total_filas += 1
+        if self.historial_completo or len(self.vector_resultados) < self.mostrar_primeras:
+            self.vector_resultados.append(fila)
+        self.ultimas_filas.append(fila)
+        if self.exportador is not None:
+            self.exportador.agregar(fila)
+        if self.exportador_columnar is not None:
+            self.exportador_columnar.agregar(estado, iteracion)
+
     def mostrar_resultados(self, mostrar_primeras: int):
         """Muestra las primeras filas y las últimas dos según configuración"""
         print("\n" + "="*80)
         print("VECTOR DE SIMULACIÓN")
         print("="*80)
         
-        total_filas = len(self.vector_resultados)
+        total_filas = self.total_filas
         
         # Ajustar cuántas filas mostrar al inicio
         filas_a_mostrar_inicio = min(mostrar_primeras, total_filas)
@@ -621,19 +807,20 @@ class SimuladorVectorial:
         # Mostrar las últimas 2 filas SI hay más filas que las mostradas al inicio
         if total_filas > filas_a_mostrar_inicio:
             print(f"\n--- ÚLTIMAS 2 FILAS ---")
-            self.mostrar_tabla(self.vector_resultados[-2:])
+            self.mostrar_tabla(list(self.ultimas_filas))
         elif total_filas == filas_a_mostrar_inicio and total_filas >= 2:
             # Si solo hay las filas mostradas al inicio, mostrar las últimas 2 de esas
             print(f"\n--- ÚLTIMAS 2 FILAS (de las mostradas) ---")
-            self.mostrar_tabla(self.vector_resultados[-2:])
+            self.mostrar_tabla(list(self.ultimas_filas))
         
         print(f"\nTotal de filas generadas: {total_filas}")
     
-    def mostrar_tabla(self, filas: List[Dict]):
+    def mostrar_tabla(self, filas: List[FilaCruda]):
         """Muestra una tabla legible con ancho dinámico por columna"""
 
         if not filas:
             return
+        filas = formatear_filas(filas)
 
         COLUMNAS_VISIBLES = [
             "Iteracion",
@@ -712,134 +899,79 @@ class SimuladorVectorial:
         
         print("\n--- ESTADO FINAL ---")
         print(f"Reloj final: {estado_final.reloj/60:.2f} horas")
-        print(f"Estado del servidor: {estado_final.estado_servidor}")
+        if len(estado_final.canchas) == 1:
+            print(f"Estado del servidor: {estado_final.estado_servidor}")
+        else:
+            print(f"Canchas: {estado_final.canchas_ocupadas} ocupadas, "
+                  f"{estado_final.canchas_en_acondicionamiento} en acondicionamiento, "
+                  f"{len(estado_final.canchas_libres)} libres (de {len(estado_final.canchas)})")
         print(f"Equipos en cola F/H: {len(estado_final.cola_handball_football)}")
         print(f"Equipos en cola B: {len(estado_final.cola_basketball)}")
-        print(f"Total de equipos creados: {len(estado_final.equipos)}")
+        print(f"Total de equipos creados: {estado_final.equipos_creados}")
+
+        if self.estadisticas is not None:
+            self.mostrar_estadisticas()
+
+    def generar_reporte_rendimiento(self):
+        """Tiempos por etapa y por tipo de evento de la última corrida instrumentada"""
+        if self.instrumentacion is not None:
+            self.instrumentacion.mostrar()
+
+    def mostrar_estadisticas(self):
+        """Indicadores ponderados en el tiempo y distribución de la espera"""
+        resumen = self.estadisticas.resumen()
+
+        print("\n--- INDICADORES PONDERADOS EN EL TIEMPO ---")
+        print(f"Largo promedio de cola F/H: {resumen['cola_promedio_FH']:.2f} equipos")
+        print(f"Largo promedio de cola B: {resumen['cola_promedio_B']:.2f} equipos")
+        print(f"Cancha ocupada: {resumen['cancha_ocupada']:.1%}")
+        print(f"Cancha en acondicionamiento: {resumen['cancha_acondicionamiento']:.1%}")
+        print(f"Cancha libre: {resumen['cancha_libre']:.1%}")
+
+        print("\n--- DISTRIBUCIÓN DE LA ESPERA (min) ---")
+        for tipo, nombre in [("H", "HANDBALL"), ("F", "FOOTBALL"), ("B", "BASKETBALL")]:
+            if self.estadisticas.espera[tipo].n == 0:
+                continue
+            percentiles = ", ".join(
+                f"p{round(p * 100)} {resumen[f'espera_p{round(p * 100)}_{tipo}']:.2f}" for p in PERCENTILES_ESPERA
+            )
+            print(f"{nombre}: desvío {resumen[f'espera_desvio_{tipo}']:.2f}, "
+                  f"máxima {resumen[f'espera_maxima_{tipo}']:.2f}, {percentiles}")
     
     def exportar_a_csv(self):
         """Exporta los resultados a un archivo CSV con columnas por equipo,
         mostrando FINALIZADO solo la primera vez que ocurre.
         """
-
-        if not self.vector_resultados:
+        ruta_archivo = self.guardar_csv()
+        if ruta_archivo is None:
             print("No hay datos para exportar")
             return
 
-        import os
-        from datetime import datetime
-        import pandas as pd
-
-
-        df = pd.DataFrame(self.vector_resultados)
-
-        filas_expand = []
-        max_equipos = 0
-
-        # =============================
-        # Calcular máximo de equipos
-        # =============================
-        for _, fila in df.iterrows():
-            ids = fila.get("Equipos_ID", "")
-            cant = len(ids.split(", ")) if ids else 0
-            max_equipos = max(max_equipos, cant)
-
-        # =============================
-        # Estados anteriores por equipo
-        # =============================
-        estados_previos = {}   # clave: ID equipo → estado anterior
-
-        # =============================
-        # Expandir filas
-        # =============================
-        for _, fila in df.iterrows():
-            nueva_fila = fila.drop(
-                ["Equipos_ID", "Equipos_Estado", "Equipos_TMP_Llegada"],
-                errors="ignore"
-            ).to_dict()
-
-            ids = fila.get("Equipos_ID", "").split(", ") if fila.get("Equipos_ID") else []
-            estados = fila.get("Equipos_Estado", "").split(", ") if fila.get("Equipos_Estado") else []
-            tmps = fila.get("Equipos_TMP_Llegada", "").split(", ") if fila.get("Equipos_TMP_Llegada") else []
-
-            for i in range(max_equipos):
-                idx = i + 1
-
-                if i < len(ids):
-                    eq_id = ids[i]
-                    estado_actual = estados[i].split(":")[1]
-                    tmp_llegada = float(tmps[i].split(":")[1])
-
-                    estado_anterior = estados_previos.get(eq_id)
-
-                    # 🔴 REGLA DEFINITIVA
-                    if estado_actual == "Finalizado" and estado_anterior == "Finalizado":
-                        # No mostrar más
-                        nueva_fila[f"Equipo_{idx}_ID"] = ""
-                        nueva_fila[f"Equipo_{idx}_Estado"] = ""
-                        nueva_fila[f"Equipo_{idx}_TMP_Llegada"] = ""
-                    else:
-                        nueva_fila[f"Equipo_{idx}_ID"] = eq_id
-                        nueva_fila[f"Equipo_{idx}_Estado"] = estado_actual
-                        nueva_fila[f"Equipo_{idx}_TMP_Llegada"] = tmp_llegada
+        print(f"\nDatos exportados a {ruta_archivo}")
 
-                    # Actualizar estado previo
-                    estados_previos[eq_id] = estado_actual
+    def guardar_csv(self) -> Optional[str]:
+        """Escribe el CSV sin salida por consola y devuelve su ruta (None si no hay filas)"""
+        exportador = self.exportador
+        if exportador is None:
+            # No hubo exportador durante la corrida: se exportan las filas retenidas
+            exportador = ExportadorCSV()
+            for fila in self.vector_resultados:
+                exportador.agregar(fila)
 
-                else:
-                    nueva_fila[f"Equipo_{idx}_ID"] = ""
-                    nueva_fila[f"Equipo_{idx}_Estado"] = ""
-                    nueva_fila[f"Equipo_{idx}_TMP_Llegada"] = ""
-
-            filas_expand.append(nueva_fila)
-
-        df_final = pd.DataFrame(filas_expand)
-
-        # =============================
-        # Ordenar columnas
-        # =============================
-        column_order = [
-            'Iteracion', 'Evento', 'Reloj (min)', 'Reloj (h)',
-
-            'RND1_H', 'RND2_H', 'Tmp_Prox_H', 'Prox_Llegada_H',
-            'RND_F', 'Tmp_Prox_F', 'Prox_Llegada_F',
-            'RND1_B', 'RND2_B', 'Tmp_Prox_B', 'Prox_Llegada_B',
-
-            'RND1_Ocup_H', 'RND2_Ocup_H', 'TMP1_Ocup_H', 'TMP2_Ocup_H',
-            'RND1_Ocup_F', 'RND2_Ocup_F', 'TMP1_Ocup_F', 'TMP2_Ocup_F',
-            'RND1_Ocup_B', 'RND2_Ocup_B', 'TMP1_Ocup_B', 'TMP2_Ocup_B',
-
-            'Proximo_Fin_Juego',
-            'Cola_FH', 'Cola_B',
-            'Estado_Servidor', 'Equipos_Actuales',
-
-            'Cant_H_Atend', 'Acu_Espera_H',
-            'Cant_F_Atend', 'Acu_Espera_F',
-            'Cant_B_Atend', 'Acu_Espera_B',
-            'Equipos_Lista',
-        ]
-
-        for i in range(1, max_equipos + 1):
-            column_order.extend([
-                f"Equipo_{i}_ID",
-                f"Equipo_{i}_Estado",
-                f"Equipo_{i}_TMP_Llegada"
-            ])
-
-        df_final = df_final[column_order]
-
-        # =============================
-        # Carpeta de simulaciones
-        # =============================
-        carpeta = "simulaciones"
-        os.makedirs(carpeta, exist_ok=True)
-
-        # =============================
-        # Nombre del archivo con fecha y hora
-        # =============================
-        timestamp = datetime.now().strftime("%d%m%Y_%H%M")
-        nombre_archivo = f"Simulacion{timestamp}.csv"
-        ruta_archivo = os.path.join(carpeta, nombre_archivo)
-        df_final.to_csv(ruta_archivo, index=False, encoding="utf-8")
-
-        print(f"\nDatos exportados a {ruta_archivo}")
\ No newline at end of file
+        if self.instrumentacion is not None:
+            ruta_archivo = self.instrumentacion.medir("cierre_exportacion", exportador.cerrar)
+        else:
+            ruta_archivo = exportador.cerrar()
+        self.exportador = None
+        return ruta_archivo
+
+    def guardar_columnar(self) -> Optional[str]:
+        """Escribe el .npz de la última corrida y devuelve su ruta (None si no se pidió)"""
+        if self.exportador_columnar is None:
+            return None
+        if self.instrumentacion is not None:
+            ruta_archivo = self.instrumentacion.medir("cierre_exportacion", self.exportador_columnar.cerrar)
+        else:
+            ruta_archivo = self.exportador_columnar.cerrar()
+        self.exportador_columnar = None
+        return ruta_archivo
@@ -0,0 +1,31 @@
+import os
+import sys
+
+import pytest
+
+# Los módulos del simulador están en la carpeta del ejercicio (sin paquete)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def pytest_addoption(parser):
+    parser.addoption("--lentos", action="store_true", default=False,
+                     help="correr también los benchmarks marcados como lentos (100k y 1M iteraciones)")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--lentos"):
+        return
+    saltear = pytest.mark.skip(reason="benchmark lento: usar --lentos")
+    for item in items:
+        if "lento" in item.keywords:
+            item.add_marker(saltear)
+
+
+# --- FIXTURES ---
+
+
+@pytest.fixture
+def en_carpeta_temporal(tmp_path, monkeypatch):
+    """Corre el test dentro de una carpeta temporal (los exportadores escriben en ./simulaciones)"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
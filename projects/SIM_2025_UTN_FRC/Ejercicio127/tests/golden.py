@@ -0,0 +1,98 @@
+import hashlib
+import json
+import math
+import os
+import sys
+
+# Los módulos del simulador están en la carpeta del ejercicio (sin paquete)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api import ConfiguracionEjecucion, crear_simulador  # noqa: E402
+
+# ============================
+# Trayectorias de referencia (golden)
+# ============================
+
+RUTA_GOLDEN = os.path.join(os.path.dirname(os.path.abspath(__file__)), "datos", "golden.json")
+
+# Corridas de referencia: nombre -> parámetros de ConfiguracionEjecucion
+CASOS = {
+    "global_s1_2000": dict(generador="global", semilla=1, limite_iteraciones=2000),
+    "global_s42_2000": dict(generador="global", semilla=42, limite_iteraciones=2000),
+    "independiente_s7_2000": dict(generador="independiente", semilla=7, limite_iteraciones=2000),
+    "independiente_s7_tiempo_500h": dict(generador="independiente", semilla=7, modo_parada="tiempo",
+                                         limite_horas=500),
+    "lotes_s3_2000": dict(generador="lotes", semilla=3, limite_iteraciones=2000),
+    "tres_canchas_s5_2000": dict(generador="independiente", semilla=5, limite_iteraciones=2000,
+                                 modelo={"cantidad_canchas": 3}),
+}
+
+# Llegadas más frecuentes: con colas largas cada política asigna distinto
+MODELO_CONGESTIONADO = {"llegada_basketball_media": 5, "llegada_football_media": 6}
+POLITICAS_GOLDEN = ("referencia", "menos_acondicionamientos", "trabajo_mas_corto", "equitativa")
+CASOS.update({
+    f"congestion_s7_2000_{politica}": dict(generador="independiente", semilla=7, limite_iteraciones=2000,
+                                           modelo=MODELO_CONGESTIONADO, politica=politica)
+    for politica in POLITICAS_GOLDEN
+})
+
+# Indicadores finales que se guardan en claro junto a la huella
+INDICADORES = ("iteraciones", "reloj", "cola_FH", "cola_B",
+               "atendidos_H", "atendidos_F", "atendidos_B",
+               "espera_promedio_H", "espera_promedio_F", "espera_promedio_B")
+
+
+def correr(caso: str, modo_estado: str = "copia", **cambios):
+    """Corre el caso guardando todas las filas crudas (cambios reemplaza parámetros del caso)"""
+    parametros = dict(CASOS[caso], **cambios)
+    config = ConfiguracionEjecucion(modo_estado=modo_estado, mostrar_primeras=0, **parametros)
+    simulador = crear_simulador(config)
+    simulador.historial_completo = True
+    simulador.trazabilidad_completa = True   # la huella incluye la bitácora de toda la corrida
+    simulador.simular(0)
+    return simulador
+
+
+def huella(simulador) -> str:
+    """SHA-256 de la trayectoria completa: cada valor de cada fila (con repr,
+    o sea bit a bit para los reales) y la bitácora de equipos.
+    """
+    sha = hashlib.sha256()
+    for fila in simulador.vector_resultados:
+        sha.update(repr(fila._replace(bitacora=None)).encode())
+        sha.update(b"\n")
+    bitacora = simulador.bitacora
+    if bitacora is not None:
+        for valores in (bitacora.ids, list(bitacora.llegadas), list(bitacora.equipo),
+                        list(bitacora.estado), list(bitacora.tiempo)):
+            sha.update(repr(valores).encode())
+    return sha.hexdigest()
+
+
+def indicadores(simulador) -> dict:
+    resultados = simulador.resultados()
+    return {
+        clave: None if isinstance(resultados[clave], float) and math.isnan(resultados[clave]) else resultados[clave]
+        for clave in INDICADORES
+    }
+
+
+def cargar_golden() -> dict:
+    with open(RUTA_GOLDEN, encoding="utf-8") as archivo:
+        return json.load(archivo)
+
+
+def generar_golden():
+    """Regenera el archivo de referencia (solo ante un cambio de modelo intencional)"""
+    golden = {}
+    for caso in CASOS:
+        simulador = correr(caso)
+        golden[caso] = {"huella": huella(simulador), "indicadores": indicadores(simulador)}
+        print(f"{caso}: {golden[caso]['huella'][:16]}...")
+    with open(RUTA_GOLDEN, "w", encoding="utf-8") as archivo:
+        json.dump(golden, archivo, indent=2)
+        archivo.write("\n")
+
+
+if __name__ == "__main__":
+    generar_golden()
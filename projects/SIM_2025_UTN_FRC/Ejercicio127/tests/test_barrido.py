@@ -0,0 +1,84 @@
+import argparse
+import os
+import subprocess
+import sys
+
+import pytest
+
+from api import ConfiguracionEjecucion
+from barrido import barrer, generar_escenarios, leer_parametro
+from modelo import ModeloConfig
+
+CARPETA = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# --- GRILLA ---
+
+
+def test_escenarios_en_orden_del_producto_cartesiano():
+    """El último parámetro varía más rápido, como itertools.product"""
+    grilla = {"cantidad_canchas": [1, 2], "tiempo_acondicionamiento": [5, 10, 15]}
+    assert generar_escenarios(grilla) == [
+        {"cantidad_canchas": 1, "tiempo_acondicionamiento": 5},
+        {"cantidad_canchas": 1, "tiempo_acondicionamiento": 10},
+        {"cantidad_canchas": 1, "tiempo_acondicionamiento": 15},
+        {"cantidad_canchas": 2, "tiempo_acondicionamiento": 5},
+        {"cantidad_canchas": 2, "tiempo_acondicionamiento": 10},
+        {"cantidad_canchas": 2, "tiempo_acondicionamiento": 15},
+    ]
+
+
+def test_leer_parametro():
+    assert leer_parametro("cantidad_canchas=1,2,3") == ("cantidad_canchas", [1.0, 2.0, 3.0])
+    with pytest.raises(argparse.ArgumentTypeError):
+        leer_parametro("cantidad_canchas")
+    with pytest.raises(argparse.ArgumentTypeError):
+        leer_parametro("cantidad_canchas=1,dos")
+
+
+def test_barrer_devuelve_una_fila_por_escenario_en_orden():
+    grilla = {"cantidad_canchas": [1, 2], "tiempo_acondicionamiento": [5, 10]}
+    tabla = barrer(grilla, ConfiguracionEjecucion(limite_iteraciones=200), replicas=2, procesos=1)
+
+    assert [{p: fila[p] for p in grilla} for fila in tabla] == generar_escenarios(grilla)
+    assert all("espera_promedio_B_ic" in fila for fila in tabla)
+
+
+# --- VALIDACIÓN DEL MODELO ---
+
+
+@pytest.mark.parametrize("cambios", [
+    {"llegada_handball_media": -1},
+    {"ocupacion_basketball_desvio": -0.5},
+    {"cantidad_canchas": 0},
+    {"cantidad_canchas": 1.5},
+    {"cantidad_canchas": True},
+    {"tiempo_acondicionamiento": False},
+    {"llegada_football_media": 0},
+    {"llegada_basketball_media": "8"},
+])
+def test_modelo_invalido(cambios):
+    with pytest.raises(ValueError):
+        ModeloConfig(**cambios).validar()
+
+
+def test_modelo_valido_acepta_enteros_y_reales():
+    ModeloConfig(cantidad_canchas=2.0, tiempo_acondicionamiento=0).validar()
+
+
+@pytest.mark.parametrize("cambios", [{"cantidad_canchas": 1.5}, {"llegada_handball_media": -1}])
+def test_barrer_rechaza_escenarios_invalidos(cambios):
+    grilla = {nombre: [valor] for nombre, valor in cambios.items()}
+    with pytest.raises(ValueError):
+        barrer(grilla, ConfiguracionEjecucion(limite_iteraciones=10), replicas=1, procesos=1)
+
+
+def test_linea_de_comandos_informa_valores_invalidos_como_error_de_uso():
+    proceso = subprocess.run(
+        [sys.executable, "barrido.py", "-p", "cantidad_canchas=1.5", "--iteraciones", "10",
+         "-r", "1", "--procesos", "1"],
+        cwd=CARPETA, capture_output=True, text=True,
+    )
+    assert proceso.returncode == 2
+    assert "cantidad_canchas debe ser un entero" in proceso.stderr
+    assert "Traceback" not in proceso.stderr
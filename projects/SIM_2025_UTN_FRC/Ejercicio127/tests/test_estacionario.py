@@ -0,0 +1,78 @@
+import math
+
+import pytest
+
+from estacionario import analizar_serie, autocorrelacion_lag1, medias_por_lotes, mser
+
+
+# --- MSER-5 ---
+
+
+def test_mser_corta_el_transitorio_conocido():
+    """50 observaciones de calentamiento y después lotes de media exactamente 2"""
+    serie = [100.0] * 50 + [0.0, 1.0, 2.0, 3.0, 4.0] * 40
+    assert mser(serie) == 50
+
+
+def test_mser_no_corta_una_serie_sin_transitorio():
+    assert mser([0.0, 1.0, 2.0, 3.0, 4.0] * 40) == 0
+
+
+def test_mser_descarta_como_mucho_la_mitad_de_los_lotes():
+    """Con un transitorio más largo que media serie el corte se topa en m // 2 lotes"""
+    serie = [float(100 - i) for i in range(80)] + [0.0] * 20   # 20 lotes de 5
+    assert mser(serie) == 10 * 5
+
+
+def test_mser_con_menos_de_dos_lotes_no_corta():
+    assert mser([5.0, 1.0, 7.0]) == 0
+
+
+# --- MEDIAS POR LOTES ---
+
+
+def test_medias_por_lotes_descarta_el_sobrante_inicial():
+    # 23 valores en 4 lotes de 5: se descartan los 3 primeros
+    assert medias_por_lotes([float(i) for i in range(23)], 4) == [5.0, 10.0, 15.0, 20.0]
+
+
+def test_medias_por_lotes_sin_datos_suficientes():
+    assert medias_por_lotes([1.0, 2.0], 4) == []
+
+
+# --- ANÁLISIS COMPLETO ---
+
+
+def test_serie_constante_da_intervalo_de_ancho_cero():
+    resultado = analizar_serie([3.5] * 400)
+
+    assert resultado["truncamiento"] == 0
+    assert resultado["media"] == 3.5
+    assert resultado["semiamplitud"] == 0.0
+    assert resultado["tamano_lote"] == 20
+    assert math.isnan(resultado["autocorrelacion"])
+
+
+def test_intervalo_por_lotes_calculado_a_mano():
+    """20 lotes de 5 con medias 0, 1, 0, 1, ...: media 0.5, s² = 5/19, t(0.975; 19) = 2.093024"""
+    serie = [float(j % 2) for j in range(20) for _ in range(5)]
+    resultado = analizar_serie(serie)
+
+    assert resultado["truncamiento"] == 0
+    assert resultado["media"] == pytest.approx(0.5)
+    assert resultado["semiamplitud"] == pytest.approx(2.093024 * math.sqrt(5 / 19 / 20), rel=1e-5)
+    assert resultado["autocorrelacion"] == pytest.approx(-19 / 20)
+
+
+def test_transitorio_sesga_la_media_sin_truncar():
+    serie = [100.0] * 50 + [0.0, 1.0, 2.0, 3.0, 4.0] * 40
+    resultado = analizar_serie(serie)
+
+    assert resultado["truncamiento"] == 50
+    assert resultado["media"] == pytest.approx(2.0)
+    assert resultado["semiamplitud"] == pytest.approx(0.0)
+    assert resultado["media_sin_truncar"] == pytest.approx((50 * 100 + 40 * 10) / 250)
+
+
+def test_autocorrelacion_de_una_serie_alternada():
+    assert autocorrelacion_lag1([1.0, -1.0] * 10) == pytest.approx(-19 / 20)
@@ -0,0 +1,118 @@
+import math
+import random
+import statistics
+from types import SimpleNamespace
+
+import pytest
+
+from estadisticas import (EstadisticasEnLinea, PercentilP2, PromedioPonderado, Welford,
+                          cdf_t_student, cuantil_t_student, intervalo_confianza)
+
+MUESTRA = [12.5, 3.25, 7.0, 19.75, 0.5, 8.125, 14.0, 2.0, 11.5, 6.75]
+
+
+# --- WELFORD ---
+
+
+def test_welford_coincide_con_statistics():
+    acumulado = Welford()
+    for valor in MUESTRA:
+        acumulado.agregar(valor)
+
+    assert acumulado.n == len(MUESTRA)
+    assert acumulado.media == pytest.approx(statistics.mean(MUESTRA), rel=1e-12)
+    assert acumulado.varianza() == pytest.approx(statistics.variance(MUESTRA), rel=1e-12)
+    assert acumulado.desvio() == pytest.approx(statistics.stdev(MUESTRA), rel=1e-12)
+    assert (acumulado.minimo, acumulado.maximo) == (0.5, 19.75)
+
+
+def test_welford_con_una_observacion_no_tiene_varianza():
+    acumulado = Welford()
+    acumulado.agregar(4.0)
+    assert math.isnan(acumulado.varianza())
+
+
+# --- PROMEDIO PONDERADO EN EL TIEMPO ---
+
+
+def test_promedio_ponderado_de_una_funcion_escalon():
+    """0 en [0, 1), 2 en [1, 4), 5 en [4, 6) y 1 en [6, 10): área 20 en 10 minutos"""
+    promedio = PromedioPonderado()
+    for reloj, valor in [(1.0, 2), (4.0, 5), (6.0, 1)]:
+        promedio.actualizar(reloj, valor)
+
+    assert promedio.promedio(10.0) == pytest.approx(2.0)
+    assert promedio.promedio(6.0) == pytest.approx(16 / 6)
+
+
+def test_promedio_ponderado_sin_duracion_es_nan():
+    assert math.isnan(PromedioPonderado(5.0).promedio(5.0))
+
+
+def test_utilizacion_y_colas_en_linea():
+    """Una cancha: libre 0-2, ocupada 2-7 y en acondicionamiento 7-8; cola B de 3 entre 2 y 7"""
+    def estado(reloj, ocupadas, acondicionamiento, cola_b):
+        return SimpleNamespace(reloj=reloj, cola_handball_football=[], cola_basketball=[None] * cola_b,
+                               canchas=[None], canchas_ocupadas=ocupadas,
+                               canchas_en_acondicionamiento=acondicionamiento)
+
+    estadisticas = EstadisticasEnLinea()
+    for observado in [estado(0.0, 0, 0, 0), estado(2.0, 1, 0, 3), estado(7.0, 0, 1, 0), estado(8.0, 0, 0, 0),
+                      estado(10.0, 0, 0, 0)]:
+        estadisticas.observar(observado)
+    resumen = estadisticas.resumen()
+
+    assert resumen["cancha_ocupada"] == pytest.approx(0.5)
+    assert resumen["cancha_acondicionamiento"] == pytest.approx(0.1)
+    assert resumen["cancha_libre"] == pytest.approx(0.4)
+    assert resumen["cola_promedio_B"] == pytest.approx(1.5)
+    assert resumen["cola_promedio_FH"] == 0.0
+
+
+# --- PERCENTILES P² ---
+
+
+@pytest.mark.parametrize("p", [0.5, 0.9, 0.95])
+def test_p2_se_acerca_al_percentil_de_la_muestra(p):
+    np = pytest.importorskip("numpy")
+    generador = random.Random(2025)
+    muestra = [generador.expovariate(1 / 30) for _ in range(50_000)]
+
+    estimador = PercentilP2(p)
+    for valor in muestra:
+        estimador.agregar(valor)
+
+    assert estimador.valor() == pytest.approx(np.percentile(muestra, 100 * p), rel=0.02)
+
+
+def test_p2_es_exacto_con_pocas_observaciones():
+    estimador = PercentilP2(0.5)
+    for valor in [9.0, 1.0, 5.0]:
+        estimador.agregar(valor)
+    assert estimador.valor() == 5.0
+
+
+# --- T DE STUDENT ---
+
+
+@pytest.mark.parametrize("grados_libertad, confianza, esperado", [
+    (1, 0.95, 12.706205),
+    (5, 0.95, 2.570582),
+    (10, 0.99, 3.169273),
+    (19, 0.95, 2.093024),
+    (30, 0.90, 1.697261),
+])
+def test_cuantiles_t_de_tabla(grados_libertad, confianza, esperado):
+    p = 1 - (1 - confianza) / 2
+    assert cuantil_t_student(p, grados_libertad) == pytest.approx(esperado, rel=1e-5)
+    assert cuantil_t_student(1 - p, grados_libertad) == pytest.approx(-esperado, rel=1e-5)
+    assert cdf_t_student(esperado, grados_libertad) == pytest.approx(p, abs=1e-6)
+
+
+def test_intervalo_confianza_descarta_nan():
+    media, semiamplitud = intervalo_confianza(MUESTRA + [float("nan")])
+
+    n = len(MUESTRA)
+    assert media == pytest.approx(statistics.mean(MUESTRA))
+    assert semiamplitud == pytest.approx(cuantil_t_student(0.975, n - 1) * statistics.stdev(MUESTRA) / math.sqrt(n))
+    assert math.isnan(intervalo_confianza([1.0])[1])
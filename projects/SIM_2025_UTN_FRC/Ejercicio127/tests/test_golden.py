@@ -0,0 +1,151 @@
+import csv
+import gc
+
+import pytest
+
+from api import ConfiguracionEjecucion, crear_simulador
+from entidades import Equipo
+from exportadores import COLUMNAS_CSV
+from filas import formatear_filas
+from golden import CASOS, cargar_golden, correr, huella, indicadores
+from simulador import SimuladorVectorial
+
+
+GOLDEN = cargar_golden()
+
+
+def requiere_numpy(caso):
+    if CASOS[caso].get("generador") == "lotes":
+        pytest.importorskip("numpy")
+
+
+# --- TRAYECTORIAS ---
+
+
+@pytest.mark.parametrize("modo_estado", ["copia", "en_sitio"])
+@pytest.mark.parametrize("caso", sorted(CASOS))
+def test_trayectoria_igual_a_la_referencia(caso, modo_estado):
+    """Misma semilla → misma trayectoria bit a bit, en los dos modos de estado"""
+    requiere_numpy(caso)
+    simulador = correr(caso, modo_estado)
+
+    assert indicadores(simulador) == GOLDEN[caso]["indicadores"]
+    assert huella(simulador) == GOLDEN[caso]["huella"]
+
+
+def test_corrida_instrumentada_no_altera_la_trayectoria():
+    caso = "independiente_s7_2000"
+    simulador = correr(caso, instrumentar=True)
+
+    assert huella(simulador) == GOLDEN[caso]["huella"]
+    assert simulador.instrumentacion.pasos == GOLDEN[caso]["indicadores"]["iteraciones"]
+
+
+@pytest.mark.parametrize("caso", ["global_s1_2000", "independiente_s7_2000", "lotes_s3_2000"])
+def test_reanudar_desde_punto_control_reproduce_la_trayectoria(caso, tmp_path):
+    requiere_numpy(caso)
+    ruta = str(tmp_path / "corrida.pc")
+    simulador = correr(caso, limite_iteraciones=1000, punto_control=ruta, punto_control_cada=300)
+    del simulador
+
+    reanudado = SimuladorVectorial.desde_punto_control(ruta)
+    reanudado.limite_iteraciones = GOLDEN[caso]["indicadores"]["iteraciones"]
+    reanudado.reanudar()
+
+    assert huella(reanudado) == GOLDEN[caso]["huella"]
+
+
+@pytest.mark.parametrize("caso", ["global_s1_2000", "independiente_s7_tiempo_500h", "lotes_s3_2000"])
+def test_avance_rapido_llega_al_mismo_estado_final(caso):
+    """Sin filas intermedias: mismos indicadores, primeras filas y 2 últimas filas"""
+    requiere_numpy(caso)
+    corridas = {}
+    for rapido in (False, True):
+        simulador = crear_simulador(ConfiguracionEjecucion(mostrar_primeras=5, avance_rapido=rapido, **CASOS[caso]))
+        simulador.simular(5)
+        corridas[rapido] = simulador
+    normal, rapido = corridas[False], corridas[True]
+
+    assert indicadores(rapido) == GOLDEN[caso]["indicadores"]
+    assert rapido.resultados() == normal.resultados()
+    assert sin_bitacora(rapido.vector_resultados) == sin_bitacora(normal.vector_resultados)
+    assert sin_bitacora(rapido.ultimas_filas) == sin_bitacora(normal.ultimas_filas)
+    assert rapido.total_filas == normal.total_filas
+
+
+@pytest.mark.parametrize("modo_estado", ["copia", "en_sitio"])
+def test_no_se_retienen_los_equipos_finalizados(modo_estado):
+    """Sin trazabilidad ni exportación columnar, solo siguen vivos los equipos en cola o en cancha"""
+    simulador = crear_simulador(ConfiguracionEjecucion(limite_iteraciones=20000, semilla=1, mostrar_primeras=0,
+                                                       modo_estado=modo_estado))
+    simulador.simular(0)
+    gc.collect()
+
+    vivos = sum(1 for objeto in gc.get_objects() if isinstance(objeto, Equipo))
+    estado = simulador.estados[-1]
+    assert estado.equipos_creados > 5000
+    assert vivos <= len(estado.equipos_vivos()) + 4   # margen: el estado anterior en modo copia
+
+
+# --- EXPORTACIÓN ---
+
+
+def test_csv_igual_con_y_sin_exportador_en_linea(en_carpeta_temporal):
+    """El CSV escrito durante la corrida es idéntico al armado con las filas retenidas"""
+    simulador = correr("global_s1_2000", limite_iteraciones=300, exportar_csv=True)
+    en_linea = leer_csv(simulador.guardar_csv())
+
+    simulador.exportador = None
+    desde_filas = leer_csv(simulador.guardar_csv())
+
+    assert en_linea == desde_filas
+    assert len(en_linea.splitlines()) == 302   # encabezado + fila inicial + 300 iteraciones
+
+
+@pytest.mark.parametrize("iteraciones", [4, 300])
+def test_csv_numeros_como_pandas(en_carpeta_temporal, iteraciones):
+    """Cada columna se escribe con el dtype que le daba pandas: una columna
+    real que quedó toda en 0 (disciplina sin atender) sigue siendo entera
+    """
+    pd = pytest.importorskip("pandas")
+    simulador = correr("global_s1_2000", limite_iteraciones=iteraciones, exportar_csv=True)
+    escrito = [fila[:len(COLUMNAS_CSV)] for fila in csv.reader(leer_csv(simulador.guardar_csv()).splitlines())]
+
+    filas = formatear_filas(simulador.vector_resultados)
+    esperado = list(csv.reader(pd.DataFrame(filas)[COLUMNAS_CSV].to_csv(index=False).splitlines()))
+    assert escrito == esperado
+
+
+def test_csv_con_equipos_solo_hasta_max_trazabilidad(en_carpeta_temporal):
+    """Las columnas por equipo se cortan en max_trazabilidad salvo trazabilidad completa"""
+    celdas_con_equipos = {}
+    for completa in (False, True):
+        simulador = crear_simulador(ConfiguracionEjecucion(limite_iteraciones=300, semilla=1, mostrar_primeras=0,
+                                                           exportar_csv=True, trazabilidad_completa=completa))
+        simulador.max_trazabilidad = 100
+        simulador.simular(0)
+        filas = list(csv.reader(leer_csv(simulador.guardar_csv()).splitlines()))[1:]
+        celdas_con_equipos[completa] = [any(fila[len(COLUMNAS_CSV):]) for fila in filas]
+
+    # La fila inicial no tiene equipos todavía
+    assert all(celdas_con_equipos[False][1:101]) and not any(celdas_con_equipos[False][101:])
+    assert all(celdas_con_equipos[True][1:])
+
+
+def test_corrida_sin_filas_ni_csv_no_lleva_bitacora():
+    simulador = crear_simulador(ConfiguracionEjecucion(limite_iteraciones=300, semilla=1, mostrar_primeras=0))
+    simulador.simular(0)
+    assert simulador.bitacora is None
+
+
+# --- AUXILIARES ---
+
+
+def sin_bitacora(filas):
+    """Filas comparables entre corridas (cada una referencia a su propia bitácora)"""
+    return [fila._replace(bitacora=None) for fila in filas]
+
+
+def leer_csv(ruta):
+    with open(ruta, encoding="utf-8", newline="") as archivo:
+        return archivo.read()
@@ -0,0 +1,51 @@
+import pytest
+
+from api import ConfiguracionEjecucion
+from comparar_politicas import comparar_politicas
+from golden import POLITICAS_GOLDEN, cargar_golden, correr, huella
+from politicas import POLITICAS, PoliticaAsignacion, crear_politica
+
+CASO = "congestion_s7_2000_{}"
+
+
+def test_las_politicas_golden_son_todas_las_disponibles():
+    assert set(POLITICAS_GOLDEN) == set(POLITICAS)
+
+
+@pytest.mark.parametrize("politica", [p for p in POLITICAS_GOLDEN if p != "referencia"])
+def test_otras_politicas_asignan_distinto_con_las_mismas_llegadas(politica):
+    """Con las mismas llegadas (fuentes independientes por variable), cada
+    política cambia la trayectoria respecto de la de referencia
+    """
+    referencia = correr(CASO.format("referencia"))
+    otra = correr(CASO.format(politica))
+
+    assert huella(otra) != huella(referencia)
+
+    # Mismos equipos llegando en los mismos instantes (hasta donde llegan las dos corridas)
+    comunes = min(len(referencia.bitacora.ids), len(otra.bitacora.ids))
+    assert comunes > 100
+    assert otra.bitacora.ids[:comunes] == referencia.bitacora.ids[:comunes]
+    assert list(otra.bitacora.llegadas[:comunes]) == list(referencia.bitacora.llegadas[:comunes])
+
+
+def test_politica_por_defecto_mantiene_la_trayectoria_de_referencia():
+    """Los casos golden sin política explícita usan la de referencia"""
+    assert ConfiguracionEjecucion().politica == "referencia"
+    caso = "independiente_s7_2000"
+    assert huella(correr(caso, politica="referencia")) == cargar_golden()[caso]["huella"]
+
+
+def test_comparacion_pareada_contra_la_misma_politica_da_diferencia_cero():
+    config = ConfiguracionEjecucion(limite_iteraciones=500)
+    comparacion = comparar_politicas(["referencia", "trabajo_mas_corto"], config, replicas=3, procesos=1)
+
+    assert comparacion["referencia"]["diferencia_espera"] == (0.0, 0.0)
+    assert comparacion["trabajo_mas_corto"]["diferencia_espera"] != (0.0, 0.0)
+
+
+def test_politica_base_es_abstracta():
+    with pytest.raises(TypeError):
+        PoliticaAsignacion()
+    with pytest.raises(ValueError, match="Política desconocida"):
+        crear_politica("aleatoria")
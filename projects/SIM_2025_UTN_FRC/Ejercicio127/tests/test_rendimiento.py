@@ -0,0 +1,127 @@
+import contextlib
+import io
+import tracemalloc
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from api import ConfiguracionEjecucion, crear_simulador  # noqa: E402
+
+# Benchmarks del camino caliente. Correr con:
+#   pytest tests/test_rendimiento.py --benchmark-only [--lentos]
+# y comparar contra una corrida guardada con --benchmark-autosave / --benchmark-compare.
+
+SEMILLA = 12345
+
+
+def armar_simulador(iteraciones: int, modo_estado: str = "en_sitio", **cambios):
+    config = ConfiguracionEjecucion(limite_iteraciones=iteraciones, semilla=SEMILLA,
+                                    modo_estado=modo_estado, mostrar_primeras=0, **cambios)
+    return crear_simulador(config)
+
+
+def registrar_metricas(benchmark, eventos: int, memoria_pico=None):
+    """Agrega eventos/s (y memoria pico si se midió) al reporte del benchmark"""
+    estadisticas = getattr(benchmark, "stats", None)
+    if estadisticas is not None and estadisticas.stats.mean > 0:
+        benchmark.extra_info["eventos_por_segundo"] = eventos / estadisticas.stats.mean
+    if memoria_pico is not None:
+        benchmark.extra_info["memoria_pico_mb"] = memoria_pico / 2**20
+
+
+def memoria_pico(funcion) -> int:
+    """Bytes pico asignados por funcion() (corrida aparte: tracemalloc la hace más lenta)"""
+    tracemalloc.start()
+    try:
+        funcion()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+# --- FIXTURES ---
+
+
+@pytest.fixture
+def simulador_en_regimen():
+    """Simulador con 5000 eventos ya procesados y sus estructuras en uso"""
+    simulador = armar_simulador(5000)
+    simulador.simular(0)
+    return simulador
+
+
+# --- PASOS INDIVIDUALES ---
+
+
+@pytest.mark.parametrize("modo_estado", ["copia", "en_sitio"])
+def test_ejecutar_paso(benchmark, modo_estado):
+    simulador = armar_simulador(5000, modo_estado)
+    simulador.simular(0)
+    estado = [simulador.estados[-1]]
+
+    def paso():
+        estado[0] = simulador.ejecutar_paso(estado[0])
+
+    benchmark(paso)
+
+
+def test_determinar_proximo_evento(benchmark, simulador_en_regimen):
+    estado = simulador_en_regimen.estados[-1]
+    evento, _ = benchmark(simulador_en_regimen.determinar_proximo_evento, estado)
+    assert evento != "Fin"
+
+
+def test_crear_vector_fila(benchmark, simulador_en_regimen):
+    estado = simulador_en_regimen.estados[-1]
+    fila = benchmark(simulador_en_regimen.crear_vector_fila, estado, simulador_en_regimen.iteraciones)
+    assert fila["Iteracion"] == simulador_en_regimen.iteraciones
+
+
+def test_exportar_a_csv(benchmark, en_carpeta_temporal):
+    simulador = armar_simulador(1000)
+    simulador.historial_completo = True
+    simulador.simular(0)
+
+    # Sin exportador en línea, exportar_a_csv escribe las filas retenidas en cada llamada
+    with contextlib.redirect_stdout(io.StringIO()):
+        benchmark(simulador.exportar_a_csv)
+    assert list(en_carpeta_temporal.glob("simulaciones/*.csv"))
+
+
+# --- CORRIDAS COMPLETAS ---
+
+
+@pytest.mark.parametrize("iteraciones", [
+    1_000,
+    pytest.param(100_000, marks=pytest.mark.lento),
+    pytest.param(1_000_000, marks=pytest.mark.lento),
+])
+def test_simular(benchmark, iteraciones):
+    """Bucle de eventos sin consola (lo que usan la API y las replicaciones)"""
+    def corrida():
+        simulador = armar_simulador(iteraciones)
+        simulador.simular(10)
+        return simulador
+
+    pico = memoria_pico(corrida) if iteraciones <= 100_000 else None
+    simulador = benchmark.pedantic(corrida, rounds=1 if iteraciones > 1_000 else 5)
+    assert simulador.iteraciones == iteraciones
+    registrar_metricas(benchmark, iteraciones, pico)
+
+
+@pytest.mark.parametrize("iteraciones", [
+    1_000,
+    pytest.param(100_000, marks=pytest.mark.lento),
+])
+def test_ejecutar(benchmark, iteraciones):
+    """Corrida completa como la del menú: progreso, tablas y reporte por consola"""
+    def corrida():
+        simulador = armar_simulador(iteraciones)
+        with contextlib.redirect_stdout(io.StringIO()):
+            simulador.ejecutar(mostrar_primeras=10)
+        return simulador
+
+    simulador = benchmark.pedantic(corrida, rounds=1 if iteraciones > 1_000 else 5)
+    assert simulador.iteraciones == iteraciones
+    registrar_metricas(benchmark, iteraciones)
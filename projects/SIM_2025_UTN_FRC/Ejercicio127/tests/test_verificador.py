@@ -0,0 +1,137 @@
+import re
+from dataclasses import replace
+
+import pytest
+
+from api import ConfiguracionEjecucion, crear_simulador
+from verificador import motor_arreglos, motor_en_sitio, motor_referencia, verificar
+
+
+def configuracion(generador="independiente", iteraciones=1500, **cambios):
+    return ConfiguracionEjecucion(limite_iteraciones=iteraciones, semilla=11, generador=generador,
+                                  mostrar_primeras=0, **cambios)
+
+
+# --- MOTORES CANDIDATOS DE PRUEBA ---
+
+
+def motor_sin_reusar_tmp2(config):
+    """Candidato defectuoso: altera el TMP2 de football desde la fila 700"""
+    for fila in motor_referencia(config):
+        if fila.iteracion >= 700 and fila.tmp_football_2_disponible is not None:
+            fila = fila._replace(tmp_football_2_disponible=fila.tmp_football_2_disponible * (1 + 1e-15))
+        yield fila
+
+
+def motor_que_termina_antes(config):
+    for fila in motor_referencia(config):
+        if fila.iteracion == 1000:
+            return
+        yield {"evento_actual": fila.evento_actual, "reloj": fila.reloj}
+
+
+# --- VERIFICACIÓN ---
+
+
+@pytest.mark.parametrize("generador", ["global", "independiente"])
+def test_en_sitio_coincide_con_la_referencia(generador):
+    resultado = verificar(motor_en_sitio, configuracion(generador))
+
+    assert resultado.coincide
+    assert resultado.filas_comparadas == 1501
+    assert resultado.campos_ausentes == ()
+
+
+def test_informa_la_primera_divergencia():
+    resultado = verificar(motor_sin_reusar_tmp2, configuracion())
+
+    assert not resultado.coincide
+    divergencia = resultado.divergencia
+    assert divergencia.iteracion >= 700
+    assert [campo for campo, _, _ in divergencia.diferencias] == ["tmp_football_2_disponible"]
+    assert resultado.filas_comparadas == divergencia.iteracion
+
+
+def test_candidato_parcial_solo_verifica_sus_campos():
+    resultado = verificar(motor_que_termina_antes, configuracion())
+
+    assert resultado.campos_verificados == ("evento_actual", "reloj")
+    assert resultado.divergencia.iteracion == 1000
+    assert resultado.divergencia.diferencias[0][0] == "terminó la corrida"
+
+
+# --- MOTOR DE ARREGLOS ---
+
+
+@pytest.mark.parametrize("politica", ["referencia", "menos_acondicionamientos", "trabajo_mas_corto", "equitativa"])
+@pytest.mark.parametrize("generador", ["independiente", "lotes"])
+def test_arreglos_coincide_con_la_referencia(generador, politica):
+    pytest.importorskip("numpy")
+    modelo = replace(ConfiguracionEjecucion().modelo, cantidad_canchas=2)
+    resultado = verificar(motor_arreglos, configuracion(generador, politica=politica, modelo=modelo))
+
+    assert resultado.coincide
+    assert resultado.filas_comparadas == 1501
+    assert resultado.campos_ausentes == ()
+
+
+def test_arreglos_da_los_mismos_indicadores():
+    pytest.importorskip("numpy")
+    from motor_arreglos import SimuladorArreglos
+
+    config = ConfiguracionEjecucion(modo_parada='tiempo', limite_horas=2000, semilla=5, mostrar_primeras=0,
+                                    avance_rapido=True)
+    simulador = crear_simulador(config)
+    motivo = simulador.simular(0)
+    arreglos = SimuladorArreglos(config)
+
+    assert arreglos.simular() == motivo
+    # Todos menos los percentiles de espera (espera_p50_H, ...)
+    esperado = {clave: valor for clave, valor in simulador.resultados().items()
+                if not re.fullmatch(r"espera_p\d+_\w", clave)}
+    assert arreglos.resultados() == pytest.approx(esperado, rel=0, abs=0, nan_ok=True)
+
+
+def test_arreglos_no_acepta_el_generador_global():
+    pytest.importorskip("numpy")
+    from motor_arreglos import SimuladorArreglos
+
+    with pytest.raises(ValueError, match="generador"):
+        SimuladorArreglos(configuracion("global"))
+
+
+# --- RÉPLICAS SIMULTÁNEAS ---
+
+
+@pytest.mark.parametrize("politica", ["referencia", "equitativa"])
+@pytest.mark.parametrize("modo_parada", ["tiempo", "iteraciones"])
+def test_replicas_simultaneas_dan_los_indicadores_de_cada_replica(modo_parada, politica):
+    pytest.importorskip("numpy")
+    from motor_replicas import ejecutar_replicas_simultaneas
+
+    modelo = replace(ConfiguracionEjecucion().modelo, cantidad_canchas=2)
+    base = ConfiguracionEjecucion(modo_parada=modo_parada, limite_horas=500, limite_iteraciones=800,
+                                  generador='lotes', politica=politica, modelo=modelo, mostrar_primeras=0,
+                                  avance_rapido=True)
+    configuraciones = [replace(base, semilla=semilla) for semilla in range(1, 7)]
+    # Lotes y colas chicos para pasar por el relleno y la ampliación
+    resultados = ejecutar_replicas_simultaneas(configuraciones, tamano_lote=8, capacidad_colas=2)
+
+    for config, resultado in zip(configuraciones, resultados):
+        simulador = crear_simulador(config)
+        simulador.simular(0)
+        esperado = {clave: valor for clave, valor in simulador.resultados().items()
+                    if not re.fullmatch(r"espera_p\d+_\w", clave)}
+        esperado["semilla"] = config.semilla
+        assert resultado == pytest.approx(esperado, rel=0, abs=0, nan_ok=True)
+
+
+def test_replicas_simultaneas_requieren_la_misma_configuracion():
+    pytest.importorskip("numpy")
+    from motor_replicas import SimuladorReplicas
+
+    base = configuracion("lotes")
+    with pytest.raises(ValueError, match="salvo la semilla"):
+        SimuladorReplicas([base, replace(base, semilla=2, politica="equitativa")])
+    with pytest.raises(ValueError, match="'lotes'"):
+        SimuladorReplicas([configuracion("independiente")])
@@ -0,0 +1,283 @@
+import argparse
+import importlib
+import math
+import random
+import sys
+from dataclasses import dataclass, replace
+from itertools import zip_longest
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from api import ConfiguracionEjecucion, cargar_configuracion, crear_simulador
+from estado import EstadoSimulacion
+from filas import FilaCruda, capturar_fila
+from politicas import POLITICAS
+
+# ============================
+# Verificación de trayectorias entre motores
+# ============================
+
+# Campos de la fila cruda que se comparan, en el orden en que se informan.
+# Los RND y z de Box-Muller están incluidos: un motor que consuma los números
+# en otro orden (o que no reuse z1 y TMP2 como la referencia) diverge acá
+# aunque el evento y el reloj coincidan por un tiempo.
+CAMPOS_VERIFICADOS = (
+    "evento_actual", "reloj",
+
+    "rnd_handball_1", "rnd_handball_2", "z_handball_0", "z_handball_1",
+    "hay_z_disponible_handball", "tiempo_prox_handball", "prox_llegada_handball",
+    "rnd_football", "tiempo_prox_football", "prox_llegada_football",
+    "rnd_basketball_1", "rnd_basketball_2", "z_basketball_0", "z_basketball_1",
+    "hay_z_disponible_basketball", "tiempo_prox_basketball", "prox_llegada_basketball",
+
+    "rnd_ocupacion_handball_1", "rnd_ocupacion_handball_2",
+    "tmp_handball_1_disponible", "tmp_handball_2_disponible",
+    "rnd_ocupacion_football_1", "rnd_ocupacion_football_2",
+    "tmp_football_1_disponible", "tmp_football_2_disponible",
+    "rnd_ocupacion_basketball_1", "rnd_ocupacion_basketball_2",
+    "tmp_basketball_1_disponible", "tmp_basketball_2_disponible",
+
+    "cola_handball_football", "cola_basketball", "canchas",
+
+    "equipos_handball_atendidos", "tiempo_espera_handball",
+    "equipos_football_atendidos", "tiempo_espera_football",
+    "equipos_basketball_atendidos", "tiempo_espera_basketball",
+)
+
+# Una fila de un motor: FilaCruda o un mapeo con (algunos de) sus campos
+Fila = Union[FilaCruda, Mapping]
+
+# Un motor recibe la configuración y devuelve sus filas en orden, desde la
+# fila inicial (iteración 0) hasta la última
+Motor = Callable[[ConfiguracionEjecucion], Iterable[Fila]]
+
+
+def filas_simulador(config: ConfiguracionEjecucion) -> Iterator[FilaCruda]:
+    """Filas de SimuladorVectorial generadas de a una (sin retenerlas).
+
+    Usa el mismo ejecutar_paso y criterio de parada que simular(), sin
+    bitácora ni estadísticas en línea, que no alteran la trayectoria.
+    """
+    simulador = crear_simulador(config)
+    estado = EstadoSimulacion(aleatorios=simulador.aleatorios, modelo=simulador.modelo)
+    iteracion = 0
+    yield capturar_fila(estado, iteracion)
+    while simulador.motivo_parada(estado, iteracion) is None:
+        estado = simulador.ejecutar_paso(estado)
+        iteracion += 1
+        yield capturar_fila(estado, iteracion)
+
+
+def motor_referencia(config: ConfiguracionEjecucion) -> Iterator[FilaCruda]:
+    """SimuladorVectorial con un estado nuevo por paso (la referencia)"""
+    return filas_simulador(replace(config, modo_estado='copia'))
+
+
+def motor_en_sitio(config: ConfiguracionEjecucion) -> Iterator[FilaCruda]:
+    """SimuladorVectorial modificando un único estado"""
+    return filas_simulador(replace(config, modo_estado='en_sitio'))
+
+
+def motor_arreglos(config: ConfiguracionEjecucion) -> Iterator[Mapping]:
+    """Núcleo de arreglos de motor_arreglos.py (requiere NumPy y un generador
+    por fuente: 'independiente' o 'lotes')
+    """
+    from motor_arreglos import filas_motor_arreglos
+    return filas_motor_arreglos(config)
+
+
+# Motores candidatos disponibles por nombre
+MOTORES: Dict[str, Motor] = {
+    "en_sitio": motor_en_sitio,
+    "arreglos": motor_arreglos,
+}
+
+
+def cargar_motor(nombre: str) -> Motor:
+    """Motor registrado en MOTORES, o 'modulo:funcion' para uno externo"""
+    if nombre in MOTORES:
+        return MOTORES[nombre]
+    if ":" in nombre:
+        modulo, funcion = nombre.split(":", 1)
+        return getattr(importlib.import_module(modulo), funcion)
+    raise ValueError(f"Motor desconocido: {nombre!r}")
+
+
+@dataclass
+class Divergencia:
+    """Primera fila en la que el candidato se aparta de la referencia"""
+    iteracion: int
+    diferencias: List[Tuple[str, object, object]]   # (campo, referencia, candidato)
+    fila_referencia: Optional[Fila] = None
+    fila_candidata: Optional[Fila] = None
+    fila_anterior: Optional[Fila] = None            # última fila coincidente (de la referencia)
+
+
+@dataclass
+class ResultadoVerificacion:
+    motor: str
+    filas_comparadas: int = 0
+    campos_verificados: Tuple[str, ...] = ()
+    campos_ausentes: Tuple[str, ...] = ()           # no informados por el candidato
+    divergencia: Optional[Divergencia] = None
+
+    @property
+    def coincide(self) -> bool:
+        return self.divergencia is None
+
+
+def valor_campo(fila: Fila, campo: str, ausente=None):
+    if isinstance(fila, Mapping):
+        return fila.get(campo, ausente)
+    return getattr(fila, campo, ausente)
+
+
+def iguales(a, b, tolerancia: float = 0.0) -> bool:
+    """Igualdad bit a bit (o con tolerancia relativa para reales)"""
+    if isinstance(a, float) and isinstance(b, float):
+        if math.isnan(a) or math.isnan(b):
+            return math.isnan(a) and math.isnan(b)
+        if tolerancia > 0:
+            return math.isclose(a, b, rel_tol=tolerancia, abs_tol=tolerancia)
+        return a == b
+    if isinstance(a, tuple) and isinstance(b, tuple):
+        return len(a) == len(b) and all(iguales(x, y, tolerancia) for x, y in zip(a, b))
+    return a == b
+
+
+def aislar_random(filas: Iterable[Fila]) -> Iterator[Fila]:
+    """Avanza `filas` con su propio estado del módulo random global.
+
+    Con el generador 'global' los dos motores intercalados compartirían la
+    secuencia; así cada uno consume la suya como si corriera solo.
+    """
+    iterador = iter(filas)
+    propio = None
+    while True:
+        externo = random.getstate()
+        if propio is not None:
+            random.setstate(propio)
+        try:
+            fila = next(iterador)
+        except StopIteration:
+            random.setstate(externo)
+            return
+        propio = random.getstate()
+        random.setstate(externo)
+        yield fila
+
+
+def verificar(candidato: Motor, config: ConfiguracionEjecucion, referencia: Motor = motor_referencia,
+              nombre: str = "", tolerancia: float = 0.0) -> ResultadoVerificacion:
+    """Corre referencia y candidato con la misma configuración, fila a fila,
+    y se detiene en la primera diferencia (o cuando uno termina antes).
+
+    Los campos que el candidato no informa se omiten y quedan listados en
+    campos_ausentes; conviene revisar que no sean los que interesan.
+    """
+    resultado = ResultadoVerificacion(nombre or getattr(candidato, "__name__", "candidato"))
+    ausente = object()
+    anterior = None
+
+    filas_ref, filas_cand = referencia(config), candidato(config)
+    if config.generador == 'global':
+        filas_ref, filas_cand = aislar_random(filas_ref), aislar_random(filas_cand)
+
+    for iteracion, (fila_ref, fila_cand) in enumerate(zip_longest(filas_ref, filas_cand)):
+        if fila_ref is None or fila_cand is None:
+            # Un motor terminó antes que el otro
+            resultado.divergencia = Divergencia(
+                iteracion, [("terminó la corrida", fila_ref is None, fila_cand is None)],
+                fila_ref, fila_cand, anterior)
+            return resultado
+
+        if iteracion == 0:
+            presentes = tuple(c for c in CAMPOS_VERIFICADOS if valor_campo(fila_cand, c, ausente) is not ausente)
+            resultado.campos_verificados = presentes
+            resultado.campos_ausentes = tuple(c for c in CAMPOS_VERIFICADOS if c not in presentes)
+
+        diferencias = [
+            (campo, valor_campo(fila_ref, campo), valor_campo(fila_cand, campo))
+            for campo in resultado.campos_verificados
+            if not iguales(valor_campo(fila_ref, campo), valor_campo(fila_cand, campo), tolerancia)
+        ]
+        if diferencias:
+            resultado.divergencia = Divergencia(iteracion, diferencias, fila_ref, fila_cand, anterior)
+            return resultado
+
+        resultado.filas_comparadas += 1
+        anterior = fila_ref
+
+    return resultado
+
+
+def describir_valor(valor) -> str:
+    if isinstance(valor, float) and math.isfinite(valor):
+        return f"{valor!r} ({valor.hex()})"
+    return repr(valor)
+
+
+def mostrar_verificacion(resultado: ResultadoVerificacion):
+    """Imprime el resultado y, si hubo, el detalle de la primera divergencia"""
+    print(f"\n--- MOTOR: {resultado.motor} ---")
+    if resultado.campos_ausentes:
+        print(f"Campos no informados por el candidato (no verificados): {', '.join(resultado.campos_ausentes)}")
+
+    if resultado.coincide:
+        print(f"OK: {resultado.filas_comparadas} filas idénticas a la referencia "
+              f"({len(resultado.campos_verificados)} campos por fila)")
+        return
+
+    divergencia = resultado.divergencia
+    print(f"DIVERGE en la iteración {divergencia.iteracion} "
+          f"(luego de {resultado.filas_comparadas} filas idénticas)")
+    if divergencia.fila_anterior is not None:
+        print(f"Última fila coincidente: {valor_campo(divergencia.fila_anterior, 'evento_actual')} "
+              f"en {valor_campo(divergencia.fila_anterior, 'reloj')!r} min")
+    for campo, esperado, obtenido in divergencia.diferencias:
+        print(f"  {campo}:")
+        print(f"    referencia: {describir_valor(esperado)}")
+        print(f"    candidato:  {describir_valor(obtenido)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compara fila a fila la trayectoria de motores candidatos contra "
+                    "SimuladorVectorial con la misma semilla e informa la primera divergencia")
+    parser.add_argument("--motor", nargs="+", default=list(MOTORES),
+                        help=f"motores a verificar: {', '.join(MOTORES)} o 'modulo:funcion' (por defecto, todos)")
+    parser.add_argument("--config", help="archivo JSON con la ConfiguracionEjecucion base")
+    parada = parser.add_mutually_exclusive_group()
+    parada.add_argument("--horas", type=float, help="tiempo máximo simulado (horas)")
+    parada.add_argument("--iteraciones", type=int, help="iteraciones a comparar")
+    parser.add_argument("--semilla", type=int, default=1, help="semilla de ambos motores")
+    parser.add_argument("--generador", choices=["independiente", "global", "lotes"], help="fuente de números aleatorios")
+    parser.add_argument("--politica", choices=sorted(POLITICAS), help="política de asignación de canchas")
+    parser.add_argument("--canchas", type=int, help="cantidad de canchas")
+    parser.add_argument("--tolerancia", type=float, default=0.0,
+                        help="tolerancia relativa para reales (por defecto 0: bit a bit)")
+    args = parser.parse_args()
+
+    config = cargar_configuracion(args.config) if args.config else ConfiguracionEjecucion(limite_iteraciones=10000)
+    if args.horas is not None:
+        config.modo_parada, config.limite_horas = 'tiempo', args.horas
+    elif args.iteraciones is not None:
+        config.modo_parada, config.limite_iteraciones = 'iteraciones', args.iteraciones
+    config.semilla = args.semilla
+    if args.generador is not None:
+        config.generador = args.generador
+    if args.politica is not None:
+        config.politica = args.politica
+    if args.canchas is not None:
+        config.modelo = replace(config.modelo, cantidad_canchas=args.canchas)
+    config.mostrar_primeras, config.exportar_csv, config.exportar_columnar = 0, False, False
+    try:
+        config.validar()
+        motores = {nombre: cargar_motor(nombre) for nombre in args.motor}
+    except (ValueError, ImportError, AttributeError) as error:
+        parser.error(str(error))
+
+    resultados = [verificar(motor, config, nombre=nombre, tolerancia=args.tolerancia)
+                  for nombre, motor in motores.items()]
+    for resultado in resultados:
+        mostrar_verificacion(resultado)
+    sys.exit(0 if all(r.coincide for r in resultados) else 1)